@@ -0,0 +1,274 @@
+"""
+Name: 			assessment.py
+Description:
+				Assess a GEO satellite's compliance on many dates at once using array operations.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				n/a
+Outputs:
+				n/a
+"""
+
+## For each assessment date, a satellite is compared against every space network within 1.0 degree of its longitudinal position. Each eligible network is scored, the highest-scoring network decides the 'Yes' or 'No' compliance assessment, and its attributes decide the note. Here, every date in a satellite's history is handled at once: the nearby networks for all dates form one array, and the scores, best networks, and assessments are computed column by column.
+## GEO satellites often hold the same longitudinal position for long stretches, and the networks around them change status only now and then. A satellite's assessment on a date depends only on its position and the status of the networks within 1.0 degree, so its dates are first grouped into runs on which neither changes. Only one date from each run is assessed, and its assessment is copied to the rest of the run.
+## Each assessment is kept as three small numbers: its position in VERDICTS (an int8), its note's position in NOTES (an int8), and the row number of the network behind it (an int32). Arrays of these take a few bytes per date, rather than a few hundred bytes of text, and are only turned into text when they're saved or shown.
+
+import numpy as np
+import pandas as pd
+from networks import SUSPENSION_STATUSES, SUSPENSION_PARTIAL, SUSPENSION_TOTAL, longitudinal_distance, status_key
+from duediligence import DUEDILIGENCE_LEVELS
+
+# Write a list of compliance assessments, numbered by their position
+VERDICTS = ['n/a', 'Yes', 'No', 'Maybe']
+VERDICT_NA, VERDICT_YES, VERDICT_NO, VERDICT_MAYBE = 0, 1, 2, 3
+
+# Write a list of the notes that accompany each compliance assessment, numbered by their position
+NOTES = [
+	'No longitudinal position available for this date.',
+	'There exists a space network with a nominal orbital position within 1.0 degree that was brought into use before January 1, 1987, with the advance publication information for the network having been published before January 1, 1982, complying with ITU Radio Regulations Article 22, Section III (22.15 to 22.17).',
+	'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8).',
+	'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13).',
+	'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8). As of the date of assessment, the identified network is partially suspended.',
+	'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13). As of the date of assessment, the identified network is partially suspended.',
+	'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, but it has since been totally suspended.',
+	'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, but it has since been totally suspended.',
+	'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8). The identified network was previous suspended, but has since resumed operation.',
+	'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13). The identified network was previous suspended, but has since resumed operation.',
+	'There are no space networks within station-keeping requirements for which any filings have been submitted by a corresponding ITU administration.',
+	'There exists a space network within station-keeping requirements held by a corresponding ITU administration, but its filings are in their early stages: this satellite is not protected from harmful interference.',
+	'There exists a space network within station-keeping requirements held by a corresponding ITU administration that is eligible for bringing into use, but the corresponding ITU administration has not yet done so.',
+	'Although there are no space networks within station-keeping requirements for which any filings have been submitted by a corresponding ITU administration, there are also no other compliant satellites within 0.5 degrees, meaning this satellite could be in compliance with ITU Radio Regulations Article 22, Section III: 22.10 or 22.14.',
+	'n/a'
+	]
+# Write arrays of the same text, for turning whole arrays of VERDICTS and NOTES numbers into text at once
+VERDICT_TEXT = np.array(VERDICTS, dtype = object)
+NOTE_TEXT = np.array(NOTES, dtype = object)
+
+# Write a placeholder row number for assessments with no network behind them
+NO_NETWORK = -1
+
+NOTE_NO_POSITION, NOTE_GRANDFATHERED, NOTE_PLANNED, NOTE_NONPLANNED, NOTE_PLANNED_PARTIAL, NOTE_NONPLANNED_PARTIAL, NOTE_PLANNED_TOTAL, NOTE_NONPLANNED_TOTAL, NOTE_PLANNED_RESUMED, NOTE_NONPLANNED_RESUMED, NOTE_NO_NETWORKS, NOTE_EARLY_STAGE, NOTE_NOT_BROUGHT_INTO_USE, NOTE_NO_COMPLIANT_NEIGHBORS, NOTE_NA = range(len(NOTES))
+
+# Write a list of the columns of a nearby shortlist, in order
+SHORTLIST_COLUMNS = ['Network', 'ITU Administration', 'Longitude', 'Network Type', 'Filing Maturity', 'Brought into Use', 'Due Diligence Match', 'Suspended', 'Longitudinal Distance', 'Link']
+
+def position_runs(network_table, network_index, longitudes, days):
+	"""
+	Group a satellite's dates into runs on which nothing that decides its assessment changes: its longitudinal position is the same, and none of the networks within 1.0 degree change their filing maturity, bringing-into-use, or suspension status
+	@params:
+		network_table       - Required  : networks loaded with networks.load_networks() (NetworkTable)
+		network_index       - Required  : the same networks sorted by longitude (NetworkIndex)
+		longitudes          - Required  : the satellite's longitudinal position on each date, NaN if unknown (Array)
+		days                - Required  : day number of each date, from networks.day_number() (Array)
+	@returns:
+		the row numbers of the dates with a longitudinal position (Array), the run each of those dates belongs to (Array), and the row number of the first date in each run (Array)
+	"""
+	longitudes = np.asarray(longitudes, dtype = float)
+	days = np.asarray(days, dtype = np.int64)
+	positioned = np.flatnonzero(~np.isnan(longitudes))
+	# A single date is a run of its own
+	if len(positioned) <= 1:
+		return positioned, np.zeros(len(positioned), dtype = np.int64), positioned
+	unique_longitudes, positions = np.unique(longitudes[positioned], return_inverse = True)
+	candidates, distances, nearby = network_index.nearby_many(unique_longitudes, 1.0)
+	# List every day on which a network near each position changes status, keyed by the position and the day
+	position_ids = np.broadcast_to(np.arange(len(unique_longitudes))[:, np.newaxis], candidates.shape)[nearby]
+	nearby_networks = candidates[nearby]
+	change_counts = np.diff(network_table.status_offsets)[nearby_networks]
+	change_starts = np.repeat(network_table.status_offsets[nearby_networks] - (np.cumsum(change_counts) - change_counts), change_counts)
+	suspension_changes = network_table.status_days[change_starts + np.arange(change_counts.sum())]
+	change_keys = np.sort(np.concatenate([
+		status_key(position_ids, network_table.latestage_days[nearby_networks]),
+		status_key(position_ids, network_table.broughtintouse_days[nearby_networks]),
+		status_key(np.repeat(position_ids, change_counts), suspension_changes)
+		]))
+	# Count the changes up to each date; dates at the same position with the same count share a run
+	change_numbers = np.searchsorted(change_keys, status_key(positions, days[positioned]), side = 'right')
+	run_keys = positions*(len(change_keys) + 1) + change_numbers
+	_, firsts, runs = np.unique(run_keys, return_index = True, return_inverse = True)
+	return positioned, runs.reshape(-1), positioned[firsts]
+
+def assess_satellite(network_table, network_index, longitudes, days, administrations, duediligence_levels):
+	"""
+	Assess one satellite's compliance on every assessment date, without considering its neighbors
+	@params:
+		network_table       - Required  : networks loaded with networks.load_networks() (NetworkTable)
+		network_index       - Required  : the same networks sorted by longitude (NetworkIndex)
+		longitudes          - Required  : the satellite's longitudinal position on each date, NaN if unknown (Array)
+		days                - Required  : day number of each date, from networks.day_number() (Array)
+		administrations     - Required  : ITU symbols of the administrations corresponding to the satellite's operator (List)
+		duediligence_levels - Required  : the satellite's due-diligence match levels by network name (Dict)
+	@returns:
+		a VERDICTS number (Array), a NOTES number (Array), and the row number of the network behind the assessment, or NO_NETWORK (Array), for each date
+	"""
+	longitudes = np.asarray(longitudes, dtype = float)
+	days = np.asarray(days, dtype = np.int64)
+	verdicts = np.full(len(longitudes), VERDICT_NA, dtype = np.int8)
+	notes = np.full(len(longitudes), NOTE_NO_POSITION, dtype = np.int8)
+	best_networks = np.full(len(longitudes), NO_NETWORK, dtype = np.int32)
+	# Only assess the first date of each run of dates on which nothing changes
+	positioned, runs, rows = position_runs(network_table, network_index, longitudes, days)
+	if len(rows) == 0:
+		return verdicts, notes, best_networks
+	day = days[rows][:, np.newaxis]
+
+	# Find the nearby networks and their status on each date
+	candidates, distances, nearby = network_index.nearby_many(longitudes[rows], 1.0)
+	latestage = network_table.latestage_days[candidates] <= day
+	broughtintouse = network_table.broughtintouse_days[candidates] <= day
+	grandfathered = network_table.grandfathered[candidates]
+	withinrequirements = ((distances <= 0.1) & network_table.planned[candidates]) | ((distances <= 0.5) & network_table.nonplanned[candidates]) | grandfathered
+	# Only the networks held by the satellite's administrations are eligible
+	administration_networks = np.zeros(len(network_table), dtype = bool)
+	for administration in administrations:
+		administration_networks[network_table.administration_rows.get(administration, [])] = True
+	administration_match = administration_networks[candidates]
+	# Only the networks matched to the satellite score due-diligence points
+	# (Networks under different names never share a row, so every matched row can be set at once)
+	matched_rows = []
+	matched_points = []
+	for name, level in duediligence_levels.items():
+		named_rows = network_table.name_rows.get(name, [])
+		matched_rows.extend(named_rows)
+		matched_points.extend([DUEDILIGENCE_LEVELS.index(level)]*len(named_rows))
+	network_points = np.zeros(len(network_table), dtype = np.int64)
+	network_points[matched_rows] = matched_points
+	duediligence_points = network_points[candidates]
+	eligible = nearby & withinrequirements & administration_match
+
+	# Score the eligible networks, adding the terms in the same order as the original per-network loop so that ties are broken identically
+	scores = 1.0 + distances
+	scores = scores + latestage
+	scores = scores + broughtintouse
+	scores = scores + broughtintouse*duediligence_points
+	scores = np.where(eligible, scores, 0.0)
+	bestscores = scores.max(axis = 1) if scores.shape[1] > 0 else np.zeros(len(rows))
+	found = bestscores != 0
+
+	# The shortlist is sorted by longitudinal distance, the first highest score in that order names the best network, and the last shortlist entry with that name supplies its attributes
+	# When there is a single highest score under a unique name, the sorting cannot change the outcome
+	best = np.argmax(scores, axis = 1) if scores.shape[1] > 0 else np.zeros(len(rows), dtype = np.int64)
+	ties = (scores == bestscores[:, np.newaxis]).sum(axis = 1) > 1
+	names = network_table.name_ids[candidates]
+	best_names = np.take_along_axis(names, best[:, np.newaxis], axis = 1)
+	namesakes = (nearby & (names == best_names)).sum(axis = 1) > 1
+	for r in np.flatnonzero(found & (ties | namesakes)):
+		count = nearby[r].sum()
+		shortlist_order = np.argsort(distances[r, :count], kind = 'quicksort')
+		best_name = names[r, shortlist_order[np.argmax(scores[r, shortlist_order])]]
+		best[r] = shortlist_order[np.flatnonzero(names[r, shortlist_order] == best_name)[-1]]
+
+	# Collect the best network's attributes
+	best_column = best[:, np.newaxis]
+	best_rows = np.take_along_axis(candidates, best_column, axis = 1)[:, 0] if candidates.shape[1] > 0 else np.zeros(len(rows), dtype = np.int64)
+	best_latestage = np.take_along_axis(latestage, best_column, axis = 1)[:, 0] if candidates.shape[1] > 0 else np.zeros(len(rows), dtype = bool)
+	best_broughtintouse = np.take_along_axis(broughtintouse, best_column, axis = 1)[:, 0] if candidates.shape[1] > 0 else np.zeros(len(rows), dtype = bool)
+	best_grandfathered = network_table.grandfathered[best_rows]
+	best_planned = network_table.planned[best_rows]
+	best_nonplanned = network_table.nonplanned[best_rows]
+	best_latestage &= found
+	best_broughtintouse &= found
+	# Look up the best networks' suspension statuses on every date at once
+	best_suspensions = np.where(best_broughtintouse, network_table.suspension_codes(best_rows, days[rows]), 0)
+	best_totally = best_suspensions == SUSPENSION_TOTAL
+	best_partially = best_suspensions == SUSPENSION_PARTIAL
+	best_unsuspended = ~best_totally & ~best_partially
+
+	# Evaluate compliance
+	verdicts[rows] = np.where(best_broughtintouse & ~best_totally, VERDICT_YES, VERDICT_NO)
+	notes[rows] = np.select(
+		[
+			best_broughtintouse & best_unsuspended & best_grandfathered,
+			best_broughtintouse & best_unsuspended & best_planned,
+			best_broughtintouse & best_unsuspended & best_nonplanned,
+			best_broughtintouse & best_partially & best_planned,
+			best_broughtintouse & best_partially & best_nonplanned,
+			best_broughtintouse & best_totally & best_planned,
+			best_broughtintouse & best_totally & best_nonplanned,
+			best_broughtintouse,
+			best_latestage,
+			found
+		],
+		[NOTE_GRANDFATHERED, NOTE_PLANNED, NOTE_NONPLANNED, NOTE_PLANNED_PARTIAL, NOTE_NONPLANNED_PARTIAL, NOTE_PLANNED_TOTAL, NOTE_NONPLANNED_TOTAL, NOTE_NA, NOTE_NOT_BROUGHT_INTO_USE, NOTE_EARLY_STAGE],
+		default = NOTE_NO_NETWORKS)
+	best_networks[rows] = np.where(found, best_rows, NO_NETWORK)
+
+	# Copy each run's assessment to the rest of its dates
+	verdicts[positioned] = verdicts[rows][runs]
+	notes[positioned] = notes[rows][runs]
+	best_networks[positioned] = best_networks[rows][runs]
+	return verdicts, notes, best_networks
+
+def find_compliant_neighbors(longitudes, compliant, tolerance = 0.5):
+	"""
+	Check which satellites have another compliant satellite within a given number of degrees on the same date
+	@params:
+		longitudes  - Required  : each satellite's longitudinal position, NaN if unknown (Array)
+		compliant   - Required  : whether each satellite's compliance assessment is 'Yes' (Array)
+		tolerance   - Optional  : maximum longitudinal distance in degrees (Float)
+	@returns:
+		whether each satellite has a compliant neighbor (Array)
+	"""
+	longitudes = np.asarray(longitudes, dtype = float)
+	has_neighbor = np.zeros(len(longitudes), dtype = bool)
+	positioned = np.flatnonzero(~np.isnan(longitudes))
+	# Sweep through the satellites in order of longitude: a satellite's closest compliant neighbors are the nearest compliant satellites before and after it, wrapping around the 180-degree meridian
+	order = positioned[np.argsort(longitudes[positioned], kind = 'stable')]
+	sorted_longitudes = longitudes[order]
+	compliant_positions = np.flatnonzero(np.asarray(compliant, dtype = bool)[order])
+	if len(compliant_positions) == 0:
+		return has_neighbor
+	positions = np.arange(len(order))
+	previous_compliant = compliant_positions[(np.searchsorted(compliant_positions, positions, side = 'left') - 1) % len(compliant_positions)]
+	next_compliant = compliant_positions[np.searchsorted(compliant_positions, positions, side = 'right') % len(compliant_positions)]
+	# A satellite can't be its own neighbor
+	near_previous = (previous_compliant != positions) & (longitudinal_distance(sorted_longitudes[previous_compliant], sorted_longitudes) <= tolerance)
+	near_next = (next_compliant != positions) & (longitudinal_distance(sorted_longitudes[next_compliant], sorted_longitudes) <= tolerance)
+	has_neighbor[order] = near_previous | near_next
+	return has_neighbor
+
+def nearby_shortlist_columns(network_table, network_index, longitude, day, duediligence_levels, countries_dictionary):
+	"""
+	Make the shortlist of space networks within 1.0 degree of a satellite on one date, as plain columns
+	@params:
+		network_table        - Required  : networks loaded with networks.load_networks() (NetworkTable)
+		network_index        - Required  : the same networks sorted by longitude (NetworkIndex)
+		longitude            - Required  : the satellite's longitudinal position (Float)
+		day                  - Required  : day number of the date of assessment (Int)
+		duediligence_levels  - Required  : the satellite's due-diligence match levels by network name (Dict)
+		countries_dictionary - Required  : ITU country designations by ITU symbol (Dict)
+	@returns:
+		the shortlisted networks' row numbers in the networks table (Array) and their longitudinal distances (Array), sorted by longitudinal distance, and the shortlist's columns in the same order, keyed by SHORTLIST_COLUMNS (Dict)
+	"""
+	nearby_networks, nearby_distances = network_index.nearby(longitude, 1.0)
+	# Sort by longitudinal distance the same way pandas' sort_values does, so that ties keep the same order
+	order = np.argsort(nearby_distances, kind = 'quicksort')
+	networks = nearby_networks[order]
+	distances = nearby_distances[order]
+	latestage = network_table.latestage_days[networks] <= day
+	broughtintouse = network_table.broughtintouse_days[networks] <= day
+	names = [network_table.names[j] for j in networks]
+	shortlist = {
+		'Network': names,
+		'ITU Administration': [countries_dictionary[network_table.administrations[j]] for j in networks],
+		'Longitude': [str(-1*network_table.longitudes[j]) + u'\N{DEGREE SIGN}' + 'W' if network_table.longitudes[j] < 0 else str(network_table.longitudes[j]) + u'\N{DEGREE SIGN}' + 'E' for j in networks],
+		'Network Type': [network_table.network_types[j] for j in networks],
+		'Filing Maturity': ['Late-Stage' if late else 'Early-Stage' for late in latestage],
+		'Brought into Use': ['Yes' if inuse else 'No' for inuse in broughtintouse],
+		'Due Diligence Match': [duediligence_levels.get(name, 'No' if late else 'n/a') for name, late in zip(names, latestage)],
+		'Suspended': [SUSPENSION_STATUSES[code] for code in network_table.suspension_codes(networks, np.full(len(networks), day)).tolist()],
+		# Round the longitudinal distances to two decimal places and add a degree symbol
+		'Longitudinal Distance': [f'{distance:.2f}°' for distance in np.round(distances, 2)],
+		'Link': [network_table.links[j] for j in networks]
+		}
+	return networks, distances, shortlist
+
+# Write a quick function for turning a shortlist's columns into a DataFrame, only when it's time to save or show it
+def shortlist_frame(shortlist, columns = SHORTLIST_COLUMNS):
+	return pd.DataFrame({column: shortlist[column] for column in columns}, columns = columns)
+
+# Write a quick function for making the shortlist of space networks within 1.0 degree of a satellite on one date, as a DataFrame sorted by longitudinal distance
+def nearby_shortlist(network_table, network_index, longitude, day, duediligence_levels, countries_dictionary):
+	return shortlist_frame(nearby_shortlist_columns(network_table, network_index, longitude, day, duediligence_levels, countries_dictionary)[2])
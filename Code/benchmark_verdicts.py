@@ -0,0 +1,53 @@
+"""
+Name: 			benchmark_verdicts.py
+Description:
+				Times compliance_historical.py with and without --verdicts-only, to show how much time making nearby shortlists takes.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/Historical Analysis/[YYYYMMDD]/longitudes_[YYYYMMDD].csv
+Outputs:
+				n/a
+"""
+
+## Each mode is run a few times, one after another, and the fastest run of each is reported, since the fastest run is the one least disturbed by anything else happening on the computer. Each run re-does the whole assessment, including loading the networks and reference files, so the times are what running the script by hand would take.
+## The script refuses to start without a longitudes file for the assessment date, since compliance_historical.py would otherwise stop straight away and its times would mean nothing.
+## compliance_historical.py overwrites its results each time it runs. The full mode is run last, so the assessment date's sub-directory is left holding a complete set of results, shortlists included.
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# Choose how many times to run each mode, and on which assessment date's longitudes file
+parser = argparse.ArgumentParser(description = 'Time compliance_historical.py with and without --verdicts-only.')
+parser.add_argument('--date', default = '20230809', help = 'assessment date whose sub-directory holds the longitudes file, as YYYYMMDD (default: 20230809, as in compliance_historical.py)')
+parser.add_argument('--repeats', type = int, default = 3, help = 'number of times to run each mode (default: 3)')
+parser.add_argument('--workers', type = int, default = 1, help = 'number of processes for compliance_historical.py to use (default: 1)')
+args = parser.parse_args()
+
+# Check to see if a longitudes file has been put in the right sub-directory
+file_path = os.path.join('../Data/Historical Analysis/' + args.date, 'longitudes_' + args.date + '.csv')
+if not os.path.exists(file_path):
+	print('A correctly named longitude file hasn\'t been added to the assessment date\'s sub-directory (' + file_path + '). Please add it and run this script again.')
+	sys.exit(1)
+
+# Write a quick function for timing one run of compliance_historical.py
+def time_run(options):
+	start = time.perf_counter()
+	subprocess.run([sys.executable, 'compliance_historical.py', '--date', args.date, '--workers', str(args.workers)] + options, check = True, stdout = subprocess.DEVNULL)
+	return time.perf_counter() - start
+
+timings = {}
+for mode, options in [('Verdicts only', ['--verdicts-only']), ('Full', [])]:
+	timings[mode] = []
+	for repeat in range(args.repeats):
+		timings[mode].append(time_run(options))
+		print(mode, 'run', repeat + 1, 'of', args.repeats, 'took', f'{timings[mode][-1]:.2f}', 's')
+best_verdictsonly = min(timings['Verdicts only'])
+best_full = min(timings['Full'])
+print('Full mode:', f'{best_full:.2f}', 's')
+print('Verdicts-only mode:', f'{best_verdictsonly:.2f}', 's')
+print('Speedup:', f'{best_full/best_verdictsonly:.1f}', 'x')
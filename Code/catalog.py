@@ -0,0 +1,40 @@
+"""
+Name: 			catalog.py
+Description:
+				Shared helpers for looking up satellites in the local satellite catalog by their NORAD IDs.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/Reference Files/satellitecatalog.csv
+Outputs:
+				n/a
+"""
+
+## Each script needs a few details about every satellite it assesses or plots: which country it belongs to, its name, and when it launched. Rather than scanning the whole catalog for each satellite (or re-reading the file), the catalog is read once into a dictionary keyed by NORAD ID.
+## The catalog's launch dates only give two-digit years, which Python reads as 2000-2068 for '00'-'68'. Any launch date read as later than today is moved back a century when the catalog is read, so every script sees the same launch dates. (The scripts used to move back any date later than 2022, which sent satellites launched since then back to the 1920s.)
+
+import csv
+from collections import namedtuple
+from datetime import datetime
+
+# Write a record of one satellite's catalog entry
+CatalogEntry = namedtuple('CatalogEntry', ['cospar', 'norad', 'name', 'country', 'launch_date'])
+
+# Write a quick function for reading the catalog's two-digit-year launch dates, e.g. '2/14/63'
+def read_launch_date(text):
+	launch_date = datetime.strptime(text.strip(), '%m/%d/%y')
+	if launch_date > datetime.today():
+		launch_date = launch_date.replace(year = launch_date.year - 100)
+	return launch_date
+
+# Write a quick function for reading the catalog as a dictionary of entries keyed by NORAD ID (as a string)
+def read_satellite_catalog(file_path = '../Data/Reference Files/satellitecatalog.csv'):
+	satellite_catalog = {}
+	with open(file_path) as f:
+		reader = csv.reader(f, delimiter = ",")
+		for row in reader:
+			if row[0].strip() != 'COSPAR':
+				# When a satellite is listed more than once, the last entry in the file is kept
+				satellite_catalog[row[1].strip()] = CatalogEntry(row[0], row[1].strip(), row[2], row[3], read_launch_date(row[4]))
+	return satellite_catalog
@@ -0,0 +1,209 @@
+"""
+Name: 			compliance_engine.py
+Description:
+				Loads the networks and reference files once and answers compliance assessments for any satellite, longitudinal position, and date.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/[YYYYMMDD]/networks_[YYYYMMDD].csv
+				../Data/Reference Files/ITUcountries.csv
+				../Data/Reference Files/SpaceTrackcountries.csv
+				../Data/Reference Files/satellitecatalog.csv
+				../Data/Reference Files/Due Diligence Matches/[YYYYMMDD]/[satcat].csv or ../Data/Reference Files/Due Diligence Matches/[YYYYMMDD].npy
+Outputs:
+				n/a
+"""
+
+## compliance_daily.py and compliance_historical.py used to load every networks and reference file themselves, at the top of the script, so every run paid for the loading again and nothing could be reused from another script. A ComplianceEngine loads them once; the two scripts are now thin wrappers around one, and a long-running process (e.g. a notebook, or a service answering queries) can keep one around and assess as many satellites, positions, and dates as it likes.
+## Assessments come back as the numbers used throughout assessment.py (VERDICTS, NOTES, and rows of the networks table), and are only turned into text when asked, so that many of them can be kept in NumPy arrays.
+
+import csv
+import functools
+import os
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from networks import NetworkIndex, load_networks, latest_networks_file, day_number
+from assessment import VERDICTS, NOTES, NO_NETWORK, VERDICT_YES, VERDICT_NO, VERDICT_MAYBE, NOTE_NO_COMPLIANT_NEIGHBORS, assess_satellite, find_compliant_neighbors, nearby_shortlist_columns, position_runs
+from duediligence import DueDiligenceStore
+from catalog import read_satellite_catalog
+
+class UnknownSatellite(KeyError):
+	"""
+	Raised when a satellite being assessed has no entry in the satellite catalog
+	"""
+	def __init__(self, norad_id):
+		super().__init__(str(norad_id))
+		self.norad_id = str(norad_id)
+
+# Write a record of one compliance assessment, as text
+Assessment = namedtuple('Assessment', ['verdict', 'note', 'network'])
+
+# Write a quick function for reading the dictionary that converts ITU country symbols to designations
+def read_itu_countries(file_path = '../Data/Reference Files/ITUcountries.csv'):
+	countries_dictionary = {}
+	with open(file_path) as f:
+		for k, v in csv.reader(f):
+			countries_dictionary[k] = v
+	return countries_dictionary
+
+# Write a quick function for reading the dictionary that maps SpaceTrack country names to lists of ITU symbols, or ['n/a'] if there are none
+def read_spacetrack_countries(file_path = '../Data/Reference Files/SpaceTrackcountries.csv'):
+	spacetrack_countries = {}
+	with open(file_path) as f:
+		for row in csv.reader(f, delimiter = ','):
+			if row[0] != 'SpaceTrack Abbreviation':
+				spacetrack_countries[row[0]] = [symbol for symbol in row[1:32] if symbol != ''] or ['n/a']
+	return spacetrack_countries
+
+# Write a quick function for converting dates (datetimes, 'YYYY-MM-DD' strings, or 'YYYYMMDD' strings) to day numbers, remembering the dates already seen
+@functools.lru_cache(maxsize = 4096)
+def assessment_day(date):
+	return day_number(pd.Timestamp(date).strftime('%Y-%m-%d'))
+
+# Write a quick function for converting a list of dates, all written the same way, to day numbers at once
+def assessment_days(dates):
+	return pd.to_datetime(pd.Series(dates)).to_numpy().astype('datetime64[D]').astype(np.int64)
+
+class ComplianceEngine:
+	"""
+	Assesses satellites' compliance against one set of networks and reference files, loaded once
+	@params:
+		networks_file           - Optional  : networks file produced by snl.py, or None for the most recent one in snl_directory (Str)
+		snl_directory           - Optional  : directory holding one sub-directory of networks per date, named YYYYMMDD (Str)
+		reference_directory     - Optional  : directory holding the country dictionaries, satellite catalog, and due-diligence matches (Str)
+	"""
+	def __init__(self, networks_file = None, snl_directory = '../Data/SNL Downloads/', reference_directory = '../Data/Reference Files/'):
+		if networks_file is None:
+			networks_file = latest_networks_file(snl_directory)
+		self.networks_file = networks_file
+		self.network_table = load_networks(networks_file)
+		# Sort the networks by longitude so nearby networks can be found without scanning the whole list
+		self.network_index = NetworkIndex(self.network_table.longitudes)
+		self.countries_dictionary = read_itu_countries(os.path.join(reference_directory, 'ITUcountries.csv'))
+		self.spacetrack_countries = read_spacetrack_countries(os.path.join(reference_directory, 'SpaceTrackcountries.csv'))
+		self.satellite_catalog = read_satellite_catalog(os.path.join(reference_directory, 'satellitecatalog.csv'))
+		self.duediligence_store = DueDiligenceStore(os.path.join(reference_directory, 'Due Diligence Matches/'))
+
+	def administrations(self, norad_id):
+		"""
+		Look up the ITU administrations that correspond to a satellite's operator
+		@params:
+			norad_id    - Required  : the satellite's NORAD ID (Str or Int)
+		@returns:
+			the administrations' ITU symbols (List)
+		"""
+		catalog_entry = self.satellite_catalog.get(str(norad_id))
+		if catalog_entry is None:
+			raise UnknownSatellite(norad_id)
+		return self.spacetrack_countries[catalog_entry.country]
+
+	def network_name(self, network):
+		"""
+		Look up the name of a network behind an assessment
+		@params:
+			network     - Required  : the network's row number in the networks table, or NO_NETWORK for none (Int)
+		@returns:
+			the network's name, or None (Str)
+		"""
+		return self.network_table.names[network] if network != NO_NETWORK else None
+
+	def assess_history(self, norad_id, longitudes, dates):
+		"""
+		Assess one satellite's compliance on many dates at once, without considering its neighbors
+		@params:
+			norad_id    - Required  : the satellite's NORAD ID (Str or Int)
+			longitudes  - Required  : the satellite's longitudinal position on each date, NaN if unknown (Array)
+			dates       - Required  : the dates (List) or their day numbers, from networks.day_number() (Array)
+		@returns:
+			a VERDICTS number (Array), a NOTES number (Array), and the row number of the network behind the assessment, or NO_NETWORK (Array), for each date
+		"""
+		longitudes = np.asarray(longitudes, dtype = float)
+		days = np.asarray(dates)
+		if not np.issubdtype(days.dtype, np.integer):
+			days = assessment_days(dates)
+		# Only satellites with at least one longitudinal position need their reference data
+		if np.isnan(longitudes).all():
+			return assess_satellite(self.network_table, self.network_index, longitudes, days, [], {})
+		return assess_satellite(self.network_table, self.network_index, longitudes, days, self.administrations(norad_id), self.duediligence_store.levels(norad_id))
+
+	def check_neighbors(self, longitudes, verdicts, notes):
+		"""
+		Change the 'No' compliance assessments of satellites with no compliant satellites within 0.5 degrees to 'Maybe', in place
+		@params:
+			longitudes  - Required  : every satellite's longitudinal position on one date, NaN if unknown (Array)
+			verdicts    - Required  : every satellite's VERDICTS number on that date (Array)
+			notes       - Required  : every satellite's NOTES number on that date (Array)
+		"""
+		no_compliant_neighbors = (verdicts == VERDICT_NO) & ~find_compliant_neighbors(longitudes, verdicts == VERDICT_YES, 0.5)
+		verdicts[no_compliant_neighbors] = VERDICT_MAYBE
+		notes[no_compliant_neighbors] = NOTE_NO_COMPLIANT_NEIGHBORS
+
+	def assess_batch(self, norad_ids, longitudes, date, neighbors = True):
+		"""
+		Assess many satellites' compliance on one date
+		@params:
+			norad_ids   - Required  : the satellites' NORAD IDs (List)
+			longitudes  - Required  : each satellite's longitudinal position, NaN if unknown (List)
+			date        - Required  : date of assessment (Str or Datetime)
+			neighbors   - Optional  : whether to compare the satellites with each other, turning 'No' into 'Maybe' when no other satellite within 0.5 degrees is compliant (Bool)
+		@returns:
+			a VERDICTS number (Array), a NOTES number (Array), and the row number of the network behind the assessment, or NO_NETWORK (Array), for each satellite
+		"""
+		longitudes = np.asarray(longitudes, dtype = float)
+		days = np.array([assessment_day(date)], dtype = np.int64)
+		verdicts = np.zeros(len(longitudes), dtype = np.int8)
+		notes = np.zeros(len(longitudes), dtype = np.int8)
+		best_networks = np.zeros(len(longitudes), dtype = np.int32)
+		for i, (norad_id, longitude) in enumerate(zip(norad_ids, longitudes)):
+			satellite_verdicts, satellite_notes, satellite_best_networks = self.assess_history(norad_id, longitudes[i:i+1], days)
+			verdicts[i], notes[i], best_networks[i] = satellite_verdicts[0], satellite_notes[0], satellite_best_networks[0]
+		if neighbors:
+			self.check_neighbors(longitudes, verdicts, notes)
+		return verdicts, notes, best_networks
+
+	def assess(self, norad_id, longitude, date):
+		"""
+		Assess one satellite's compliance at one longitudinal position on one date, without considering its neighbors
+		@params:
+			norad_id    - Required  : the satellite's NORAD ID (Str or Int)
+			longitude   - Required  : the satellite's longitudinal position (Float)
+			date        - Required  : date of assessment (Str or Datetime)
+		@returns:
+			the 'n/a', 'Yes', or 'No' compliance assessment, its note, and the name of the network behind it, or None (Assessment)
+		"""
+		verdicts, notes, best_networks = self.assess_batch([norad_id], [longitude], date, neighbors = False)
+		return Assessment(VERDICTS[verdicts[0]], NOTES[notes[0]], self.network_name(best_networks[0]))
+
+	def shortlist(self, norad_id, longitude, date):
+		"""
+		Make the shortlist of space networks within 1.0 degree of a satellite on one date
+		@params:
+			norad_id    - Required  : the satellite's NORAD ID (Str or Int)
+			longitude   - Required  : the satellite's longitudinal position (Float)
+			date        - Required  : date of assessment (Str or Datetime)
+		@returns:
+			the shortlist's columns, sorted by longitudinal distance, keyed by assessment.SHORTLIST_COLUMNS (Dict)
+		"""
+		return nearby_shortlist_columns(self.network_table, self.network_index, float(longitude), assessment_day(date), self.duediligence_store.levels(norad_id), self.countries_dictionary)[2]
+
+	def shortlist_history(self, norad_id, longitudes, dates):
+		"""
+		Make one satellite's shortlists of space networks within 1.0 degree on every date with a longitudinal position
+		@params:
+			norad_id    - Required  : the satellite's NORAD ID (Str or Int)
+			longitudes  - Required  : the satellite's longitudinal position on each date, NaN if unknown (Array)
+			dates       - Required  : the dates (List)
+		@returns:
+			the date and shortlist columns of each date with a longitudinal position, in order (List)
+		"""
+		longitudes = np.asarray(longitudes, dtype = float)
+		if np.isnan(longitudes).all():
+			return []
+		days = assessment_days(dates)
+		duediligence_levels = self.duediligence_store.levels(norad_id)
+		# Dates in the same run share a position and nearby networks' statuses, so they share a shortlist too
+		positioned, runs, firsts = position_runs(self.network_table, self.network_index, longitudes, days)
+		run_shortlists = [nearby_shortlist_columns(self.network_table, self.network_index, longitudes[m], days[m], duediligence_levels, self.countries_dictionary)[2] for m in firsts]
+		return [(dates[m], run_shortlists[run]) for m, run in zip(positioned, runs)]
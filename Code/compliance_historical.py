@@ -10,17 +10,27 @@ Inputs:
 				../Data/Historical Analysis/[YYYYMMDD]/networks_historical_[YYYYMMDD].csv
 Outputs:	
 				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_[satcat]_[YYYYMMDD].csv
-				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/[YYYYMMDD]/nearbyshortlist_[satcat]_[YYYYMMDD].csv
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_[YYYYMMDD].csv (with --matrix)
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_long_[YYYYMMDD].parquet or .csv (with --long)
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_codes_[YYYYMMDD].csv (with --long)
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/shortlists_[YYYYMMDD].sqlite
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/[YYYYMMDD]/nearbyshortlist_[satcat]_[YYYYMMDD].csv (with --shortlist-files)
 """
 
 ## This script issues a compliance rating for GEO satellites given their NORAD ID and longitudinal position. A shortlist of nearby filings is also produced for each GEO satellite.
 
 import numpy as np
-import csv
 from datetime import datetime
 import pandas as pd
 import os
 import sys
+import argparse
+import multiprocessing
+import shutil
+from networks import day_number
+from compliance_engine import ComplianceEngine
+from shortlists import ShortlistStore
+from results import SATELLITE_RESULTS_COLUMNS, write_satellite_results, write_results_matrix, finish_results, checkpoint_source, write_checkpoint, read_checkpoint, write_result_codes, LongResultsWriter
 
 # Choose a date to run the assessment
 assessmentdate = datetime.today().strftime('%Y%m%d')
@@ -28,6 +38,23 @@ assessmentdate = datetime.today().strftime('%Y%m%d')
 # Since this script may take more 24 hours to run, consider hardcoding the assessment date
 assessmentdate = '20230809'
 
+# Choose how many processes to spread the satellites across
+parser = argparse.ArgumentParser(description = 'Check whether GEO satellites\' historical positions match any filed ITU space networks.')
+parser.add_argument('--date', default = assessmentdate, help = 'assessment date whose sub-directory holds the longitudes file, as YYYYMMDD (default: ' + assessmentdate + ')')
+parser.add_argument('--resume', action = 'store_true', help = 'carry on from where an interrupted run of the same assessment date left off, instead of starting again')
+parser.add_argument('--workers', type = int, default = 1, help = 'number of processes to assess satellites in parallel (default: 1)')
+parser.add_argument('--shortlist-files', action = 'store_true', help = 'also write each nearby shortlist to its own CSV file, in one sub-directory per date')
+parser.add_argument('--verdicts-only', action = 'store_true', help = 'only assess compliance, without making nearby shortlists')
+parser.add_argument('--matrix', action = 'store_true', help = 'also save every satellite\'s compliance assessments in one file, with one row per date and one column per satellite')
+parser.add_argument('--long', action = 'store_true', help = 'also save every satellite\'s compliance assessments in one long table, with one row per satellite per date, as a Parquet file if pyarrow is installed or a CSV file otherwise')
+parser.add_argument('--block-size', type = int, help = 'read and assess the longitudes file this many dates at a time, saving each block\'s results before reading the next, so memory use doesn\'t grow with the assessment period')
+args = parser.parse_args()
+if (args.block_size is not None and args.resume):
+	parser.error('--resume can\'t be combined with --block-size, since satellites are only checkpointed when every date is assessed at once')
+if (args.block_size is not None and args.block_size < 1):
+	parser.error('--block-size must be at least 1')
+assessmentdate = args.date
+
 # Write a quick function for cleaning directories
 def remove_files_except(filename, directory):
 	entries = os.listdir(directory)
@@ -47,8 +74,8 @@ CHECK_FOLDER = os.path.isdir(MYDIR)
 # If it doesn't exist, then create it 
 if not CHECK_FOLDER:
 	os.makedirs(MYDIR)
-# If it does exist, clear everything (to avoid duplicates) except the historical longitudes file
-else:
+# If it does exist, clear everything (to avoid duplicates) except the historical longitudes file, unless carrying on from an interrupted run
+elif not args.resume:
 	remove_files_except('longitudes_' + assessmentdate + '.csv', MYDIR)
 # Add another sub-directory to house the historical nearby shortlists
 MYDIR = ('../Data/Historical Analysis/' + assessmentdate + '/Historical Nearby Shortlists')
@@ -57,7 +84,7 @@ CHECK_FOLDER = os.path.isdir(MYDIR)
 if not CHECK_FOLDER:
 	os.makedirs(MYDIR)
 # If it does exist, clear it (to avoid duplicates) and run the scrape scripts.
-else:
+elif not args.resume:
 	for f in os.listdir(MYDIR):
 		os.remove(os.path.join(MYDIR, f))
 # Add another sub-directory to house the compliance assessment results
@@ -67,81 +94,18 @@ CHECK_FOLDER = os.path.isdir(MYDIR)
 if not CHECK_FOLDER:
 	os.makedirs(MYDIR)
 # If it does exist, clear it (to avoid duplicates) and run the scrape scripts.
-else:
+elif not args.resume:
 	for f in os.listdir(MYDIR):
 		os.remove(os.path.join(MYDIR, f))
+# Add another sub-directory to house each satellite's assessment as soon as it's finished, so an interrupted run can carry on
+checkpoint_directory = '../Data/Historical Analysis/' + assessmentdate + '/Checkpoints'
+os.makedirs(checkpoint_directory, exist_ok = True)
 
 ## Import relevant data
-# Import the most recent list of networks created using snl.py
-historicalanalysis_directories_names = next(os.walk('../Data/SNL Downloads/'))[1]
-try:
-	historicalanalysis_directories_names.remove('Archives')
-except ValueError:
-	pass
-historicalanalysis_directories_datetimes = [datetime.strptime(i, '%Y%m%d') for i in historicalanalysis_directories_names]
-historicalanalysis_directory = historicalanalysis_directories_names[historicalanalysis_directories_datetimes.index(max(historicalanalysis_directories_datetimes))]
-df_licenses = pd.read_csv('../Data/SNL Downloads/' + historicalanalysis_directory + '/networks_' + historicalanalysis_directory + '.csv')
-# Import a dictionary to convert ITU country symbols to designations
-reader = csv.reader(open('../Data/Reference Files/ITUcountries.csv', 'r'))
-countries_dictionary = {}
-for row in reader:
-   k, v = row
-   countries_dictionary[k] = v
-# Write a dictionary for the full names of filings type
-filings_dictionary = {
-	'A' 			: 'Advance Public Information (A)',
-	'C'   			: 'Coordination Request (C)',
-	'N'				: 'Notification of Space Station (N)',
-	'U'				: 'Due Diligence (U)',
-	'P'  			: 'Planned (P)',
-	'P/Plan/List' 	: 'Planned (P/Plan/List)'
-	}
-
-# Write a maturity rank order of the various filings types 
-filings_rankorder = ['Advance Public Information (A)', 'Planned (P/Plan/List)', 'Planned (P)', 'Coordination Request (C)', 'Notification of Space Station (N)', 'Due Diligence (U)']
-# Import local launch history database as lists
-locallaunchdatabase_cospar_list = []
-locallaunchdatabase_norad_list = []
-locallaunchdatabase_satname_list = []
-locallaunchdatabase_country_list = []
-locallaunchdatabase_launchdate_list = []
-with open("../Data/Reference Files/satellitecatalog.csv") as f:
-	reader = csv.reader(f, delimiter=",")
-	for row in reader:
-		if row[0] != 'COSPAR':
-			locallaunchdatabase_cospar_list.append(row[0])
-			locallaunchdatabase_norad_list.append(row[1])
-			locallaunchdatabase_satname_list.append(row[2])
-			locallaunchdatabase_country_list.append(row[3])
-			launchdate_datetime = datetime.strptime(row[4], '%m/%d/%y')
-			if launchdate_datetime.year > 2022: 
-				launchdate_datetime2 = launchdate_datetime.replace(year = launchdate_datetime.year-100)
-			else:
-				launchdate_datetime2 = launchdate_datetime
-			locallaunchdatabase_launchdate_list.append(launchdate_datetime2)
-# Create a dictionary for mapping SpaceTrack country names to ITU symbols
-SpaceTrackcountries_list = []
-ITUcountrycodes_list = []
-with open("../Data/Reference Files/SpaceTrackcountries.csv") as f:
-	reader = csv.reader(f, delimiter=",")
-	for row in reader:
-		if row[0] != "SpaceTrack Abbreviation":
-			SpaceTrackcountries_list.append(row[0])
-			row_list = [row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9], row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27], row[28], row[29], row[30], row[31]]
-			while('' in row_list):
-				row_list.remove('')
-			if len(row_list) == 0:
-				row_list = ['n/a']
-			ITUcountrycodes_list.append(row_list)
-SpaceTrackcountries_dict = {SpaceTrackcountries_list[i]: ITUcountrycodes_list[i] for i in range(len(SpaceTrackcountries_list))}
-# Create a dictionary to map compliance grades to the 4.0 grade point. 
-grades_dictionary = {
-	4  : 'A',
-	3  : 'B',
-	2  : 'C',
-	1  : 'D',
-	0  : 'F'
-	}
+# Load the most recent list of networks created using snl.py, and the reference files, once
+engine = ComplianceEngine()
+# Note which networks and due-diligence match data this run uses, so an interrupted run's checkpoints are only reused if they were made from the same ones
+source = checkpoint_source(engine.networks_file, engine.duediligence_store.directory)
 
 ## A quick function for making a progress bar in the console
 def printProgressBar (iteration, total, prefix = '', suffix = '', decimals = 1, length = 100, fill = '█', printEnd = "\r"):
@@ -171,253 +135,110 @@ if os.path.exists(file_path):
 	pass
 else:
 	print('A correctly named longitude file hasn\'t been added to the assessment dates\'s sub-directory. Please add it and run this script again.')
-	sys.exit()
+	sys.exit(1)
 
-# Make a pandas dataframe to house the assessment results
-df_longitudes = pd.read_csv('../Data/Historical Analysis/' + assessmentdate + '/longitudes_' + assessmentdate + '.csv')
-df_results_batched = df_longitudes.copy()
+# Import the list of GEO satellites from the longitudes file's column headers; their longitudinal positions are read below, either all at once or a block of dates at a time
+satcats = list(pd.read_csv(file_path, nrows = 0).columns.values)[1:]
+results_directory = '../Data/Historical Analysis/' + assessmentdate + '/Historical Compliance Assessments/'
+results_files = [results_directory + 'compliance_' + str(satcat) + '_' + assessmentdate + '.csv' for satcat in satcats]
+matrix_file = results_directory + 'compliance_' + assessmentdate + '.csv'
 
-# Import the lists of GEO satellites and the historical dates for assessment
-satcats = list(df_longitudes.columns.values)[1:]
-dates = []
-for i in np.arange(len(df_longitudes)):
-	dates.append(df_longitudes.at[i, 'Date'])
-
-compliance_assessments = []
-notes = []
-# For each satellite, at each of it's longitudinal positions 
-for i in np.arange(len(satcats)):
+# Write a function that assesses all of one satellite's longitudinal positions in the dates read so far at once and makes its nearby shortlists
+# When running in parallel, each process inherits the engine loaded above and the dates read so far instead of receiving its own copy
+def assess_historical_satellite(i):
 	satcat = str(satcats[i])
 	print('Evaluating historical compliance for Satellite #'+str(satcat)+' ...')
-	for m in np.arange(len(df_longitudes)):
-		eval_date = datetime.strptime(dates[m], '%Y-%m-%d')
-		# eval_date = datetime.strptime(dates[m], '%m/%d/%y')
-		# Create a subdirectory to house the nearby shortlists for this date, if it doesn't exist already
-		MYDIR = ('../Data/Historical Analysis/' + assessmentdate + '/Historical Nearby Shortlists/' + eval_date.strftime('%Y%m%d'))
-		CHECK_FOLDER = os.path.isdir(MYDIR)
-		# If it doesn't exist, then create it and run the scrape scripts.
-		if not CHECK_FOLDER:
-			os.makedirs(MYDIR)
-		df_results_batched.at[m, satcat] = 'TBD'
-		longitude = df_longitudes.at[m, satcat]
-		if np.isnan(longitude):
-			df_results_batched.at[m, satcat] = 'n/a. No longitudinal position available for this date.'
+	satellite_verdicts, satellite_notes, satellite_best_networks = engine.assess_history(satcat, longitudes_matrix[:, i], eval_days)
+	# Make a shortlist of nearby networks for each date, to be saved by the main process
+	shortlists = [] if args.verdicts_only else engine.shortlist_history(satcat, longitudes_matrix[:, i], dates)
+	return i, satellite_verdicts, satellite_notes, satellite_best_networks, shortlists
+
+# Write a function that assesses a list of satellites, either one after another or spread across a pool of processes
+def assess_satellites(indices):
+	if args.workers > 1:
+		# Leaving the with block stops the pool's processes, even if the satellites' results stop being read partway through (e.g. an error, or Ctrl+C)
+		with multiprocessing.get_context('fork').Pool(args.workers) as pool:
+			yield from pool.imap_unordered(assess_historical_satellite, indices, chunksize = max(1, len(indices)//(args.workers*4)))
+			pool.close()
+			pool.join()
+	else:
+		yield from map(assess_historical_satellite, indices)
+
+# Keep every nearby shortlist in one file
+if not args.verdicts_only:
+	shortlist_store = ShortlistStore('../Data/Historical Analysis/' + assessmentdate + '/Historical Nearby Shortlists/shortlists_' + assessmentdate + '.sqlite')
+# Keep every satellite's assessments in one long table too, if asked
+if args.long:
+	long_results = LongResultsWriter(results_directory + 'compliance_long_' + assessmentdate, engine.network_table)
+	write_result_codes(results_directory + 'compliance_codes_' + assessmentdate + '.csv')
+# Read the longitudinal positions on every date at once, or a block of dates at a time
+if args.block_size is None:
+	blocks = [pd.read_csv(file_path)]
+else:
+	blocks = pd.read_csv(file_path, chunksize = args.block_size)
+for block, df_longitudes in enumerate(blocks):
+	dates = df_longitudes['Date'].tolist()
+	eval_days = np.array([day_number(date) for date in dates])
+	longitudes_matrix = df_longitudes[satcats].to_numpy(dtype = float)
+	if (args.block_size is not None and len(dates) > 0):
+		print('Evaluating historical compliance from', dates[0], 'to', dates[-1], '...')
+
+	# Make arrays to house the assessment results, with one row per date and one column per satellite
+	verdicts = np.zeros(longitudes_matrix.shape, dtype = np.int8)
+	notes = np.zeros(longitudes_matrix.shape, dtype = np.int8)
+	best_networks = np.zeros(longitudes_matrix.shape, dtype = np.int32)
+	# Pick up the satellites already finished by an interrupted run
+	remaining = []
+	for i in range(len(satcats)):
+		checkpoint = read_checkpoint(checkpoint_directory, satcats[i], longitudes_matrix[:, i], not args.verdicts_only, source) if args.resume else None
+		if checkpoint is None:
+			remaining.append(i)
 		else:
-			longitude = float(longitude)
-			for j, k in zip(locallaunchdatabase_norad_list, locallaunchdatabase_country_list):
-				if j == satcat:
-					catalog_country = k
-			df_nearbyshortlist = pd.DataFrame(0, columns = ['Network', 'ITU Administration', 'Longitude', 'Network Type', 'Filing Maturity', 'Brought into Use', 'Due Diligence Match', 'Suspended', 'Longitudinal Distance', 'Eligible', 'Link', 'Grandfather', 'ITUAdm'], index = np.arange(1000))
-			licensecount = 0
-			for j in np.arange(len(df_licenses)):
-				longitudinal_distance = abs(df_licenses.at[j,'Longitude']-longitude)
-				if longitudinal_distance > 180:
-					longitudinal_distance = 360 - longitudinal_distance
-				if longitudinal_distance <= 1.0:
-					df_nearbyshortlist.at[licensecount, 'Network'] = df_licenses.at[j,'Network Name']
-					df_nearbyshortlist.at[licensecount, 'ITU Administration'] = countries_dictionary[df_licenses.at[j,'ITU Administration'].strip()]
-					ITUAdm = df_licenses.at[j,'ITU Administration'].strip()
-					df_nearbyshortlist.at[licensecount, 'ITUAdm'] = ITUAdm
-					if df_licenses.at[j,'Longitude'] < 0:
-						longitude_formatted = str(-1*df_licenses.at[j,'Longitude']) + u'\N{DEGREE SIGN}' + 'W'
-					else:
-						longitude_formatted = str(df_licenses.at[j,'Longitude']) + u'\N{DEGREE SIGN}' + 'E'
-					df_nearbyshortlist.at[licensecount, 'Longitude'] = longitude_formatted
-					df_nearbyshortlist.at[licensecount, 'Network Type'] = df_licenses.at[j,'Planned or Non-Planned']
-					df_nearbyshortlist.at[licensecount, 'Filing Maturity'] = 'Early-Stage'
-					if pd.isna(df_licenses.at[j,'Late-Stage Filing Date']) == False:
-						if datetime.strptime(df_licenses.at[j,'Late-Stage Filing Date'], '%Y-%m-%d') <= eval_date:
-							df_nearbyshortlist.at[licensecount, 'Filing Maturity'] = 'Late-Stage'
-					if pd.isna(df_licenses.at[j,'Suspensions']):
-						df_nearbyshortlist.at[licensecount, 'Suspended'] = 'No'
-					else:
-						df_nearbyshortlist.at[licensecount, 'Suspended'] = 'No'
-						suspension_list = eval(df_licenses.at[j,'Suspensions'])
-						for suspension in suspension_list[::-1]:
-							suspension_type, suspension_start, suspension_end = suspension
-							if suspension_end == 'n/a':
-								if eval_date >= datetime.strptime(suspension_start, '%Y-%m-%d'):
-									if suspension_type == 'T':
-										df_nearbyshortlist.at[licensecount, 'Suspended'] = 'Total'
-									if suspension_type == 'P':
-										df_nearbyshortlist.at[licensecount, 'Suspended'] = 'Partial'
-							else:
-								if (eval_date >= datetime.strptime(suspension_start, '%Y-%m-%d') and eval_date < datetime.strptime(suspension_end, '%Y-%m-%d')):
-									if suspension_type == 'T':
-										df_nearbyshortlist.at[licensecount, 'Suspended'] = 'Total'
-									if suspension_type == 'P':
-										df_nearbyshortlist.at[licensecount, 'Suspended'] = 'Partial'
-					df_nearbyshortlist.at[licensecount, 'Link'] = df_licenses.at[j,'Link']
-					df_nearbyshortlist.at[licensecount, 'Longitudinal Distance'] = longitudinal_distance
-					# Check if the network has grandfathered station-keeping requirements
-					df_nearbyshortlist.at[licensecount, 'Grandfather'] = 'No'
-					if (pd.isna(df_licenses.at[j,'Brought-into-Use Date']) == False and datetime.strptime(df_licenses.at[j,'Brought-into-Use Date'], '%Y-%m-%d') < datetime(1982, 1, 1)):
-						df_nearbyshortlist.at[licensecount, 'Grandfather'] = 'Yes'
-					if (pd.isna(df_licenses.at[j,'Brought-into-Use Date']) == False and datetime.strptime(df_licenses.at[j,'Brought-into-Use Date'], '%Y-%m-%d') < datetime(1987, 1, 1) and pd.isna(df_licenses.at[j,'Early-Stage Filing Date']) == False and datetime.strptime(df_licenses.at[j,'Early-Stage Filing Date'], '%Y-%m-%d') < datetime(1982, 1, 1)):
-						df_nearbyshortlist.at[licensecount, 'Grandfather'] = 'Yes'					
-					df_nearbyshortlist.at[licensecount, 'Brought into Use'] = 'No'
-					if pd.isna(df_licenses.at[j,'Brought-into-Use Date']) == False:
-						if eval_date >= datetime.strptime(df_licenses.at[j,'Brought-into-Use Date'], '%Y-%m-%d'):
-							df_nearbyshortlist.at[licensecount, 'Brought into Use'] = 'Yes'
-					licensecount += 1
-			# Drop blank rows in the dataframe
-			df_nearbyshortlist = df_nearbyshortlist[df_nearbyshortlist['ITU Administration'] != 0]
-			# Sort the frame by longitudinal distance
-			df_nearbyshortlist = df_nearbyshortlist.sort_values('Longitudinal Distance', ascending = True)
-			df_nearbyshortlist = df_nearbyshortlist.reset_index(drop=True)
-			# Find the most recent due-diligence match data available
-			duediligence_directories_names = [x[0].rsplit('/', 1) for x in os.walk('../Data/Reference Files/Due Diligence Matches/')][-1][1:]
-			duediligence_directories_datetimes = [datetime.strptime(i, '%Y%m%d') for i in duediligence_directories_names]
-			duediligence_directory = duediligence_directories_names[duediligence_directories_datetimes.index(max(duediligence_directories_datetimes))]
-			df_duediligence = pd.read_csv('../Data/Reference Files/Due Diligence Matches/' + duediligence_directory + '/' + satcat + '.csv')
-			for j in np.arange(len(df_nearbyshortlist)):
-				df_nearbyshortlist.at[j, 'Due Diligence Match'] = 'n/a'
-				license = df_nearbyshortlist.at[j, 'Network']
-				if df_nearbyshortlist.at[j, 'Filing Maturity'] == 'Late-Stage':
-					df_nearbyshortlist.at[j, 'Due Diligence Match'] = 'No'
-				for k in np.arange(len(df_duediligence)):
-					if (df_duediligence.at[k, 'Satellite Name'] == license and df_duediligence.at[k, 'Launch Country Match'] == 1):
-						launchdatematch = 0
-						if df_duediligence.at[k, 'Launch Offset (days)'] <= 365:
-							launchdatematch = 1
-						matchsum = launchdatematch + df_duediligence.at[k, 'Launch Spaceport Match'] + df_duediligence.at[k, 'Launch Vehicle Match'] + df_duediligence.at[k, 'Satellite Manufacturer Match'] 
-						if matchsum  >= 1:
-							df_nearbyshortlist.at[j, 'Due Diligence Match'] = 'Partial'
-						if matchsum == 4:
-							df_nearbyshortlist.at[j, 'Due Diligence Match'] = 'Full'
-			# Now use the short list to assess compliance
-			license_names = []
-			license_scores = []
-			for j in np.arange(len(df_nearbyshortlist)):
-				score = 0
-				license_names.append(df_nearbyshortlist.at[j, 'Network'])
-				if ((df_nearbyshortlist.at[j, 'Longitudinal Distance'] <= 0.1 and df_nearbyshortlist.at[j, 'Network Type'] == 'Planned') or (df_nearbyshortlist.at[j, 'Longitudinal Distance'] <= 0.5 and df_nearbyshortlist.at[j, 'Network Type'] == 'Non-Planned') or df_nearbyshortlist.at[j, 'Grandfather'] == 'Yes'):
-					ITUAdm = df_nearbyshortlist.at[j, 'ITUAdm']
-					if ITUAdm in SpaceTrackcountries_dict[catalog_country]:
-						score += 1
-						score += df_nearbyshortlist.at[j, 'Longitudinal Distance']
-						if (df_nearbyshortlist.at[j, 'Filing Maturity'] == 'Late-Stage'):
-							score += 1
-						if df_nearbyshortlist.at[j, 'Brought into Use'] == 'Yes':
-							score += 1
-							if (df_nearbyshortlist.at[j, 'Due Diligence Match'] != 'n/a' or df_nearbyshortlist.at[j, 'Due Diligence Match'] != 'None'):
-								if df_nearbyshortlist.at[j, 'Due Diligence Match'] == 'Partial':
-									score += 1
-								if df_nearbyshortlist.at[j, 'Due Diligence Match'] == 'Full':
-									score += 2
-						if df_nearbyshortlist.at[j, 'Suspended'] == 'Totally':
-							score = 0
-				license_scores.append(score)
-				if score != 0:
-					df_nearbyshortlist.at[j, 'Eligible'] = 'Yes \U0001F7E2'
-				else:
-					df_nearbyshortlist.at[j, 'Eligible'] = 'No \U0001F534'
-			bestscore = max(license_scores)
-			license_type = 'n/a'
-			license_name = 'n/a'
-			license_maturity = 'n/a'
-			license_broughtintouse = 'n/a'
-			license_match = 'n/a'
-			license_suspended = 'n/a'
-			license_grandfather = 'n/a'
-			if bestscore != 0:
-				bestlicense_index = license_scores.index(max(license_scores))
-				license_name = license_names[bestlicense_index]
-				for j in np.arange(len(df_nearbyshortlist)):
-					if df_nearbyshortlist.at[j, 'Network'] == license_name:
-							license_type = df_nearbyshortlist.at[j, 'Network Type']
-							license_maturity = df_nearbyshortlist.at[j, 'Filing Maturity']
-							license_broughtintouse = df_nearbyshortlist.at[j, 'Brought into Use']
-							license_match = df_nearbyshortlist.at[j, 'Due Diligence Match']
-							license_suspended = df_nearbyshortlist.at[j, 'Suspended']
-							license_grandfather = df_nearbyshortlist.at[j, 'Grandfather']
-			# Evaluate compliance
-			note = 'n/a'
-			note_brief = 'n/a'
-			if license_broughtintouse == 'Yes':
-				compliance = 'Yes'
-				if (license_suspended == 'n/a' or license_suspended == 'No'):
-					if license_grandfather == 'Yes':
-						note = 'There exists a space network with a nominal orbital position within 1.0 degree that was brought into use before January 1, 1987, with the advance publication information for the network having been published before January 1, 1982, complying with ITU Radio Regulations Article 22, Section III (22.15 to 22.17).'
-					else:
-						if license_type == 'Planned':
-							note = 'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8).'
-						if license_type == 'Non-Planned':
-							note = 'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13).'
-				else:
-					if license_suspended == 'Partial':
-						if license_type == 'Planned':
-							note = 'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8). As of the date of assessment, the identified network is partially suspended.'
-						if license_type == 'Non-Planned':
-							note = 'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13). As of the date of assessment, the identified network is partially suspended.'
-					else:
-						if license_suspended == 'Total':
-							compliance = 'No'
-							if license_type == 'Planned':
-								note = 'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, but it has since been totally suspended.'
-							if license_type == 'Non-Planned':
-								note = 'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, but it has since been totally suspended.'
-						else:
-							if license_type == 'Planned':
-								note = 'There exists a planned space network with a nominal orbital position within 0.1 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.6 to 22.8). The identified network was previous suspended, but has since resumed operation.'
-							if license_type == 'Non-Planned':
-								note = 'There exists a non-planned space network with a nominal orbital position within 0.5 degrees that was brought into use before the date of assessment, complying with ITU Radio Regulations Article 22, Section III (22.11 to 22.13). The identified network was previous suspended, but has since resumed operation.'
-			else:
-				compliance = 'No'
-				if license_name == 'n/a':
-					note = 'There are no space networks within station-keeping requirements for which any filings have been submitted by a corresponding ITU administration.'
-				else:
-					note = 'There exists a space network within station-keeping requirements held by a corresponding ITU administration, but its filings are in their early stages: this satellite is not protected from harmful interference.'
-				if license_maturity == 'Late-Stage':
-					note = 'There exists a space network within station-keeping requirements held by a corresponding ITU administration that is eligible for bringing into use, but the corresponding ITU administration has not yet done so.'
-			df_results_batched.at[m, satcat] = compliance + '. ' + note
-			printProgressBar(m + 1, len(df_longitudes), prefix = str("{:03d}".format(i+1))+' of '+str(len(satcats)), suffix = 'Complete', length = 50)
-			# Drop the ITUadm and grandfather columns from the nearby shortlist
-			df_nearbyshortlist = df_nearbyshortlist.drop(['Grandfather', 'ITUAdm'], axis=1)
-			# # Drop the Due Diligence Match column from the nearby shortlist
-			# df_nearbyshortlist = df_nearbyshortlist.drop('Due Diligence Match', axis=1)
-			# Drop the Eligible column from the nearby shortlist
-			df_nearbyshortlist = df_nearbyshortlist.drop('Eligible', axis=1)
-			# Round the 'Longitudinal Distance' column to two decimal places
-			df_nearbyshortlist['Longitudinal Distance'] = df_nearbyshortlist['Longitudinal Distance'].round(2)
-			# Add a degree symbol to the values in the 'Longitudinal Distance' column
-			df_nearbyshortlist['Longitudinal Distance'] = df_nearbyshortlist['Longitudinal Distance'].apply(lambda x: f'{x:.2f}°')
-			# Save the shortlist to a CSV 
-			df_nearbyshortlist.to_csv('../Data/Historical Analysis/' + assessmentdate + '/Historical Nearby Shortlists/' + eval_date.strftime('%Y%m%d') + '/nearbyshortlist_' + satcat + '_' + eval_date.strftime('%Y%m%d') + '.csv', index = None)
-# Now let's do a check to see whether any satellites not in compliance were sufficiently far away from compliant satellites on the date of assessment
-for i in np.arange(len(satcats)):
-	satcat = str(satcats[i])
-	for m in np.arange(len(df_longitudes)):
-		longitude = df_longitudes.at[m, satcat]
-		neighbor_compliance = False
+			verdicts[:, i], notes[:, i], best_networks[:, i] = checkpoint
+	if len(remaining) < len(satcats):
+		print('Resuming with', len(satcats) - len(remaining), 'of', len(satcats), 'satellites already assessed.')
+	# Drop any shortlists saved for satellites an interrupted run didn't finish
+	if (args.resume and not args.verdicts_only):
+		for i in remaining:
+			shortlist_store.remove(satcats[i])
+	# Assess each satellite and collect the results before checking neighbors
+	for count, (i, satellite_verdicts, satellite_notes, satellite_best_networks, shortlists) in enumerate(assess_satellites(remaining)):
+		verdicts[:, i] = satellite_verdicts
+		notes[:, i] = satellite_notes
+		best_networks[:, i] = satellite_best_networks
+		# Save the satellite's shortlists, then its assessment, so a satellite with a checkpoint always has its shortlists saved
+		if not args.verdicts_only:
+			for shortlist_date, shortlist in shortlists:
+				shortlist_store.add(shortlist_date, satcats[i], shortlist)
+			shortlist_store.flush()
+		if args.block_size is None:
+			write_checkpoint(checkpoint_directory, satcats[i], longitudes_matrix[:, i], satellite_verdicts, satellite_notes, satellite_best_networks, not args.verdicts_only, source)
+		printProgressBar(count + 1, len(remaining), prefix = 'Satellites', suffix = 'Complete', length = 50)
+	# Now let's do a check to see whether any satellites not in compliance were sufficiently far away from compliant satellites on the date of assessment
+	for m in np.arange(len(dates)):
 		# For satellites not in compliance, check to see if any other satellites within 0.5 degrees are in compliance
-		if df_results_batched.at[m, satcat][0] == 'N':
-			for j in np.arange(len(satcats)):
-				satcat_scan = str(satcats[j])
-				if satcat_scan != satcat:
-					longitude_scan = df_longitudes.at[m, satcat_scan]
-					if abs(longitude - longitude_scan) <= 0.5:
-						if df_results_batched.at[m, satcat_scan][0] == 'Y':
-							neighbor_compliance = True
-			if neighbor_compliance == False:
-				df_results_batched.at[m, satcat] = 'Maybe. Although there are no space networks within station-keeping requirements for which any filings have been submitted by a corresponding ITU administration, there are also no other compliant satellites within 0.5 degrees, meaning this satellite could be in compliance with ITU Radio Regulations Article 22, Section III: 22.10 or 22.14.'
-
-# Save the results
-for satcat in satcats:
-	# Make a CSV to house results
-	with open('../Data/Historical Analysis/' + assessmentdate + '/Historical Compliance Assessments/compliance_' + str(satcat) + '_' + assessmentdate + '.csv', 'w') as csvfile:
-		writer = csv.writer(csvfile)
-		writer.writerow(['Date', 'Longitude', 'Compliance Assessment', 'Note'])
-	compliance_list = [sentence.split('.')[0] for sentence in df_results_batched[satcat]]
-	note_list = [sentence.split('.', 1)[-1].strip() for sentence in df_results_batched[satcat]]
-	for i in np.arange(len(dates)):
-		with open('../Data/Historical Analysis/' + assessmentdate + '/Historical Compliance Assessments/compliance_' + str(satcat) + '_' + assessmentdate + '.csv', 'a') as csvfile:
-			writer = csv.writer(csvfile)
-			writer.writerow([dates[i], df_longitudes[satcat].tolist()[i], compliance_list[i], note_list[i]])
-
-
-
-				
-
-			
-
+		engine.check_neighbors(longitudes_matrix[m], verdicts[m], notes[m])
+
+	# Save the results, adding each block of dates to the end of the last
+	for i in np.arange(len(satcats)):
+		write_satellite_results(results_files[i], dates, df_longitudes[satcats[i]].tolist(), verdicts[:, i], notes[:, i], append = block > 0)
+	if args.matrix:
+		write_results_matrix(matrix_file, dates, satcats, verdicts, append = block > 0)
+	if args.long:
+		long_results.write(dates, satcats, longitudes_matrix, verdicts, notes, best_networks)
+
+# Every block of dates is saved, so the results files can be given their real names
+for results_file in results_files:
+	finish_results(results_file, SATELLITE_RESULTS_COLUMNS)
+if args.matrix:
+	finish_results(matrix_file, ['Date'] + [str(satcat) for satcat in satcats])
+if args.long:
+	long_results.close()
+	print('Long table of results saved as', long_results.file_path)
+# Write each nearby shortlist to its own file too, if asked
+if not args.verdicts_only:
+	if args.shortlist_files:
+		shortlist_store.export_csv('../Data/Historical Analysis/' + assessmentdate + '/Historical Nearby Shortlists')
+	shortlist_store.close()
+# Every satellite's results are saved, so the checkpoints are no longer needed
+shutil.rmtree(checkpoint_directory)
@@ -0,0 +1,216 @@
+"""
+Name: 			compliance_server.py
+Description:
+				Answers compliance assessments over HTTP, from networks and reference files kept in memory.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/[YYYYMMDD]/networks_[YYYYMMDD].csv
+				../Data/Reference Files/ITUcountries.csv
+				../Data/Reference Files/SpaceTrackcountries.csv
+				../Data/Reference Files/satellitecatalog.csv
+				../Data/Reference Files/Due Diligence Matches/[YYYYMMDD]/[satcat].csv or ../Data/Reference Files/Due Diligence Matches/[YYYYMMDD].npy
+Outputs:
+				n/a
+"""
+
+## Checking one satellite at one longitudinal position used to mean writing a longitudes file and running compliance_daily.py, which clears and rewrites the whole day's results. This script keeps one ComplianceEngine loaded and answers questions about any satellite, position, and date over HTTP on the local computer, without touching any files:
+##   POST /assess          {"norad_id": "40258", "longitude": 38.12, "date": "2017-10-24", "shortlist": true}
+##   POST /assess/batch    {"satellites": [{"norad_id": "40258", "longitude": 38.12}, ...], "date": "2017-10-24", "neighbors": true, "shortlist": false}
+##   GET  /status
+## The date is optional and defaults to today. A single assessment doesn't consider the satellite's neighbors, so it's 'n/a', 'Yes', or 'No'; a batch compares its satellites with each other, as compliance_daily.py does, unless "neighbors" is false.
+## Every so often, the script checks ../Data/SNL Downloads/ for a newer networks file created by snl.py, or for the loaded one having been rewritten. When one appears, a new engine is loaded in the background and swapped in once it's ready, so queries are answered from the old networks until then.
+
+import argparse
+import asyncio
+import json
+import os
+import traceback
+from datetime import datetime
+import numpy as np
+from networks import latest_networks_file
+from assessment import VERDICTS, NOTES, SHORTLIST_COLUMNS
+from compliance_engine import ComplianceEngine, UnknownSatellite
+
+# Choose where to listen and how often to look for new networks
+parser = argparse.ArgumentParser(description = 'Answer compliance assessments over HTTP, from networks and reference files kept in memory.')
+parser.add_argument('--host', default = '127.0.0.1', help = 'address to listen on (default: 127.0.0.1)')
+parser.add_argument('--port', type = int, default = 8080, help = 'port to listen on (default: 8080)')
+parser.add_argument('--reload-interval', type = float, default = 60, help = 'seconds between checks for a newer networks file (default: 60)')
+args = parser.parse_args()
+
+snl_directory = '../Data/SNL Downloads/'
+reference_directory = '../Data/Reference Files/'
+
+# Write the reasons for each HTTP status code the script responds with
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+# Write a quick function for reading a required field from a request
+def request_field(request, name):
+	if name not in request:
+		raise ValueError('Missing "' + name + '" field.')
+	return request[name]
+
+# Write a quick function for reading a longitude from a request, with null for an unknown position
+def request_longitude(request):
+	longitude = request_field(request, 'longitude')
+	return float('nan') if longitude is None else float(longitude)
+
+class ComplianceService:
+	"""
+	Answers requests from the most recent networks and reference files, reloading them when snl.py creates a newer networks file
+	@params:
+		snl_directory           - Required  : directory holding one sub-directory of networks per date, named YYYYMMDD (Str)
+		reference_directory     - Required  : directory holding the country dictionaries, satellite catalog, and due-diligence matches (Str)
+	"""
+	def __init__(self, snl_directory, reference_directory):
+		self.snl_directory = snl_directory
+		self.reference_directory = reference_directory
+		self.engine = self.load_engine(latest_networks_file(snl_directory))
+
+	# Write a quick function for telling versions of a networks file apart, by its path, size, and modification time
+	def networks_version(self, networks_file):
+		status = os.stat(networks_file)
+		return networks_file, status.st_size, status.st_mtime_ns
+
+	def load_engine(self, networks_file):
+		# (Note the file's version before reading it, so that a file rewritten while it's read is loaded again at the next check)
+		version = self.networks_version(networks_file)
+		engine = ComplianceEngine(networks_file, self.snl_directory, self.reference_directory)
+		self.loaded_version = version
+		self.loaded = datetime.now().isoformat(timespec = 'seconds')
+		print('Loaded', networks_file)
+		return engine
+
+	async def watch(self, interval):
+		"""
+		Check for a newer networks file every so often, loading it in the background and swapping it in once it's ready
+		@params:
+			interval    - Required  : seconds between checks (Float)
+		"""
+		loop = asyncio.get_running_loop()
+		while True:
+			await asyncio.sleep(interval)
+			try:
+				networks_file = latest_networks_file(self.snl_directory)
+				if self.networks_version(networks_file) != self.loaded_version:
+					self.engine = await loop.run_in_executor(None, self.load_engine, networks_file)
+			except Exception as error:
+				# Keep answering from the networks already loaded, e.g. if the new file can't be read
+				print('Could not reload the networks:', repr(error))
+
+	def result(self, engine, norad_id, longitude, verdict, note, network, date, shortlist):
+		result = {'norad_id': str(norad_id), 'longitude': None if np.isnan(longitude) else longitude, 'verdict': VERDICTS[verdict], 'note': NOTES[note], 'network': engine.network_name(network)}
+		if shortlist:
+			columns = engine.shortlist(norad_id, longitude, date) if not np.isnan(longitude) else {column: [] for column in SHORTLIST_COLUMNS}
+			result['shortlist'] = [dict(zip(SHORTLIST_COLUMNS, row)) for row in zip(*[columns[column] for column in SHORTLIST_COLUMNS])]
+		return result
+
+	def assess(self, request):
+		engine = self.engine
+		norad_id = str(request_field(request, 'norad_id'))
+		longitude = request_longitude(request)
+		date = request.get('date') or datetime.today().strftime('%Y-%m-%d')
+		verdicts, notes, best_networks = engine.assess_batch([norad_id], [longitude], date, neighbors = False)
+		return self.result(engine, norad_id, longitude, verdicts[0], notes[0], best_networks[0], date, request.get('shortlist', False))
+
+	def assess_batch(self, request):
+		engine = self.engine
+		satellites = request_field(request, 'satellites')
+		norad_ids = [str(request_field(satellite, 'norad_id')) for satellite in satellites]
+		longitudes = [request_longitude(satellite) for satellite in satellites]
+		date = request.get('date') or datetime.today().strftime('%Y-%m-%d')
+		verdicts, notes, best_networks = engine.assess_batch(norad_ids, longitudes, date, neighbors = request.get('neighbors', True))
+		shortlist = request.get('shortlist', False)
+		return {'date': date, 'results': [self.result(engine, norad_ids[i], longitudes[i], verdicts[i], notes[i], best_networks[i], date, shortlist) for i in range(len(norad_ids))]}
+
+	def status(self):
+		return {'networks_file': self.engine.networks_file, 'duediligence_directory': self.engine.duediligence_store.directory, 'loaded': self.loaded}
+
+	def respond(self, method, path, body):
+		"""
+		Answer one request
+		@params:
+			method      - Required  : the request's HTTP method (Str)
+			path        - Required  : the request's path (Str)
+			body        - Required  : the request's body, as JSON (Bytes)
+		@returns:
+			an HTTP status code (Int) and the response, to be sent as JSON (Dict)
+		"""
+		routes = {'/assess': ('POST', self.assess), '/assess/batch': ('POST', self.assess_batch), '/status': ('GET', self.status)}
+		if path not in routes:
+			return 404, {'error': 'No such path: ' + path}
+		route_method, handler = routes[path]
+		if method != route_method:
+			return 405, {'error': path + ' only accepts ' + route_method + ' requests.'}
+		try:
+			if route_method == 'GET':
+				return 200, handler()
+			request = json.loads(body or b'{}')
+			if not isinstance(request, dict):
+				raise ValueError('The request must be a JSON object.')
+			return 200, handler(request)
+		except UnknownSatellite as error:
+			return 404, {'error': 'No satellite catalog entry for NORAD ID ' + error.norad_id + '.'}
+		except FileNotFoundError as error:
+			return 404, {'error': str(error)}
+		except (ValueError, TypeError, AttributeError) as error:
+			return 400, {'error': str(error)}
+		except Exception:
+			# Keep answering other requests, but leave a record of what went wrong
+			traceback.print_exc()
+			return 500, {'error': 'The request could not be answered; see the server\'s log.'}
+
+service = ComplianceService(snl_directory, reference_directory)
+
+# Write a quick function for turning a response into JSON, or into an error if it can't be
+def response_data(status, response):
+	try:
+		return status, json.dumps(response).encode()
+	except (TypeError, ValueError):
+		traceback.print_exc()
+		return 500, json.dumps({'error': 'The response could not be written as JSON; see the server\'s log.'}).encode()
+
+# Write a function for reading requests from one connection and answering them, keeping the connection open between requests
+async def handle_connection(reader, writer):
+	try:
+		while True:
+			try:
+				request_line = await reader.readline()
+				if not request_line:
+					break
+				method, path, version = request_line.decode('latin-1').split()
+				headers = {}
+				while True:
+					line = await reader.readline()
+					if line in (b'\r\n', b'\n', b''):
+						break
+					name, _, value = line.decode('latin-1').partition(':')
+					headers[name.strip().lower()] = value.strip()
+				body = await reader.readexactly(int(headers.get('content-length', 0)))
+			except ValueError:
+				# Answer requests that don't speak HTTP, then hang up, since the rest of the connection can't be read
+				status, response = 400, {'error': 'Malformed HTTP request.'}
+				keep_alive = False
+			else:
+				status, response = service.respond(method, path.split('?')[0], body)
+				keep_alive = (version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close')
+			status, data = response_data(status, response)
+			writer.write(('HTTP/1.1 ' + str(status) + ' ' + HTTP_REASONS[status] + '\r\nContent-Type: application/json\r\nContent-Length: ' + str(len(data)) + '\r\nConnection: ' + ('keep-alive' if keep_alive else 'close') + '\r\n\r\n').encode('latin-1') + data)
+			await writer.drain()
+			if not keep_alive:
+				break
+	except (ConnectionError, asyncio.IncompleteReadError):
+		# Drop connections that close early
+		pass
+	finally:
+		writer.close()
+
+async def serve():
+	server = await asyncio.start_server(handle_connection, args.host, args.port)
+	print('Answering compliance assessments at http://' + args.host + ':' + str(args.port) + ' ...')
+	async with server:
+		await asyncio.gather(server.serve_forever(), service.watch(args.reload_interval))
+
+asyncio.run(serve())
@@ -0,0 +1,146 @@
+"""
+Name: 			duediligence.py
+Description:
+				Shared helpers for looking up how well each space network matches a satellite's launch and manufacturing details.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/Reference Files/Due Diligence Matches/[YYYYMMDD]/[satcat].csv or ../Data/Reference Files/Due Diligence Matches/[YYYYMMDD].npy
+Outputs:
+				n/a
+"""
+
+## Each satellite has its own file of due-diligence matches, with one row per candidate network. The compliance scripts only need to know which networks are partial or full matches, so each file is read once, reduced to a dictionary of network names and match levels, and kept in memory for the next time that satellite comes up.
+## Reading over a thousand CSV files takes a while, so duediligence_pack.py can pack a directory of them into one file beside it, [YYYYMMDD].npy, which is used instead whenever it exists. The file holds a few NumPy arrays one after another: the satellites' NORAD IDs, where each satellite's rows start, and each row's network and match level. Only the short arrays are read; the rows are memory-mapped, so a satellite's matches are read straight from the file when it comes up.
+
+import os
+from collections import OrderedDict
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Write a list of due-diligence match levels, numbered by the points they add to a network's score
+DUEDILIGENCE_LEVELS = ['None', 'Partial', 'Full']
+
+# Write a quick function for scoring each of a satellite's due-diligence matches as 0 (no match), 1 (partial), or 2 (full)
+def duediligence_points(df_duediligence):
+	launchdatematch = (df_duediligence['Launch Offset (days)'] <= 365).astype(int)
+	matchsums = launchdatematch + df_duediligence['Launch Spaceport Match'] + df_duediligence['Launch Vehicle Match'] + df_duediligence['Satellite Manufacturer Match']
+	countrymatch = df_duediligence['Launch Country Match'] == 1
+	return np.where(countrymatch & (matchsums == 4), 2, np.where(countrymatch & (matchsums >= 1), 1, 0)).astype(np.int8)
+
+# Write a quick function for reading a satellite's due-diligence matches as a dictionary of network names and match levels
+def read_duediligence_levels(file_path):
+	df_duediligence = pd.read_csv(file_path)
+	duediligence_levels = {}
+	# When a network is matched more than once, the last match in the file decides its level
+	for name, points in zip(df_duediligence['Satellite Name'], duediligence_points(df_duediligence)):
+		if points > 0:
+			duediligence_levels[name] = DUEDILIGENCE_LEVELS[points]
+	return duediligence_levels
+
+# Write a quick function for packing a directory of due-diligence matches into one file
+def pack_duediligence(directory, file_path):
+	satcats = []
+	row_counts = []
+	network_ids = []
+	points = []
+	network_numbers = {}
+	files = [name for name in os.listdir(directory) if name.endswith('.csv')]
+	for name in sorted(files, key = lambda name: int(name[:-4])):
+		df_duediligence = pd.read_csv(os.path.join(directory, name))
+		satcats.append(int(name[:-4]))
+		row_counts.append(len(df_duediligence))
+		network_ids.append(np.array([network_numbers.setdefault(network, len(network_numbers)) for network in df_duediligence['Satellite Name']], dtype = np.int32))
+		points.append(duediligence_points(df_duediligence))
+	offsets = np.concatenate([[0], np.cumsum(row_counts)]).astype(np.int64)
+	with open(file_path, 'wb') as f:
+		for array in [np.array(satcats, dtype = np.int64), offsets, np.array(list(network_numbers), dtype = str), np.concatenate(network_ids + [np.array([], dtype = np.int32)]), np.concatenate(points + [np.array([], dtype = np.int8)])]:
+			np.lib.format.write_array(f, array, allow_pickle = False)
+
+# Write a quick function for reading the arrays in a packed file, memory-mapping any arrays past the first few
+def read_packed_duediligence(file_path, loaded = 3):
+	arrays = []
+	with open(file_path, 'rb') as f:
+		while len(arrays) < 5:
+			version = np.lib.format.read_magic(f)
+			shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f) if version == (1, 0) else np.lib.format.read_array_header_2_0(f)
+			offset = f.tell()
+			size = int(np.prod(shape))*dtype.itemsize
+			if len(arrays) < loaded:
+				arrays.append(np.frombuffer(f.read(size), dtype = dtype).reshape(shape))
+			else:
+				arrays.append(np.memmap(file_path, dtype = dtype, mode = 'r', offset = offset, shape = shape) if size > 0 else np.zeros(shape, dtype = dtype))
+				f.seek(offset + size)
+	return arrays
+
+# Write a quick function for finding the most recent due-diligence match data available
+def latest_duediligence_directory(directory = '../Data/Reference Files/Due Diligence Matches/'):
+	names = []
+	for name in os.listdir(directory):
+		if os.path.isdir(os.path.join(directory, name)):
+			try:
+				datetime.strptime(name, '%Y%m%d')
+				names.append(name)
+			except ValueError:
+				pass
+	return os.path.join(directory, max(names))
+
+class DueDiligenceStore:
+	"""
+	Reads satellites' due-diligence matches from the most recent match data available, keeping the most recently used satellites in memory
+	@params:
+		directory       - Optional  : directory holding one sub-directory of match data per date, named YYYYMMDD (Str)
+		max_satellites  - Optional  : number of satellites' matches to keep in memory at once (Int)
+	"""
+	def __init__(self, directory = '../Data/Reference Files/Due Diligence Matches/', max_satellites = 256):
+		self.directory = latest_duediligence_directory(directory)
+		self.max_satellites = max_satellites
+		self._levels = OrderedDict()
+		# Use the packed copy of the match data, if there is one
+		self.packed = os.path.isfile(self.directory + '.npy')
+		if self.packed:
+			self._satcats, self._offsets, networks, self._network_ids, self._points = read_packed_duediligence(self.directory + '.npy')
+			self._networks = networks.tolist()
+
+	def levels(self, satcat):
+		"""
+		Look up a satellite's due-diligence matches
+		@params:
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+		@returns:
+			the match level, 'Partial' or 'Full', of each matched network, keyed by network name (Dict)
+		"""
+		satcat = str(satcat)
+		if satcat in self._levels:
+			self._levels.move_to_end(satcat)
+		else:
+			if self.packed:
+				self._levels[satcat] = self._read_packed_levels(satcat)
+			else:
+				self._levels[satcat] = read_duediligence_levels(os.path.join(self.directory, satcat + '.csv'))
+			if len(self._levels) > self.max_satellites:
+				self._levels.popitem(last = False)
+		return self._levels[satcat]
+
+	def level(self, satcat, network_name):
+		"""
+		Look up how well one network matches a satellite
+		@params:
+			satcat          - Required  : the satellite's NORAD ID (Str or Int)
+			network_name    - Required  : the network's name (Str)
+		@returns:
+			'Partial', 'Full', or None if the network isn't a match (Str)
+		"""
+		return self.levels(satcat).get(network_name)
+
+	def _read_packed_levels(self, satcat):
+		k = np.searchsorted(self._satcats, int(satcat))
+		if (k == len(self._satcats) or self._satcats[k] != int(satcat)):
+			raise FileNotFoundError('No due-diligence match data for Satellite #' + satcat + ' in ' + self.directory + '.npy')
+		points = self._points[self._offsets[k]:self._offsets[k+1]]
+		matched = np.flatnonzero(points > 0)
+		network_ids = self._network_ids[self._offsets[k]:self._offsets[k+1]][matched]
+		# When a network is matched more than once, the last match decides its level
+		return {self._networks[network_id]: DUEDILIGENCE_LEVELS[level] for network_id, level in zip(network_ids.tolist(), points[matched].tolist())}
@@ -0,0 +1,32 @@
+"""
+Name: 			duediligence_pack.py
+Description:
+				Packs a directory of due-diligence match files into one file that the compliance scripts can read much more quickly.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/Reference Files/Due Diligence Matches/[YYYYMMDD]/[satcat].csv
+Outputs:
+				../Data/Reference Files/Due Diligence Matches/[YYYYMMDD].npy
+"""
+
+## Run this script once whenever new due-diligence match data is added. From then on, compliance_daily.py and compliance_historical.py read the packed file instead of the match data's CSV files. Delete the packed file to go back to reading the CSV files.
+
+import argparse
+import os
+import time
+from duediligence import latest_duediligence_directory, pack_duediligence
+
+# Choose which match data to pack
+parser = argparse.ArgumentParser(description = 'Pack a directory of due-diligence match files into one file.')
+parser.add_argument('--date', default = None, help = 'date of the match data to pack, as YYYYMMDD (default: the most recent match data available)')
+args = parser.parse_args()
+if args.date is None:
+	directory = latest_duediligence_directory()
+else:
+	directory = os.path.join('../Data/Reference Files/Due Diligence Matches/', args.date)
+
+start = time.perf_counter()
+pack_duediligence(directory, directory + '.npy')
+print('Packed', directory, 'into', directory + '.npy', 'in', f'{time.perf_counter() - start:.1f}', 's (' + f'{os.path.getsize(directory + ".npy")/1024/1024:.1f}', 'MB).')
@@ -0,0 +1,247 @@
+"""
+Name: 			networks.py
+Description:
+				Shared helpers for loading the networks produced by snl.py and looking them up by their prescribed longitudinal positions.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/[YYYYMMDD]/networks_[YYYYMMDD].csv
+Outputs:
+				n/a
+"""
+
+## The compliance scripts need to find every space network within 1.0 degree of a satellite's longitudinal position, once per satellite (and, for historical assessments, once per satellite per date). Rather than scanning every network each time, the networks are sorted by longitude once and each lookup becomes a binary search.
+## The networks file stores its dates and suspensions as text. Rather than re-parsing that text for every nearby network on every assessment date, it is parsed once into arrays of day numbers.
+## A network's filing maturity and bringing into use each change once, on a single date, so checking them is one comparison. Its suspension status can change several times, so the dates on which it changes are worked out once, with the status that follows each one; a network's status on any date is then a binary search through those dates, shared by every satellite near that network.
+
+import ast
+import os
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Write a placeholder day number for missing dates, later than any assessment date
+NO_DATE = np.iinfo(np.int64).max
+
+# Write a list of suspension statuses, numbered by their position
+SUSPENSION_STATUSES = ['No', 'Partial', 'Total']
+SUSPENSION_NONE, SUSPENSION_PARTIAL, SUSPENSION_TOTAL = 0, 1, 2
+
+# Write a quick function for converting dates (datetimes or 'YYYY-MM-DD' strings) to day numbers
+def day_number(date):
+	return int(np.datetime64(date, 'D').astype(np.int64))
+
+# Write a quick function for converting a column of 'YYYY-MM-DD' strings to day numbers, with NO_DATE for any missing dates
+def day_numbers(dates):
+	parsed = pd.to_datetime(pd.Series(dates), format = '%Y-%m-%d').to_numpy().astype('datetime64[D]')
+	return np.where(np.isnat(parsed), NO_DATE, parsed.astype(np.int64))
+
+# Write a quick function for reading a network's suspensions, e.g. "[['T', '2019-04-23', '2022-03-21']]", without evaluating the text as code
+def read_suspensions(suspensions):
+	if pd.isna(suspensions) or suspensions.strip() == 'n/a':
+		return []
+	return ast.literal_eval(suspensions.strip())
+
+# Write a quick function for combining networks' row numbers and day numbers into keys that sort by network, then by day
+# (Day numbers are clipped to 32 bits, which leaves NO_DATE later than any real date)
+def status_key(rows, days):
+	return (rows << 32) + (np.clip(days, -2**31, 2**31 - 1) + 2**31)
+
+# Write a quick function for calculating longitudinal distances, accounting for the 180-degree meridian
+def longitudinal_distance(network_longitudes, longitude):
+	distances = np.abs(np.asarray(network_longitudes, dtype = float) - longitude)
+	return np.where(distances > 180, 360 - distances, distances)
+
+class NetworkIndex:
+	"""
+	Sorts space networks by their prescribed longitudes so that nearby networks can be found with a binary search
+	@params:
+		longitudes  - Required  : prescribed longitude of each network, in the order of the networks table (List or Array)
+	"""
+	def __init__(self, longitudes):
+		self.longitudes = np.asarray(longitudes, dtype = float)
+		self.order = np.argsort(self.longitudes, kind = 'stable')
+		self.sorted_longitudes = self.longitudes[self.order]
+		# Lay the sorted networks out three times, shifted by a full revolution, so every window is one contiguous slice
+		self.extended_longitudes = np.concatenate([self.sorted_longitudes - 360, self.sorted_longitudes, self.sorted_longitudes + 360])
+		self.extended_order = np.tile(self.order, 3)
+
+	def __len__(self):
+		return len(self.longitudes)
+
+	def nearby(self, longitude, window = 1.0):
+		"""
+		Find the networks within a given number of degrees of a longitudinal position
+		@params:
+			longitude   - Required  : longitudinal position of interest (Float)
+			window      - Optional  : maximum longitudinal distance in degrees (Float)
+		@returns:
+			the networks' row numbers in the networks table, in their original order (Array), and their longitudinal distances (Array)
+		"""
+		# Search the window itself and its copies shifted by a full revolution, so windows that cross the 180-degree meridian wrap around
+		# (The search is slightly wider than the window; the exact distance check below decides which networks are kept)
+		slices = []
+		for shift in (-360, 0, 360):
+			start = np.searchsorted(self.sorted_longitudes, longitude - window + shift - 1e-6, side = 'left')
+			end = np.searchsorted(self.sorted_longitudes, longitude + window + shift + 1e-6, side = 'right')
+			if start < end:
+				slices.append(self.order[start:end])
+		if len(slices) == 0:
+			return np.array([], dtype = int), np.array([], dtype = float)
+		candidates = np.unique(np.concatenate(slices))
+		distances = longitudinal_distance(self.longitudes[candidates], longitude)
+		keep = distances <= window
+		return candidates[keep], distances[keep]
+
+	def nearby_many(self, longitudes, window = 1.0):
+		"""
+		Find the networks within a given number of degrees of many longitudinal positions at once
+		@params:
+			longitudes  - Required  : longitudinal positions of interest (Array)
+			window      - Optional  : maximum longitudinal distance in degrees (Float)
+		@returns:
+			one row per position of the networks' row numbers (Array), their longitudinal distances (Array), and which entries are real matches rather than padding (Array)
+			Each row lists its networks in their original order, followed by any padding.
+		"""
+		longitudes = np.asarray(longitudes, dtype = float)
+		starts = np.searchsorted(self.extended_longitudes, longitudes - window - 1e-6, side = 'left')
+		counts = np.searchsorted(self.extended_longitudes, longitudes + window + 1e-6, side = 'right') - starts
+		width = int(counts.max()) if len(counts) > 0 else 0
+		offsets = np.arange(width)
+		inrange = offsets[np.newaxis, :] < counts[:, np.newaxis]
+		candidates = self.extended_order[np.where(inrange, starts[:, np.newaxis] + offsets[np.newaxis, :], 0)]
+		distances = longitudinal_distance(self.longitudes[candidates], longitudes[:, np.newaxis])
+		keep = inrange & (distances <= window)
+		# Put each row's networks back in their original order, with the padding at the end
+		resort = np.argsort(np.where(keep, candidates, len(self.longitudes)), axis = 1, kind = 'stable')
+		candidates = np.take_along_axis(candidates, resort, axis = 1)
+		distances = np.take_along_axis(distances, resort, axis = 1)
+		keep = np.take_along_axis(keep, resort, axis = 1)
+		return candidates, distances, keep
+
+class NetworkTable:
+	"""
+	Holds the networks from a networks_[YYYYMMDD].csv file with their dates parsed into day numbers
+	@params:
+		df_licenses - Required  : networks, as read from a networks_[YYYYMMDD].csv file (DataFrame)
+	"""
+	def __init__(self, df_licenses):
+		self.names = df_licenses['Network Name'].tolist()
+		self.longitudes = df_licenses['Longitude'].to_numpy(dtype = float)
+		self.administrations = [administration.strip() for administration in df_licenses['ITU Administration']]
+		self.network_types = df_licenses['Planned or Non-Planned'].tolist()
+		self.links = df_licenses['Link'].tolist()
+		self.planned = np.array([network_type == 'Planned' for network_type in self.network_types])
+		self.nonplanned = np.array([network_type == 'Non-Planned' for network_type in self.network_types])
+		# Number the networks' names, so networks listed under the same name share a number
+		name_numbers = {}
+		self.name_ids = np.array([name_numbers.setdefault(name, len(name_numbers)) for name in self.names], dtype = np.int64)
+		# List the row numbers of the networks listed under each name
+		self.name_rows = {}
+		for j, name in enumerate(self.names):
+			self.name_rows.setdefault(name, []).append(j)
+		# List the row numbers of the networks held by each ITU administration
+		self.administration_rows = {}
+		for j, administration in enumerate(self.administrations):
+			self.administration_rows.setdefault(administration, []).append(j)
+		self.broughtintouse_days = day_numbers(df_licenses['Brought-into-Use Date'])
+		self.latestage_days = day_numbers(df_licenses['Late-Stage Filing Date'])
+		self.earlystage_days = day_numbers(df_licenses['Early-Stage Filing Date'])
+		# Check which networks have grandfathered station-keeping requirements
+		self.grandfathered = (self.broughtintouse_days < day_number('1982-01-01')) | ((self.broughtintouse_days < day_number('1987-01-01')) & (self.earlystage_days < day_number('1982-01-01')))
+		# Store every network's suspensions in one set of arrays, with the suspensions for network j at positions suspension_offsets[j] to suspension_offsets[j+1]
+		suspension_types = []
+		suspension_starts = []
+		suspension_ends = []
+		suspension_offsets = [0]
+		for suspensions in df_licenses['Suspensions']:
+			for suspension_type, suspension_start, suspension_end in read_suspensions(suspensions):
+				suspension_types.append(suspension_type)
+				suspension_starts.append(day_number(suspension_start))
+				if suspension_end == 'n/a':
+					suspension_ends.append(NO_DATE)
+				else:
+					suspension_ends.append(day_number(suspension_end))
+			suspension_offsets.append(len(suspension_types))
+		self.suspension_types = np.array(suspension_types, dtype = str)
+		self.suspension_starts = np.array(suspension_starts, dtype = np.int64)
+		self.suspension_ends = np.array(suspension_ends, dtype = np.int64)
+		self.suspension_offsets = np.array(suspension_offsets, dtype = np.int64)
+		self.ever_suspended = np.diff(self.suspension_offsets) > 0
+		# List the days on which each network's suspension status changes, and its status from each of those days on, with network j's changes at positions status_offsets[j] to status_offsets[j+1]
+		status_networks = []
+		status_days = []
+		status_codes = []
+		status_offsets = [0]
+		for j in range(len(self.names)):
+			suspensions = slice(self.suspension_offsets[j], self.suspension_offsets[j+1])
+			for day in np.unique(np.concatenate([self.suspension_starts[suspensions], self.suspension_ends[suspensions]])):
+				status_networks.append(j)
+				status_days.append(day)
+				status_codes.append(self._listed_suspension_status(j, day))
+			status_offsets.append(len(status_days))
+		self.status_days = np.array(status_days, dtype = np.int64)
+		self.status_codes = np.array(status_codes, dtype = np.int8)
+		self.status_offsets = np.array(status_offsets, dtype = np.int64)
+		# Key each change by its network and day, so many (network, date) pairs can be looked up with one binary search
+		self._status_keys = status_key(np.array(status_networks, dtype = np.int64), self.status_days)
+
+	def __len__(self):
+		return len(self.names)
+
+	def _listed_suspension_status(self, j, day):
+		# Follow the earliest-listed suspension in effect on that date
+		for k in range(self.suspension_offsets[j], self.suspension_offsets[j+1]):
+			if (self.suspension_starts[k] <= day and day < self.suspension_ends[k]):
+				if self.suspension_types[k] == 'T':
+					return SUSPENSION_TOTAL
+				if self.suspension_types[k] == 'P':
+					return SUSPENSION_PARTIAL
+		return SUSPENSION_NONE
+
+	def suspension_codes(self, rows, days):
+		"""
+		Look up whether many networks are suspended on many dates at once
+		@params:
+			rows        - Required  : the networks' row numbers in the networks table (Array)
+			days        - Required  : day number of the date of interest for each network (Array)
+		@returns:
+			a SUSPENSION_STATUSES number for each network (Array), following the earliest-listed suspension in effect on its date
+		"""
+		rows = np.asarray(rows, dtype = np.int64)
+		positions = np.searchsorted(self._status_keys, status_key(rows, np.asarray(days, dtype = np.int64)), side = 'right') - 1
+		# Dates before a network's first change, and networks that have never been suspended, land on another network's changes (or before all of them)
+		own = positions >= self.status_offsets[rows]
+		return np.where(own, self.status_codes[np.maximum(positions, 0)] if len(self.status_codes) > 0 else SUSPENSION_NONE, SUSPENSION_NONE).astype(np.int8)
+
+	def suspension_status(self, j, day):
+		"""
+		Describe whether a network is suspended on a given date
+		@params:
+			j           - Required  : the network's row number in the networks table (Int)
+			day         - Required  : day number of the date of interest (Int)
+		@returns:
+			'Total', 'Partial', or 'No' (Str), following the earliest-listed suspension in effect on that date
+		"""
+		position = np.searchsorted(self.status_days[self.status_offsets[j]:self.status_offsets[j+1]], day, side = 'right') - 1
+		if position < 0:
+			return 'No'
+		return SUSPENSION_STATUSES[self.status_codes[self.status_offsets[j] + position]]
+
+# Write a quick function for loading a networks_[YYYYMMDD].csv file
+def load_networks(file_path):
+	return NetworkTable(pd.read_csv(file_path))
+
+# Write a quick function for finding the most recent networks file created using snl.py
+# (Sub-directories without one yet, e.g. while snl.py is still downloading, are skipped)
+def latest_networks_file(directory = '../Data/SNL Downloads/'):
+	names = []
+	for name in os.listdir(directory):
+		if os.path.isfile(os.path.join(directory, name, 'networks_' + name + '.csv')):
+			try:
+				datetime.strptime(name, '%Y%m%d')
+				names.append(name)
+			except ValueError:
+				pass
+	return os.path.join(directory, max(names), 'networks_' + max(names) + '.csv')
@@ -6,6 +6,8 @@ import matplotlib.dates
 import matplotlib.patches as patches
 import pandas as pd
 import seaborn as sbs
+from networks import read_suspensions
+from catalog import read_satellite_catalog
 
 assessmentdate = '20230808'
 # Get a list of satcats
@@ -36,6 +38,11 @@ with open('../Data/Reference Files/SpaceTrackcountries.csv') as f:
 			ITUcountrycodes_list.append(row_list)
 SpaceTrackcountries_dict = {SpaceTrackcountries_list[i]: ITUcountrycodes_list[i] for i in range(len(SpaceTrackcountries_list))}
 
+# Import the list of networks once, rather than re-reading it for every satellite
+with open('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv') as f:
+	reader = csv.reader(f, delimiter=",")
+	network_rows = [row for row in reader if row[0].strip() != "Network Name"]
+
 # Create the dataset for the mini heat map
 color_dictionary = {
 	'n/a'	:	'lightgray',
@@ -44,15 +51,13 @@ color_dictionary = {
 	'Maybe' :	'khaki'
 }
 
+# Import the satellite catalog once, keyed by NORAD ID, rather than re-reading it for every satellite
+satellite_catalog = read_satellite_catalog()
+
 for satcat in satcats:
-	with open("../Data/Reference Files/satellitecatalog.csv") as f:
-		reader = csv.reader(f, delimiter=",")
-		for row in reader:
-			if row[0].strip() != 'COSPAR':
-				if row[1].strip() == satcat:
-					spacetrackcountry = row[3]
-					satname = row[2]
-					launchdate = datetime.strptime(row[4], '%m/%d/%y')
+	spacetrackcountry = satellite_catalog[satcat].country
+	satname = satellite_catalog[satcat].name
+	launchdate = satellite_catalog[satcat].launch_date
 	# Import the satellite's longitudinal values
 	newdates = []
 	datetimes = []
@@ -93,184 +98,175 @@ for satcat in satcats:
 	nonplanned_names_list = []
 	nonplanned_startdates_list = []
 	nonplanned_enddates_list = []
-	with open('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv') as f:
-		reader = csv.reader(f, delimiter=",")
-		for row in reader:
-			if row[0].strip() != "Network Name":
-				if (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[4].strip() == 'Non-Planned'):
-					nonplanned_long = float(row[1])
-					nonplanned_name = row[0].strip()
-					if row[6].strip() != 'n/a':
-						broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
-						# Check if the license has ever been suspended
-						if row[9].strip() == 'n/a':
+	for row in network_rows:
+		if (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[4].strip() == 'Non-Planned'):
+			nonplanned_long = float(row[1])
+			nonplanned_name = row[0].strip()
+			if row[6].strip() != 'n/a':
+				broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
+				# Check if the license has ever been suspended
+				if row[9].strip() == 'n/a':
+					nonplanned_names_list.append(nonplanned_name)
+					nonplanned_startdates_list.append(broughtintouse_date)
+					# nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+					nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+					if nonplanned_long < -180:
+						nonplanned_long += 360
+						nonplanned_longs_list.append(nonplanned_long)
+					else:
+						nonplanned_longs_list.append(nonplanned_long)
+				else:
+					suspension_list = read_suspensions(row[9])
+					for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
+						suspension_type, suspension_start, suspension_end = suspension
+						# Consider the periods before or after any suspensions
+						if k == 0:
 							nonplanned_names_list.append(nonplanned_name)
 							nonplanned_startdates_list.append(broughtintouse_date)
-							# nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-							nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+							nonplanned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
+							if nonplanned_long < -180:
+								nonplanned_long += 360
+								nonplanned_longs_list.append(nonplanned_long)
+							else:
+								nonplanned_longs_list.append(nonplanned_long) 
+						if k == len(suspension_list) - 1:
+							if suspension_end != 'n/a':
+								nonplanned_names_list.append(nonplanned_name)
+								nonplanned_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
+								# nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+								nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+								if nonplanned_long < -180:
+									nonplanned_long += 360
+									nonplanned_longs_list.append(nonplanned_long)
+								else:
+									nonplanned_longs_list.append(nonplanned_long)
+						# Consider the period between suspensions
+						if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
+							nonplanned_names_list.append(nonplanned_name)
+							nonplanned_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
+							nonplanned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
 							if nonplanned_long < -180:
 								nonplanned_long += 360
 								nonplanned_longs_list.append(nonplanned_long)
 							else:
 								nonplanned_longs_list.append(nonplanned_long)
-						else:
-							suspension_list = eval(row[9].strip())
-							for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
-								suspension_type, suspension_start, suspension_end = suspension
-								# Consider the periods before or after any suspensions
-								if k == 0:
-									nonplanned_names_list.append(nonplanned_name)
-									nonplanned_startdates_list.append(broughtintouse_date)
-									nonplanned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-									if nonplanned_long < -180:
-										nonplanned_long += 360
-										nonplanned_longs_list.append(nonplanned_long)
-									else:
-										nonplanned_longs_list.append(nonplanned_long) 
-								if k == len(suspension_list) - 1:
-									if suspension_end != 'n/a':
-										nonplanned_names_list.append(nonplanned_name)
-										nonplanned_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
-										# nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-										nonplanned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
-										if nonplanned_long < -180:
-											nonplanned_long += 360
-											nonplanned_longs_list.append(nonplanned_long)
-										else:
-											nonplanned_longs_list.append(nonplanned_long)
-								# Consider the period between suspensions
-								if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
-									nonplanned_names_list.append(nonplanned_name)
-									nonplanned_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
-									nonplanned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-									if nonplanned_long < -180:
-										nonplanned_long += 360
-										nonplanned_longs_list.append(nonplanned_long)
-									else:
-										nonplanned_longs_list.append(nonplanned_long)
-								last_suspension_end = suspension_end
+						last_suspension_end = suspension_end
 
 	# Now let's make a list of all the unique longitudinal positions for which the satellite's administration holds an active, planned space network
 	planned_longs_list = []
 	planned_names_list = []
 	planned_startdates_list = []
 	planned_enddates_list = []
-	with open('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv') as f:
-		reader = csv.reader(f, delimiter=",")
-		for row in reader:
-			if row[0].strip() != "Network Name":
-				if (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[4].strip() == 'Planned'):
-					planned_long = float(row[1])
-					planned_name = row[0].strip()
-					if row[6].strip() != 'n/a':
-						broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
-						# Check if the license has ever been suspended
-						if row[9].strip() == 'n/a':
+	for row in network_rows:
+		if (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[4].strip() == 'Planned'):
+			planned_long = float(row[1])
+			planned_name = row[0].strip()
+			if row[6].strip() != 'n/a':
+				broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
+				# Check if the license has ever been suspended
+				if row[9].strip() == 'n/a':
+					planned_names_list.append(planned_name)
+					planned_startdates_list.append(broughtintouse_date)
+					# planned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+					planned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+					if planned_long < -180:
+						planned_long += 360
+						planned_longs_list.append(planned_long)
+					else:
+						planned_longs_list.append(planned_long)
+				else:
+					suspension_list = read_suspensions(row[9])
+					for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
+						suspension_type, suspension_start, suspension_end = suspension
+						# Consider the periods before or after any suspensions
+						if k == 0:
 							planned_names_list.append(planned_name)
 							planned_startdates_list.append(broughtintouse_date)
-							# planned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-							planned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+							planned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
 							if planned_long < -180:
 								planned_long += 360
 								planned_longs_list.append(planned_long)
 							else:
+								planned_longs_list.append(planned_long) 
+						if k == len(suspension_list) - 1:
+							if suspension_end != 'n/a':
+								planned_names_list.append(planned_name)
+								planned_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
+								# planned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+								planned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+								if planned_long < -180:
+									planned_long += 360
+									planned_longs_list.append(planned_long)
+								else:
+									planned_longs_list.append(planned_long)
+						# Consider the period between suspensions
+						if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
+							planned_names_list.append(planned_name)
+							planned_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
+							planned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
+							if planned_long < -180:
+								planned_long += 360
 								planned_longs_list.append(planned_long)
-						else:
-							suspension_list = eval(row[9].strip())
-							for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
-								suspension_type, suspension_start, suspension_end = suspension
-								# Consider the periods before or after any suspensions
-								if k == 0:
-									planned_names_list.append(planned_name)
-									planned_startdates_list.append(broughtintouse_date)
-									planned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-									if planned_long < -180:
-										planned_long += 360
-										planned_longs_list.append(planned_long)
-									else:
-										planned_longs_list.append(planned_long) 
-								if k == len(suspension_list) - 1:
-									if suspension_end != 'n/a':
-										planned_names_list.append(planned_name)
-										planned_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
-										# planned_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-										planned_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
-										if planned_long < -180:
-											planned_long += 360
-											planned_longs_list.append(planned_long)
-										else:
-											planned_longs_list.append(planned_long)
-								# Consider the period between suspensions
-								if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
-									planned_names_list.append(planned_name)
-									planned_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
-									planned_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-									if planned_long < -180:
-										planned_long += 360
-										planned_longs_list.append(planned_long)
-									else:
-										planned_longs_list.append(planned_long)
-								last_suspension_end = suspension_end
+							else:
+								planned_longs_list.append(planned_long)
+						last_suspension_end = suspension_end
 
 	# Now let's make a list of all the unique longitudinal positions for which the satellite's administration holds a space network grandfathered in to the station-keeping rules
 	grandfathered_longs_list = []
 	grandfathered_names_list = []
 	grandfathered_startdates_list = []
 	grandfathered_enddates_list = []
-	with open('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv') as f:
-		reader = csv.reader(f, delimiter=",")
-		for row in reader:
-			if row[0].strip() != "Network Name":
-				if ((row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[6].strip() != 'n/a' and datetime.strptime(row[6].strip(), '%Y-%m-%d') < datetime(1982, 1, 1)) or (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[6].strip() != 'n/a' and datetime.strptime(row[6].strip(), '%Y-%m-%d') < datetime(1987, 1, 1) and row[8].strip() != 'n/a' and datetime.strptime(row[8].strip(), '%Y-%m-%d') < datetime(1982, 1, 1))):
-					grandfathered_long = float(row[1])
-					grandfathered_name = row[0].strip()
-					broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
-					# Check if the license has ever been suspended
-					if row[9].strip() == 'n/a':
+	for row in network_rows:
+		if ((row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[6].strip() != 'n/a' and datetime.strptime(row[6].strip(), '%Y-%m-%d') < datetime(1982, 1, 1)) or (row[2].strip() in SpaceTrackcountries_dict[spacetrackcountry] and row[6].strip() != 'n/a' and datetime.strptime(row[6].strip(), '%Y-%m-%d') < datetime(1987, 1, 1) and row[8].strip() != 'n/a' and datetime.strptime(row[8].strip(), '%Y-%m-%d') < datetime(1982, 1, 1))):
+			grandfathered_long = float(row[1])
+			grandfathered_name = row[0].strip()
+			broughtintouse_date = datetime.strptime(row[6].strip(), '%Y-%m-%d')
+			# Check if the license has ever been suspended
+			if row[9].strip() == 'n/a':
+				grandfathered_names_list.append(grandfathered_name)
+				grandfathered_startdates_list.append(broughtintouse_date)
+				# grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+				grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+				if grandfathered_long < -180:
+					grandfathered_long += 360
+					grandfathered_longs_list.append(grandfathered_long)
+				else:
+					grandfathered_longs_list.append(grandfathered_long)
+			else:
+				suspension_list = read_suspensions(row[9])
+				for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
+					suspension_type, suspension_start, suspension_end = suspension
+					# Consider the periods before or after any suspensions
+					if k == 0:
 						grandfathered_names_list.append(grandfathered_name)
 						grandfathered_startdates_list.append(broughtintouse_date)
-						# grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-						grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%Y-%m-%d'))
+						tier3a_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
 						if grandfathered_long < -180:
 							grandfathered_long += 360
 							grandfathered_longs_list.append(grandfathered_long)
 						else:
+							grandfathered_longs_list.append(grandfathered_long) 
+					if k == len(suspension_list) - 1:
+						if suspension_end != 'n/a':
+							grandfathered_names_list.append(grandfathered_name)
+							grandfathered_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
+							grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
+							if grandfathered_long < -180:
+								grandfathered_long += 360
+								grandfathered_longs_list.append(grandfathered_long)
+							else:
+								grandfathered_longs_list.append(grandfathered_long)
+					# Consider the period between suspensions
+					if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
+						grandfathered_names_list.append(tier3_name)
+						grandfathered_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
+						grandfathered_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
+						if grandfathered_long < -180:
+							grandfathered_long += 360
 							grandfathered_longs_list.append(grandfathered_long)
-					else:
-						suspension_list = eval(row[9].strip())
-						for suspension, k in zip(suspension_list[::-1], np.arange(len(suspension_list[::-1]))):
-							suspension_type, suspension_start, suspension_end = suspension
-							# Consider the periods before or after any suspensions
-							if k == 0:
-								grandfathered_names_list.append(grandfathered_name)
-								grandfathered_startdates_list.append(broughtintouse_date)
-								tier3a_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-								if grandfathered_long < -180:
-									grandfathered_long += 360
-									grandfathered_longs_list.append(grandfathered_long)
-								else:
-									grandfathered_longs_list.append(grandfathered_long) 
-							if k == len(suspension_list) - 1:
-								if suspension_end != 'n/a':
-									grandfathered_names_list.append(grandfathered_name)
-									grandfathered_startdates_list.append(datetime.strptime(suspension_end, '%Y-%m-%d'))
-									grandfathered_enddates_list.append(datetime.strptime(dates[-1], '%m/%d/%y'))
-									if grandfathered_long < -180:
-										grandfathered_long += 360
-										grandfathered_longs_list.append(grandfathered_long)
-									else:
-										grandfathered_longs_list.append(grandfathered_long)
-							# Consider the period between suspensions
-							if (k != 0 and suspension_start > last_suspension_end and suspension_start != 'n/a'):
-								grandfathered_names_list.append(tier3_name)
-								grandfathered_startdates_list.append(datetime.strptime(last_suspension_end, '%Y-%m-%d'))
-								grandfathered_enddates_list.append(datetime.strptime(suspension_start, '%Y-%m-%d'))
-								if grandfathered_long < -180:
-									grandfathered_long += 360
-									grandfathered_longs_list.append(grandfathered_long)
-								else:
-									grandfathered_longs_list.append(grandfathered_long)
-							last_suspension_end = suspension_end
+						else:
+							grandfathered_longs_list.append(grandfathered_long)
+					last_suspension_end = suspension_end
 
 	# Read in compliance results
 	hardstartdate = '2016-11-03'
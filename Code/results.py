@@ -0,0 +1,211 @@
+"""
+Name: 			results.py
+Description:
+				Shared helpers for saving the compliance results of a historical compliance assessment.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				n/a
+Outputs:
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_[satcat]_[YYYYMMDD].csv
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_[YYYYMMDD].csv (optional)
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_long_[YYYYMMDD].parquet or .csv (optional)
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Compliance Assessments/compliance_codes_[YYYYMMDD].csv (optional)
+				../Data/Historical Analysis/[YYYYMMDD]/Checkpoints/[satcat].npz (while an assessment is running)
+"""
+
+## Each satellite's results file is written in one pass through one open file, with its rows built from whole columns at once, rather than re-opening the file for every date.
+## The results for every satellite can also be saved together in one file, with one row per date and one column per satellite, which is quicker to load for analyses that span the whole GEO population.
+## For analyses that group results by year, administration, or network, every satellite's results can also be saved in one long table, with one row per satellite per date: its longitude, its VERDICTS and NOTES numbers, the network behind its assessment, and that network's longitudinal distance. Rows without a longitudinal position, whose assessment is always 'n/a', are left out. If pyarrow is installed, the table is saved as a Parquet file, with each row group holding dates from a single year, so a query about a few years only reads those years; otherwise it's saved as a CSV file. The text of each VERDICTS and NOTES number is saved beside it.
+## A long assessment period can be read and assessed a block of dates at a time, in which case each block's rows are added to the end of the results files as soon as the block is finished, rather than holding every date's results until the end.
+## A historical assessment can run for more than a day. As each satellite is assessed, its assessment is saved in a small checkpoint file, so that a run that stops partway through can be picked up again without re-assessing the satellites it already finished. Each checkpoint records which networks file (by name and contents) and which due-diligence match data it was made from, since its best networks are row numbers into that networks file; if snl.py has made a newer networks file since, the satellite is assessed again. Every file here is written under a temporary name and only renamed once it's complete (for results files, once their last block of dates has been added), so a run that's killed part way through writing never leaves a half-written file behind.
+
+import contextlib
+import csv
+import hashlib
+import json
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+from assessment import VERDICTS, NOTES, VERDICT_TEXT, NOTE_TEXT, NO_NETWORK
+from networks import longitudinal_distance
+# pyarrow is only needed to save the long table as a Parquet file
+try:
+	import pyarrow
+	import pyarrow.parquet
+except ImportError:
+	pyarrow = None
+
+# Write a list of the columns of one satellite's results file, in order
+SATELLITE_RESULTS_COLUMNS = ['Date', 'Longitude', 'Compliance Assessment', 'Note']
+
+# Write a list of the columns of the long table of results, in order
+LONG_RESULTS_COLUMNS = ['Date', 'NORAD ID', 'Longitude', 'Verdict Code', 'Note Code', 'Network', 'Longitudinal Distance']
+
+# Write a quick function for writing a file under a temporary name, and only giving it its real name once it's complete
+@contextlib.contextmanager
+def atomic_open(file_path, mode = 'w'):
+	temporary_path = file_path + '.tmp'
+	try:
+		with open(temporary_path, mode) as f:
+			yield f
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(temporary_path, file_path)
+	finally:
+		if os.path.exists(temporary_path):
+			os.remove(temporary_path)
+
+# Write a quick function for saving one satellite's compliance results, with one row per date, under a temporary name until finish_results() is called
+# (Pass append = True to add another block of dates to the end of the results already saved)
+def write_satellite_results(file_path, dates, longitudes, verdicts, notes, append = False):
+	with open(file_path + '.tmp', 'a' if append else 'w') as csvfile:
+		writer = csv.writer(csvfile)
+		if not append:
+			writer.writerow(SATELLITE_RESULTS_COLUMNS)
+		writer.writerows(zip(dates, longitudes, VERDICT_TEXT[verdicts].tolist(), NOTE_TEXT[notes].tolist()))
+
+# Write a quick function for saving every satellite's compliance assessments in one file, with one row per date and one column per satellite, under a temporary name until finish_results() is called
+def write_results_matrix(file_path, dates, satcats, verdicts, append = False):
+	with open(file_path + '.tmp', 'a' if append else 'w') as csvfile:
+		writer = csv.writer(csvfile)
+		if not append:
+			writer.writerow(['Date'] + [str(satcat) for satcat in satcats])
+		for date, row in zip(dates, VERDICT_TEXT[verdicts].tolist()):
+			writer.writerow([date] + row)
+
+# Write a quick function for giving a results file its real name, once every block of dates has been saved
+# (If no block of dates was saved, e.g. because the longitudes file has no dates, the file is given just its header)
+def finish_results(file_path, header):
+	if not os.path.exists(file_path + '.tmp'):
+		with open(file_path + '.tmp', 'w') as csvfile:
+			csv.writer(csvfile).writerow(header)
+	with open(file_path + '.tmp', 'a') as f:
+		os.fsync(f.fileno())
+	os.replace(file_path + '.tmp', file_path)
+
+# Write a quick function for describing the networks file and due-diligence match data an assessment is made from, as the networks file's name and a hash of its contents, and the match data's directory
+def checkpoint_source(networks_file, duediligence_directory):
+	digest = hashlib.sha256()
+	with open(networks_file, 'rb') as f:
+		for chunk in iter(lambda: f.read(1 << 20), b''):
+			digest.update(chunk)
+	return os.path.basename(networks_file) + ' ' + digest.hexdigest() + ' ' + os.path.basename(os.path.normpath(duediligence_directory))
+
+# Write a quick function for saving one satellite's assessment, before it's compared with its neighbors, so that an interrupted run can skip it next time
+def write_checkpoint(directory, satcat, longitudes, verdicts, notes, best_networks, shortlists, source):
+	with atomic_open(os.path.join(directory, str(satcat) + '.npz'), 'wb') as f:
+		np.savez(f, longitudes = longitudes, verdicts = verdicts, notes = notes, best_networks = best_networks, shortlists = shortlists, source = np.array(source))
+
+# Write a quick function for reading one satellite's saved assessment, or None if it wasn't saved, was made from different longitudinal positions, networks, or due-diligence match data, or is missing shortlists that are needed
+def read_checkpoint(directory, satcat, longitudes, shortlists, source):
+	file_path = os.path.join(directory, str(satcat) + '.npz')
+	if not os.path.isfile(file_path):
+		return None
+	try:
+		with np.load(file_path) as checkpoint:
+			if str(checkpoint['source']) != source:
+				return None
+			if not np.array_equal(checkpoint['longitudes'], longitudes, equal_nan = True):
+				return None
+			if (shortlists and not checkpoint['shortlists']):
+				return None
+			return checkpoint['verdicts'], checkpoint['notes'], checkpoint['best_networks']
+	except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+		return None
+
+# Write a quick function for saving the text of each VERDICTS and NOTES number, for reading the long table of results
+def write_result_codes(file_path):
+	with atomic_open(file_path) as csvfile:
+		writer = csv.writer(csvfile)
+		writer.writerow(['Code Type', 'Code', 'Text'])
+		writer.writerows([('Verdict', code, text) for code, text in enumerate(VERDICTS)] + [('Note', code, text) for code, text in enumerate(NOTES)])
+
+class LongResultsWriter:
+	"""
+	Saves every satellite's compliance assessments in one long table, with one row per satellite per date with a longitudinal position, a block of dates at a time
+	@params:
+		file_path       - Required  : path to the table, without its extension: '.parquet' is added if pyarrow is installed, '.csv' otherwise (Str)
+		network_table   - Required  : the networks the assessments were made against, loaded with networks.load_networks() (NetworkTable)
+	"""
+	def __init__(self, file_path, network_table):
+		self.parquet = pyarrow is not None
+		self.file_path = file_path + ('.parquet' if self.parquet else '.csv')
+		self.network_table = network_table
+		# Look up network names by row number, with the extra last entry standing in for NO_NETWORK
+		self._network_names = np.array(network_table.names + [None], dtype = object)
+		self._writer = None
+		if self.parquet:
+			self._schema = pyarrow.schema([
+				('Date', pyarrow.date32()),
+				('NORAD ID', pyarrow.string()),
+				('Longitude', pyarrow.float64()),
+				('Verdict Code', pyarrow.int8()),
+				('Note Code', pyarrow.int8()),
+				('Network', pyarrow.string()),
+				('Longitudinal Distance', pyarrow.float64())
+				], metadata = {'verdicts': json.dumps(VERDICTS), 'notes': json.dumps(NOTES)})
+			self._writer = pyarrow.parquet.ParquetWriter(self.file_path + '.tmp', self._schema)
+		else:
+			with open(self.file_path + '.tmp', 'w') as csvfile:
+				csv.writer(csvfile).writerow(LONG_RESULTS_COLUMNS)
+
+	def write(self, dates, satcats, longitudes, verdicts, notes, best_networks):
+		"""
+		Add a block of dates to the table
+		@params:
+			dates           - Required  : the dates, as 'YYYY-MM-DD' strings, in order (List)
+			satcats         - Required  : the satellites' NORAD IDs (List)
+			longitudes      - Required  : longitudinal positions, NaN if unknown, with one row per date and one column per satellite (Array)
+			verdicts        - Required  : VERDICTS numbers, in the same layout (Array)
+			notes           - Required  : NOTES numbers, in the same layout (Array)
+			best_networks   - Required  : row numbers of the networks behind the assessments, or NO_NETWORK, in the same layout (Array)
+		"""
+		# Lay the block out one date after another, keeping only the satellites with a longitudinal position
+		date_rows, satellite_columns = np.nonzero(~np.isnan(longitudes))
+		block_longitudes = longitudes[date_rows, satellite_columns]
+		block_networks = best_networks[date_rows, satellite_columns]
+		columns = {
+			'Date': np.asarray(dates, dtype = 'datetime64[D]')[date_rows],
+			'NORAD ID': np.array([str(satcat) for satcat in satcats], dtype = object)[satellite_columns],
+			'Longitude': block_longitudes,
+			'Verdict Code': verdicts[date_rows, satellite_columns].astype(np.int8),
+			'Note Code': notes[date_rows, satellite_columns].astype(np.int8),
+			'Network': self._network_names[block_networks],
+			'Longitudinal Distance': np.where(block_networks != NO_NETWORK, longitudinal_distance(self.network_table.longitudes[block_networks], block_longitudes), np.nan)
+			}
+		if self.parquet:
+			# Start a new row group whenever the year changes, so no row group holds more than one year
+			years = columns['Date'].astype('datetime64[Y]')
+			starts = np.flatnonzero(np.concatenate([[True], years[1:] != years[:-1]])) if len(years) > 0 else np.array([], dtype = int)
+			for start, end in zip(starts, np.append(starts[1:], len(years))):
+				self._writer.write_table(pyarrow.table({column: values[start:end] for column, values in columns.items()}, schema = self._schema), row_group_size = end - start)
+		else:
+			with open(self.file_path + '.tmp', 'a') as csvfile:
+				csv.writer(csvfile).writerows(zip(
+					columns['Date'].astype(str).tolist(),
+					columns['NORAD ID'].tolist(),
+					columns['Longitude'].tolist(),
+					columns['Verdict Code'].tolist(),
+					columns['Note Code'].tolist(),
+					['' if network is None else network for network in columns['Network'].tolist()],
+					['' if np.isnan(distance) else round(distance, 6) for distance in columns['Longitudinal Distance'].tolist()]
+					))
+
+	def close(self):
+		"""
+		Finish the table and give it its real name
+		"""
+		if self._writer is not None:
+			self._writer.close()
+		finish_results(self.file_path, LONG_RESULTS_COLUMNS)
+
+# Write a quick function for reading a long table of results saved by LongResultsWriter, from either file type
+def read_long_results(file_path):
+	if file_path.endswith('.parquet'):
+		df_results = pd.read_parquet(file_path)
+		df_results['Date'] = pd.to_datetime(df_results['Date'])
+		return df_results
+	return pd.read_csv(file_path, dtype = {'NORAD ID': str, 'Verdict Code': np.int8, 'Note Code': np.int8, 'Network': str}, parse_dates = ['Date'])
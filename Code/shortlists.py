@@ -0,0 +1,169 @@
+"""
+Name: 			shortlists.py
+Description:
+				Keeps every nearby shortlist from a historical compliance assessment in one SQLite file, and looks them up again by satellite and date.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/shortlists_[YYYYMMDD].sqlite
+Outputs:
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/shortlists_[YYYYMMDD].sqlite
+				../Data/Historical Analysis/[YYYYMMDD]/Historical Nearby Shortlists/[YYYYMMDD]/nearbyshortlist_[satcat]_[YYYYMMDD].csv (optional)
+"""
+
+## A historical assessment produces one shortlist per satellite per date, which used to mean one small CSV file each, in one sub-directory per date: potentially millions of files. Instead, every shortlist's rows are kept in one table, with the date and NORAD ID they belong to. Rows are held in memory and written a batch at a time, and the table is only indexed once the rows have been written, when the first shortlist is looked up or the file is closed.
+## The columns are stored as the same text the CSV files held, so a shortlist read back from the table, or exported to the old file layout, matches the CSV file that would have been written.
+
+import itertools
+import os
+import sqlite3
+import pandas as pd
+from assessment import SHORTLIST_COLUMNS
+
+# Write a quick function for writing dates (datetimes, 'YYYY-MM-DD' strings, or 'YYYYMMDD' strings) the way the table stores them
+def shortlist_date(date):
+	return pd.Timestamp(date).strftime('%Y-%m-%d')
+
+class ShortlistStore:
+	"""
+	Stores nearby shortlists in a SQLite file, keyed by date and NORAD ID
+	@params:
+		file_path   - Required  : path to the SQLite file, created if it doesn't exist (Str)
+		batch_size  - Optional  : number of rows to hold in memory before writing them to the file (Int)
+	"""
+	def __init__(self, file_path, batch_size = 100000):
+		self.file_path = file_path
+		self.batch_size = batch_size
+		self._rows = []
+		self._keys = []
+		self._indexed = False
+		self._connection = sqlite3.connect(file_path)
+		# Write ahead to a log, so that a run that stops partway through never leaves the file half-written
+		self._connection.execute('PRAGMA journal_mode = WAL')
+		self._connection.execute('PRAGMA synchronous = NORMAL')
+		self._connection.execute('CREATE TABLE IF NOT EXISTS shortlists (date TEXT NOT NULL, satcat TEXT NOT NULL, position INTEGER NOT NULL, ' + ', '.join('"' + column + '" TEXT' for column in SHORTLIST_COLUMNS) + ')')
+		# Shortlists with no networks have no rows, so every shortlist's date and NORAD ID are also kept in a table of their own
+		self._connection.execute('CREATE TABLE IF NOT EXISTS shortlist_keys (date TEXT NOT NULL, satcat TEXT NOT NULL)')
+		self._connection.commit()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def close(self):
+		"""
+		Write any rows still held in memory, index the table, and close the file
+		"""
+		self._index()
+		self._connection.close()
+
+	def add(self, date, satcat, shortlist):
+		"""
+		Add a satellite's shortlist for one date
+		@params:
+			date        - Required  : date of the shortlist (Str or Datetime)
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+			shortlist   - Required  : the shortlist's columns, keyed by SHORTLIST_COLUMNS, e.g. from assessment.nearby_shortlist_columns() (Dict or DataFrame)
+		"""
+		date = shortlist_date(date)
+		satcat = str(satcat)
+		self._keys.append((date, satcat))
+		columns = [list(shortlist[column]) for column in SHORTLIST_COLUMNS]
+		for position, row in enumerate(zip(*columns)):
+			self._rows.append((date, satcat, position) + row)
+		if len(self._rows) >= self.batch_size:
+			self.flush()
+
+	def flush(self):
+		"""
+		Write the rows held in memory to the file
+		"""
+		if len(self._keys) == 0:
+			return
+		self._connection.executemany('INSERT INTO shortlists VALUES (' + ', '.join(['?']*(3 + len(SHORTLIST_COLUMNS))) + ')', self._rows)
+		self._connection.executemany('INSERT INTO shortlist_keys VALUES (?, ?)', self._keys)
+		self._connection.commit()
+		self._rows = []
+		self._keys = []
+
+	def _index(self):
+		# Index the tables once, after the rows written so far, rather than updating the indexes with every batch
+		self.flush()
+		if not self._indexed:
+			self._connection.execute('CREATE INDEX IF NOT EXISTS shortlists_satcat_date ON shortlists (satcat, date, position)')
+			self._connection.execute('CREATE INDEX IF NOT EXISTS shortlist_keys_satcat_date ON shortlist_keys (satcat, date)')
+			self._connection.commit()
+			self._indexed = True
+
+	def remove(self, satcat):
+		"""
+		Remove every shortlist for a satellite, e.g. one that an interrupted run didn't finish
+		@params:
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+		"""
+		self._index()
+		self._connection.execute('DELETE FROM shortlists WHERE satcat = ?', (str(satcat),))
+		self._connection.execute('DELETE FROM shortlist_keys WHERE satcat = ?', (str(satcat),))
+		self._connection.commit()
+
+	def shortlist(self, satcat, date):
+		"""
+		Look up a satellite's shortlist for one date
+		@params:
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+			date        - Required  : date of the shortlist (Str or Datetime)
+		@returns:
+			the shortlist, sorted by longitudinal distance, or None if there's no shortlist for that satellite and date (DataFrame)
+		"""
+		self._index()
+		rows = self._connection.execute('SELECT ' + ', '.join('"' + column + '"' for column in SHORTLIST_COLUMNS) + ' FROM shortlists WHERE satcat = ? AND date = ? ORDER BY position', (str(satcat), shortlist_date(date))).fetchall()
+		if (len(rows) == 0 and not self.has_shortlist(satcat, date)):
+			return None
+		return pd.DataFrame(rows, columns = SHORTLIST_COLUMNS)
+
+	def has_shortlist(self, satcat, date):
+		"""
+		Check whether a satellite has a shortlist for one date
+		@params:
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+			date        - Required  : date of the shortlist (Str or Datetime)
+		@returns:
+			True or False (Bool)
+		"""
+		self._index()
+		return self._connection.execute('SELECT 1 FROM shortlist_keys WHERE satcat = ? AND date = ? LIMIT 1', (str(satcat), shortlist_date(date))).fetchone() is not None
+
+	def dates(self, satcat):
+		"""
+		List the dates on which a satellite has a shortlist
+		@params:
+			satcat      - Required  : the satellite's NORAD ID (Str or Int)
+		@returns:
+			the dates, as 'YYYY-MM-DD' strings, in order (List)
+		"""
+		self._index()
+		return [row[0] for row in self._connection.execute('SELECT date FROM shortlist_keys WHERE satcat = ? ORDER BY date', (str(satcat),))]
+
+	def export_csv(self, directory):
+		"""
+		Write every shortlist as its own CSV file, in one sub-directory per date
+		@params:
+			directory   - Required  : directory to hold the [YYYYMMDD]/nearbyshortlist_[satcat]_[YYYYMMDD].csv files (Str)
+		"""
+		self._index()
+		# Read every row in one pass, in the same order as the shortlists, rather than looking each shortlist up on its own
+		rows = self._connection.execute('SELECT date, satcat, ' + ', '.join('"' + column + '"' for column in SHORTLIST_COLUMNS) + ' FROM shortlists ORDER BY date, satcat, position')
+		shortlist_rows = itertools.groupby(rows, key = lambda row: (row[0], row[1]))
+		next_shortlist = next(shortlist_rows, None)
+		for date, satcat in self._connection.execute('SELECT date, satcat FROM shortlist_keys ORDER BY date, satcat').fetchall():
+			if (next_shortlist is not None and next_shortlist[0] == (date, satcat)):
+				df_nearbyshortlist = pd.DataFrame([row[2:] for row in next_shortlist[1]], columns = SHORTLIST_COLUMNS)
+				next_shortlist = next(shortlist_rows, None)
+			else:
+				df_nearbyshortlist = pd.DataFrame([], columns = SHORTLIST_COLUMNS)
+			date_directory = os.path.join(directory, date.replace('-', ''))
+			os.makedirs(date_directory, exist_ok = True)
+			df_nearbyshortlist.to_csv(os.path.join(date_directory, 'nearbyshortlist_' + satcat + '_' + date.replace('-', '') + '.csv'), index = None)
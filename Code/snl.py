@@ -13,47 +13,65 @@ Output:			../Data/SNL Downloads/[YYYYMMDD]/networks_[YYYYMMDD].csv
 import os
 from datetime import datetime
 import csv
-import numpy as np
 import pandas as pd
-import urllib.request
 from bs4 import BeautifulSoup
+import argparse
+from snl_fetch import fetch_all, fetch_each
+from snl_cache import ResponseCache
+from snl_networks import read_name_changes, list_networks, assemble_networks
+from results import atomic_open
+import snl_unplanned_scrape, snl_planned_scrape, snl_broughtintouse_download, snl_suspended_download, snl_namechange_download
 
 # Choose a date to run the assessment
 assessmentdate = datetime.today().strftime('%Y%m%d')
 
+# Choose how to download from the SNL
+parser = argparse.ArgumentParser(description = 'Download network information from the ITU Space Network List.')
+parser.add_argument('--connections', type = int, default = 5, help = 'maximum number of connections open to the ITU at once (default: 5)')
+parser.add_argument('--timeout', type = float, default = 120, help = 'seconds to wait for each attempt at downloading a page (default: 120)')
+parser.add_argument('--retries', type = int, default = 3, help = 'number of times to retry a page after a failed attempt (default: 3)')
+parser.add_argument('--rate', type = float, default = 5, help = 'maximum number of network pages to request from the ITU per second (default: 5)')
+parser.add_argument('--resume', action = 'store_true', help = "keep today's sub-directory and carry on from the networks whose filing dates were already fetched")
+parser.add_argument('--cache-days', type = float, default = 7, help = 'days for which a cached network page is reused without asking the ITU again (default: 7)')
+parser.add_argument('--cache-size', type = float, default = 500, help = 'megabytes of network pages to keep cached before dropping the least-recently-used ones (default: 500)')
+parser.add_argument('--no-cache', action = 'store_true', help = 'download every network page, without reading or writing the cache')
+parser.add_argument('--changed-only', action = 'store_true', help = "only download the pages of networks whose rows in the non-planned or planned list changed since the previous SNL download, reusing cached pages for the rest whatever their age")
+parser.add_argument('--incremental', action = 'store_true', help = 'only rebuild the networks whose rows in the downloaded lists (or whose filing dates) changed since the previous SNL download, copying the rest from its networks file')
+parser.add_argument('--mirror', default = None, help = 'download every page from this address instead of the ITU, e.g. http://127.0.0.1:8000 for a local copy of saved SNL pages')
+args = parser.parse_args()
+
 ## The data on the ITU SNL may change as new filings are added or old filings are amended. Today's data should be saved in a sub-directory named with today'y date. 
 # Check whether today's subdirectory exists in the relevant SNL Downloads sub-directory
 MYDIR = ('../Data/SNL Downloads/' + assessmentdate)
 CHECK_FOLDER = os.path.isdir(MYDIR)
-# If it doesn't exist, then create it and run the scrape scripts.
+# If it doesn't exist, then create it.
 if not CHECK_FOLDER:
 	os.makedirs(MYDIR)
 	print("New sub-directory created: ", MYDIR)
-	os.system('python3 snl_unplanned_scrape.py')
-	print("The non-planned portion of the SNL has been scraped and saved.")
-	os.system('python3 snl_planned_scrape.py')
-	print("The planned portion of the SNL has been scraped and saved.")
-	os.system('python3 snl_broughtintouse_download.py')
-	print("The SNL's brought-into-use data has been downloaded.")
-	os.system('python3 snl_suspended_download.py')
-	print("The SNL's suspension data has been downloaded.")
-	os.system('python3 snl_namechange_download.py')
-	print("The SNL's name-change data has been downloaded.")
-# If it does exist, clear it (to avoid duplicates) and run the scrape scripts.
+# If it does exist and an earlier run is being resumed, keep it.
+elif args.resume:
+	print("Resuming from existing sub-directory: ", MYDIR)
+# If it does exist, clear it (to avoid duplicates).
 else:
 	for f in os.listdir(MYDIR):
 		os.remove(os.path.join(MYDIR, f))
 	print("Existing sub-directory emptied: ", MYDIR)	
-	os.system('python3 snl_unplanned_scrape.py')
-	print("The non-planned portion of the SNL has been scraped and saved.")
-	os.system('python3 snl_planned_scrape.py')
-	print("The planned portion of the SNL has been scraped and saved.")
-	os.system('python3 snl_broughtintouse_download.py')
-	print("The SNL's brought-into-use data has been downloaded.")
-	os.system('python3 snl_suspended_download.py')
-	print("The SNL's suspension data has been downloaded.")
-	os.system('python3 snl_namechange_download.py')
-	print("The SNL's name-change data has been downloaded.")
+
+## Download the five SNL lists at the same time and save each one with its scrape script's save function
+sources = {
+	'unplanned': (snl_unplanned_scrape, "The non-planned portion of the SNL has been scraped and saved."),
+	'planned': (snl_planned_scrape, "The planned portion of the SNL has been scraped and saved."),
+	'broughtintouse': (snl_broughtintouse_download, "The SNL's brought-into-use data has been downloaded."),
+	'suspended': (snl_suspended_download, "The SNL's suspension data has been downloaded."),
+	'namechange': (snl_namechange_download, "The SNL's name-change data has been downloaded.")
+	}
+# (When resuming, keep the lists already downloaded so the networks match the filing dates already fetched)
+sources_paths = {name: MYDIR + '/snl_' + name + '_' + assessmentdate + '.csv' for name in sources}
+if not (args.resume and all(os.path.isfile(path) for path in sources_paths.values())):
+	sources_bodies, sources_timings = fetch_all({name: module.url for name, (module, message) in sources.items()}, connections = args.connections, timeout = args.timeout, retries = args.retries, base_url = args.mirror)
+	for name, (module, message) in sources.items():
+		module.save(sources_bodies[name], sources_paths[name])
+		print(message, '(' + str(len(sources_bodies[name])) + ' bytes in ' + f'{sources_timings[name]:.1f}' + ' s)')
 
 ## Create a quick dictionary for mapping ssn_ref symbols to filing types
 ssnref_list = []
@@ -66,187 +84,174 @@ with open("../Data/Reference Files/ssnrefs.csv") as f:
 			notifreasons_list.append(row[1])
 ssnref_dict = {ssnref_list[i]: notifreasons_list[i] for i in range(len(ssnref_list))}
 
-## Import the list of networks that have had their names changed
-newnames_list = []
-oldnames_list = []
-with open('../Data/SNL Downloads/' + assessmentdate + '/snl_namechange_' + assessmentdate + '.csv') as f:
-	reader = csv.reader(f, delimiter=",")
-	for row in reader:
-		if row[0] != 'New Name':
-			newnames_list.append(row[0])
-			oldnames_list.append(row[1])
-
-## Now let's organize the data into one easy-to-read file. 
-# Write lists that ranks the order of the various filing types that can be found in the unplanned and planned list by maturity. More mature filings types appear later in these lists.
-unplanned_types = ['n/a', 'A', 'U', 'C', 'N']
-planned_types = ['n/a', 'P', 'U', 'P/Plan/List', 'N']
-# Make a list of unplanned networks and their most-mature filing categories.
-unplanned_license_names = []
-unplanned_license_types = []
-with open('../Data/SNL Downloads/' + assessmentdate + '/snl_unplanned_' + assessmentdate + '.csv') as f:
-	reader = csv.reader(f, delimiter=",")
-	for row in reader:
-		if row[2] not in unplanned_license_names:
-			unplanned_license_names.append(row[2])
-			unplanned_license_types.append(row[3])
-		else: 
-			index = unplanned_license_names.index(row[2])
-			unplanned_license_types[index] = unplanned_types[max(unplanned_types.index(row[3]), unplanned_types.index(unplanned_license_types[index]))]
-# Make a list of planned networks and their most-mature filing categories.
-planned_license_names = []
-planned_license_types = []
-with open('../Data/SNL Downloads/' + assessmentdate + '/snl_planned_' + assessmentdate + '.csv') as f:
-	reader = csv.reader(f, delimiter=",")
-	for row in reader:
-		if row[2] not in planned_license_names:
-			planned_license_names.append(row[2])
-			planned_license_types.append(row[4])
-		else: 
-			index = planned_license_names.index(row[2])
-			planned_license_types[index] = planned_types[max(planned_types.index(row[4]), planned_types.index(planned_license_types[index]))]
-# Write a Pandas dataframe house the organized data
-df_licenses = pd.DataFrame(0, columns = ['Network Name', 'Longitude', 'ITU Administration', 'Previous Name', 'Planned or Non-Planned', 'Highest Maturity', 'Brought-into-Use Date', 'Late-Stage Filing Date', 'Early-Stage Filing Date', 'Suspensions', 'Link'], index = np.arange(len(planned_license_names) + len(unplanned_license_names)))
-# Drop in the lists of unique licenses
-df_licenses['Network Name'] = unplanned_license_names + planned_license_names
-df_licenses['Planned or Non-Planned'] = ['Non-Planned']*len(unplanned_license_names) + ['Planned']*len(planned_license_names)
-df_licenses['Highest Maturity'] = unplanned_license_types + planned_license_types 
-# Quickly import the four raw datasets
-df_planned = pd.read_csv('../Data/SNL Downloads/' + assessmentdate + '/snl_planned_' + assessmentdate + '.csv', header = None)
-df_unplanned = pd.read_csv('../Data/SNL Downloads/' + assessmentdate + '/snl_unplanned_' + assessmentdate + '.csv', header = None)
-df_broughtintouse = pd.read_csv('../Data/SNL Downloads/' + assessmentdate + '/snl_broughtintouse_' + assessmentdate + '.csv')
-df_suspended = pd.read_csv('../Data/SNL Downloads/' + assessmentdate + '/snl_suspended_' + assessmentdate + '.csv')
-# Fill in the rest of the dataframe
-for i in np.arange(len(df_licenses)):
-	print('Fetching network information for', df_licenses.at[i, 'Network Name'], '...')
-	if df_licenses.at[i, 'Planned or Non-Planned'] == 'Non-Planned':
-		for j in np.arange(len(df_unplanned)):
-			if (df_unplanned.iat[j, 2] == df_licenses.at[i, 'Network Name'] and df_unplanned.iat[j, 3] == df_licenses.at[i,'Highest Maturity']):
-				df_licenses.at[i, 'Longitude'] = df_unplanned.iat[j, 0]	
-				df_licenses.at[i, 'ITU Administration'] = df_unplanned.iat[j, 1]
-				df_licenses.at[i, 'Link'] = 'https:' + df_unplanned.iat[j, 6]
-	if df_licenses.at[i, 'Planned or Non-Planned'] == 'Planned':
-		for j in np.arange(len(df_planned)):
-			if (df_planned.iat[j, 2] == df_licenses.at[i, 'Network Name'] and df_planned.iat[j, 4] == df_licenses.at[i,'Highest Maturity']):
-				df_licenses.at[i, 'Longitude'] = df_planned.iat[j, 0]	
-				df_licenses.at[i, 'ITU Administration'] = df_planned.iat[j, 1]
-				df_licenses.at[i, 'Link'] = 'https:' + df_planned.iat[j, 7]
-	dates = []
-	for j in np.arange(len(df_broughtintouse)):
-		if str(df_broughtintouse.iat[j, 0]) == str(df_licenses.at[i, 'Network Name']):
-			dates.append(datetime.strptime(df_broughtintouse.iat[j, 4], '%d.%m.%Y'))
-	if len(dates) == 0:
-		df_licenses.at[i, 'Brought-into-Use Date'] = 'n/a'
-	else:
-		date = str(min(dates))[0:10] 
-		df_licenses.at[i, 'Brought-into-Use Date'] = date
-	df_licenses.at[i, 'Previous Name'] = 'n/a'
-	for j in np.arange(len(newnames_list)):
-		newname = newnames_list[j]
-		oldname = oldnames_list[j]
-		if df_licenses.at[i, 'Network Name'] == newname:
-			df_licenses.at[i, 'Previous Name'] = oldname
-	suspensions = []
-	for j in np.arange(len(df_suspended)):
-		suspension = []
-		if str(df_suspended.iat[j, 1]) == str(df_licenses.at[i, 'Network Name']):
-			suspension = [str(df_suspended.iat[j, 6]).strip()]
-			# Check if the suspension date field is filled
-			if len(str(df_suspended.iat[j, 8])) > 4:
-				suspension.append(str(datetime.strptime(df_suspended.iat[j, 8], '%d.%m.%Y'))[0:10])
-			if len(str(df_suspended.iat[j, 10])) > 4:
-				suspension.append(str(datetime.strptime(df_suspended.iat[j, 10], '%d.%m.%Y'))[0:10])
-			else:
-				suspension.append('n/a')
-		if (len(suspension) > 0 and suspension not in suspensions):
-			suspensions.append(suspension)
-	if suspensions == []:
-		df_licenses.at[i, 'Suspensions'] = 'n/a'
-	else:
-		df_licenses.at[i, 'Suspensions'] = suspensions
+## Write a quick function for finding a network's page on the SNL
+def network_url(name):
+	nameforlink = name.replace(' ', '%20')
+	nameforlink = nameforlink.replace('&', '%26')
+	return 'https://www.itu.int/net/ITU-R/space/snl/bresult/radvanceall.asp?sel_satname=' + nameforlink + '&sel_esname=&sel_adm=&sel_org=&sel_ific=&sel_year=&sel_date_from=&sel_date_to=&sel_rcpt_from=&sel_rcpt_to=&sel_orbit_from=&sel_orbit_to=&sup=&q_reference=&q_ref_numero=&q_sns_id=&res32=&norder=&nmod='
+
+## Write a quick function for grouping the rows of a downloaded list by network name, found in a given column
+def rows_by_network(file_path, column = 2):
+	rows = {}
+	with open(file_path) as f:
+		reader = csv.reader(f, delimiter=",")
+		for row in reader:
+			if len(row) > column:
+				rows.setdefault(row[column], []).append(row)
+	return rows
+
+## Write a quick function for finding a network's early- and late-stage filing dates on its page on the SNL
+def read_filing_dates(source):
+	earlystage_dates = []
+	latestage_dates = []
+	soup = BeautifulSoup(source,'html.parser')
+	tables = soup.find_all('table')
 
-	# Visit the network's associated page on the SNL and find its early- and late-stage filing dates
-	df_licenses.at[i, 'Early-Stage Filing Date'] = 'n/a'
-	df_licenses.at[i, 'Late-Stage Filing Date'] = 'n/a'
 	try:
-		earlystage_dates = []
-		latestage_dates = []
-		nameforlink = df_licenses.at[i, 'Network Name'].replace(' ', '%20')
-		nameforlink = nameforlink.replace('&', '%26')
-		url_network_textexport = 'https://www.itu.int/net/ITU-R/space/snl/bresult/radvanceall.asp?sel_satname=' + nameforlink + '&sel_esname=&sel_adm=&sel_org=&sel_ific=&sel_year=&sel_date_from=&sel_date_to=&sel_rcpt_from=&sel_rcpt_to=&sel_orbit_from=&sel_orbit_to=&sup=&q_reference=&q_ref_numero=&q_sns_id=&res32=&norder=&nmod='
-		source = urllib.request.urlopen(url_network_textexport).read()
-		soup = BeautifulSoup(source,'html.parser')
-		tables = soup.find_all('table')
-
-		try:
-			table_rows = tables[2].find_all('tr')
-			output_rows = []
-
-			for table_row in tables[2].findAll('tr'):
-				columns = table_row.findAll('td')
-				links = table_row.findAll('a')
-				output_row = []
-				for column in columns:
-					output_row.append(column.text)
-				for link in links:
-					output_row.append(link.get('href'))
-				if output_row[6].replace('\xa0', ' ').strip() != 'Date of receipt': 
-					ssn_ref = output_row[7].replace('\xa0', ' ').strip()
-					try:
-						notif_reason = ssnref_dict[ssn_ref]
-						if len(output_row[6].replace('\xa0', ' ').strip()) == 10:
-							if notif_reason != 'N':
-								earlystage_dates.append(datetime.strptime(output_row[6].replace('\xa0', ' ').strip(), '%d.%m.%Y'))
-							else:
-								latestage_dates.append(datetime.strptime(output_row[6].replace('\xa0', ' ').strip(), '%d.%m.%Y'))
-					except KeyError as keyerror:
-						print('An identified ssn_ref does not appear in the ssn_ref dictionary:', keyerror)
-		except IndexError:
-			pass
-		if len(earlystage_dates) != 0:
-			df_licenses.at[i, 'Early-Stage Filing Date'] = str(min(earlystage_dates))[0:10]
-		if len(latestage_dates) != 0:
-			df_licenses.at[i, 'Late-Stage Filing Date'] = str(min(latestage_dates))[0:10]
-	except UnicodeEncodeError:
+		table_rows = tables[2].find_all('tr')
+		output_rows = []
+
+		for table_row in tables[2].findAll('tr'):
+			columns = table_row.findAll('td')
+			links = table_row.findAll('a')
+			output_row = []
+			for column in columns:
+				output_row.append(column.text)
+			for link in links:
+				output_row.append(link.get('href'))
+			if output_row[6].replace('\xa0', ' ').strip() != 'Date of receipt': 
+				ssn_ref = output_row[7].replace('\xa0', ' ').strip()
+				try:
+					notif_reason = ssnref_dict[ssn_ref]
+					if len(output_row[6].replace('\xa0', ' ').strip()) == 10:
+						if notif_reason != 'N':
+							earlystage_dates.append(datetime.strptime(output_row[6].replace('\xa0', ' ').strip(), '%d.%m.%Y'))
+						else:
+							latestage_dates.append(datetime.strptime(output_row[6].replace('\xa0', ' ').strip(), '%d.%m.%Y'))
+				except KeyError as keyerror:
+					print('An identified ssn_ref does not appear in the ssn_ref dictionary:', keyerror)
+	except IndexError:
 		pass
+	earlystage_date = 'n/a'
+	latestage_date = 'n/a'
+	if len(earlystage_dates) != 0:
+		earlystage_date = str(min(earlystage_dates))[0:10]
+	if len(latestage_dates) != 0:
+		latestage_date = str(min(latestage_dates))[0:10]
+	return earlystage_date, latestage_date
+
+## Import the list of networks that have had their names changed
+newnames_list, oldnames_list = read_name_changes(MYDIR, assessmentdate)
+
+## Now let's organize the data into one easy-to-read file, starting with a list of every network and its most-mature filing category
+df_licenses = list_networks(MYDIR, assessmentdate)
+## Visit each network's associated page on the SNL and find its early- and late-stage filing dates
+# Every network's dates are saved to a file as soon as they're found, so that a run that stops partway through can be resumed with --resume
+filingdates_path = MYDIR + '/snl_filingdates_' + assessmentdate + '.csv'
+filing_dates = {}
+if (args.resume and os.path.isfile(filingdates_path)):
+	with open(filingdates_path) as f:
+		reader = csv.reader(f, delimiter=",")
+		for row in reader:
+			# Skip a last row left incomplete by a run that stopped while writing it
+			if (len(row) == 3 and all(date == 'n/a' or len(date) == 10 for date in row[1:])):
+				filing_dates[row[0]] = (row[1], row[2])
+	print('Filing dates already found for', len(filing_dates), 'networks.')
+# Networks whose names can't be written in a link (e.g. those with accented letters) keep 'n/a' filing dates
+network_urls = {}
+for name in df_licenses['Network Name']:
+	if (name not in filing_dates and name.isascii()):
+		network_urls[name] = network_url(name)
+# Networks' pages are kept in a cache between runs. With --changed-only, only the networks whose rows in the non-planned or planned list differ from the previous SNL download are asked for again.
+cache = None
+if not args.no_cache:
+	cache = ResponseCache('../Data/SNL Downloads/snl_cache.sqlite', ttl = args.cache_days*24*60*60, max_bytes = int(args.cache_size*1024*1024))
+max_ages = None
+if args.changed_only:
+	previous_dates = [date for date in os.listdir('../Data/SNL Downloads') if (date.isdigit() and date < assessmentdate and all(os.path.isfile('../Data/SNL Downloads/' + date + '/snl_' + name + '_' + date + '.csv') for name in ['unplanned', 'planned']))]
+	if len(previous_dates) == 0:
+		print('No previous SNL download to compare with: every network will be checked.')
+	else:
+		previousdate = max(previous_dates)
+		current_rows = {}
+		previous_rows = {}
+		for name in ['unplanned', 'planned']:
+			for network_name, rows in rows_by_network(MYDIR + '/snl_' + name + '_' + assessmentdate + '.csv').items():
+				current_rows.setdefault(network_name, []).extend(rows)
+			for network_name, rows in rows_by_network('../Data/SNL Downloads/' + previousdate + '/snl_' + name + '_' + previousdate + '.csv').items():
+				previous_rows.setdefault(network_name, []).extend(rows)
+		max_ages = {name: (0 if current_rows.get(name) != previous_rows.get(name) else float('inf')) for name in network_urls}
+		print(sum(max_age == 0 for max_age in max_ages.values()), 'of', len(max_ages), 'networks have changed since the SNL download of', previousdate + '.')
+with open(filingdates_path, 'a') as filingdates_file:
+	filingdates_writer = csv.writer(filingdates_file)
+	def record_filing_dates(name, source):
+		filing_dates[name] = read_filing_dates(source)
+		filingdates_writer.writerow([name, filing_dates[name][0], filing_dates[name][1]])
+		filingdates_file.flush()
+	fetch_each(network_urls, record_filing_dates, max_ages = max_ages, connections = args.connections, timeout = args.timeout, retries = args.retries, base_url = args.mirror, rate = args.rate, cache = cache)
+if cache is not None:
+	print('Network pages reused from the cache:', cache.hits, '/ confirmed unchanged by the ITU:', cache.revalidated, '/ downloaded:', cache.stored)
+	cache.close()
+
+## Find the previous SNL download with a networks file, to copy unchanged networks from (with --incremental) and to list what has changed
+previous_dates = [date for date in os.listdir('../Data/SNL Downloads') if (date.isdigit() and date < assessmentdate and all(os.path.isfile('../Data/SNL Downloads/' + date + '/' + name + '_' + date + '.csv') for name in ['networks', 'snl_unplanned', 'snl_planned', 'snl_broughtintouse', 'snl_suspended', 'snl_namechange']))]
+previous_networks = {}
+if len(previous_dates) > 0:
+	previousdate = max(previous_dates)
+	# Read every column as it's written, except for longitudes, so that copied rows are saved exactly as before
+	df_previous = pd.read_csv('../Data/SNL Downloads/' + previousdate + '/networks_' + previousdate + '.csv', dtype = str, keep_default_na = False)
+	df_previous['Longitude'] = df_previous['Longitude'].astype(float)
+	for row in df_previous.to_dict('records'):
+		previous_networks[(row['Network Name'], row['Planned or Non-Planned'])] = row
+# Networks are rebuilt if any of their rows in the five downloaded lists or their filing dates have changed, along with any networks renamed from them
+unchanged_networks = {}
+if (args.incremental and len(previous_networks) > 0):
+	changed_names = set()
+	for name, column in [('snl_unplanned', 2), ('snl_planned', 2), ('snl_broughtintouse', 0), ('snl_suspended', 1), ('snl_namechange', 0)]:
+		current_rows = rows_by_network(MYDIR + '/' + name + '_' + assessmentdate + '.csv', column)
+		previous_rows = rows_by_network('../Data/SNL Downloads/' + previousdate + '/' + name + '_' + previousdate + '.csv', column)
+		changed_names.update(network_name for network_name in set(current_rows) | set(previous_rows) if current_rows.get(network_name) != previous_rows.get(network_name))
+	for (network_name, network_type), row in previous_networks.items():
+		if (row['Early-Stage Filing Date'], row['Late-Stage Filing Date']) != filing_dates.get(network_name, ('n/a', 'n/a')):
+			changed_names.add(network_name)
+	renamed_to = {}
+	for newname, oldname in zip(newnames_list, oldnames_list):
+		renamed_to.setdefault(oldname, []).append(newname)
+	unvisited = list(changed_names)
+	while len(unvisited) > 0:
+		for newname in renamed_to.get(unvisited.pop(), []):
+			if newname not in changed_names:
+				changed_names.add(newname)
+				unvisited.append(newname)
+	unchanged_networks = {key: row for key, row in previous_networks.items() if key[0] not in changed_names}
+	print(len(df_licenses) - sum((name, network_type) in unchanged_networks for name, network_type in zip(df_licenses['Network Name'], df_licenses['Planned or Non-Planned'])), 'of', len(df_licenses), 'networks have changed since the SNL download of', previousdate, 'and will be rebuilt.')
+
+## Fill in the rest of each network's information from the downloaded lists and filing dates
+df_licenses = assemble_networks(df_licenses, MYDIR, assessmentdate, filing_dates, unchanged_networks)
+# Save the file to a CSV, under a temporary name until it's complete, so that nothing reading the networks (e.g. compliance_server.py) ever finds half of it
+with atomic_open('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv') as f:
+	df_licenses.to_csv(f, index = None)
 
-# Consider networks with name changes
-for i in np.arange(len(df_licenses)):
-	if df_licenses.at[i, 'Previous Name'] != 'n/a':
-		oldname = df_licenses.at[i, 'Previous Name']
-		for j in np.arange(len(df_licenses)):
-			if df_licenses.at[i, 'Network Name'] == oldname:
-				oldnetwork_broughtintouse = df_licenses.at[j, 'Brought-into-Use Date']
-				oldnetwork_latestage = df_licenses.at[j, 'Late-Stage Filing Date']
-				oldnetwork_earlystage = df_licenses.at[j, 'Early-Stage Filing Date']
-				oldnetwork_suspensions = df_licenses.at[j, 'Suspensions']
-				# Consider cases in which the older network has some data associated with it
-				if oldnetwork_broughtintouse != 'n/a':
-					if df_licenses.at[i, 'Brought-into-Use Date'] == 'n/a':
-						df_licenses.at[i, 'Brought-into-Use Date'] = oldnetwork_broughtintouse
-					else:
-						df_licenses.at[i, 'Brought-into-Use Date'] = min(datetime.strptime(df_licenses.at[i, 'Brought-into-Use Date'], '%Y-%m-%d'), oldnetwork_broughtintouse)[0:10]
-				if oldnetwork_latestage != 'n/a':
-					if df_licenses.at[i, 'Late-Stage Filing Date'] == 'n/a':
-						df_licenses.at[i, 'Late-Stage Filing Date'] = oldnetwork_latestage
-					else:
-						df_licenses.at[i, 'Late-Stage Filing Date'] = min(datetime.strptime(df_licenses.at[i, 'Late-Stage Filing Date'], '%Y-%m-%d'), oldnetwork_latestage)[0:10]
-				if oldnetwork_earlystage != 'n/a':
-					if df_licenses.at[i, 'Early-Stage Filing Date'] == 'n/a':
-						df_licenses.at[i, 'Early-Stage Filing Date'] = oldnetwork_earlystage
-					else:
-						df_licenses.at[i, 'Early-Stage Filing Date'] = min(datetime.strptime(df_licenses.at[i, 'Early-Stage Filing Date'], '%Y-%m-%d'), oldnetwork_earlystage)[0:10]
-				if oldnetwork_suspensions != []:
-					newnetwork_suspensions = df_licenses.at[i, 'Suspensions']
-					if newnetwork_suspensions == 'n/a':
-						df_licenses.at[i, 'Suspensions'] = oldnetwork_suspensions
-					else:
-						for suspension in oldnetwork_suspensions:
-							if suspension not in newnetwork_suspensions:
-								newnetwork_suspensions.append(suspension)
-						df_licenses.at[i, 'Suspensions'] = newnetwork_suspensions
-# Sort the data by longitude
-df_licenses = df_licenses.sort_values('Longitude', ascending = True)
-# Save the file to a CSV
-df_licenses.to_csv('../Data/SNL Downloads/' + assessmentdate + '/networks_' + assessmentdate + '.csv', index = None)
+## List the networks that have been added, removed, or modified since the previous SNL download
+if len(previous_networks) > 0:
+	changelog_rows = []
+	current_networks = {}
+	for row in df_licenses.to_dict('records'):
+		current_networks[(row['Network Name'], row['Planned or Non-Planned'])] = row
+	for key, row in current_networks.items():
+		if key not in previous_networks:
+			changelog_rows.append([key[0], key[1], 'Added', 'n/a'])
+		else:
+			changed_columns = [column for column in df_licenses.columns if str(row[column]) != str(previous_networks[key][column])]
+			if len(changed_columns) > 0:
+				changelog_rows.append([key[0], key[1], 'Modified', '; '.join(changed_columns)])
+	for key in previous_networks:
+		if key not in current_networks:
+			changelog_rows.append([key[0], key[1], 'Removed', 'n/a'])
+	with open('../Data/SNL Downloads/' + assessmentdate + '/snl_changelog_' + assessmentdate + '.csv', 'w') as f:
+		writer = csv.writer(f)
+		writer.writerow(['Network Name', 'Planned or Non-Planned', 'Change', 'Changed Columns'])
+		writer.writerows(changelog_rows)
+	print(sum(row[2] == 'Added' for row in changelog_rows), 'networks added,', sum(row[2] == 'Removed' for row in changelog_rows), 'removed, and', sum(row[2] == 'Modified' for row in changelog_rows), 'modified since the SNL download of', previousdate + '.')
 
 
@@ -21,8 +21,17 @@ Outputs:        ../Data/SNL Downloads/[YYYYMMDD]/snl_broughtintouse_[YYYYMMDD].c
 from datetime import datetime
 import urllib.request
 
-# Choose a date to run the assessment
-assessmentdate = datetime.today().strftime('%Y%m%d')
+# Write the address of the brought-into-use list
+url = 'https://www.itu.int/net/ITU-R/space/snl/listinuse/index-txt.asp?sel_satname=&sel_orbit_from=&sel_orbit_to=&sel_adm=&sel_org=&sel_date_from=&sel_date_to=&sel_sns_id=&sel_prov=&sel_rec=&order=&mod='
 
-# Download and save the brought into use list
-urllib.request.urlretrieve('https://www.itu.int/net/ITU-R/space/snl/listinuse/index-txt.asp?sel_satname=&sel_orbit_from=&sel_orbit_to=&sel_adm=&sel_org=&sel_date_from=&sel_date_to=&sel_sns_id=&sel_prov=&sel_rec=&order=&mod=', '../Data/SNL Downloads/' + assessmentdate + '/snl_broughtintouse_' + assessmentdate + '.csv')
+# Write a quick function for saving the downloaded brought-into-use list
+def save(source, file_path):
+    with open(file_path, 'wb') as f:
+        f.write(source)
+
+if __name__ == '__main__':
+    # Choose a date to run the assessment
+    assessmentdate = datetime.today().strftime('%Y%m%d')
+
+    # Download and save the brought-into-use list
+    save(urllib.request.urlopen(url).read(), '../Data/SNL Downloads/' + assessmentdate + '/snl_broughtintouse_' + assessmentdate + '.csv')
@@ -0,0 +1,118 @@
+"""
+Name: 			snl_cache.py
+Description:
+				Keeps downloaded SNL pages on disk between runs of snl.py. Run using snl.py.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/snl_cache.sqlite
+Outputs:
+				../Data/SNL Downloads/snl_cache.sqlite
+"""
+
+## Most networks' filings don't change from one run of snl.py to the next, so most of the thousands of network pages it downloads are the same as last time. Each page is kept in a SQLite file, keyed by its address, with the time it was downloaded and the hash of its contents. Identical contents are only stored once.
+## Pages younger than a chosen age are reused without asking the ITU. Older pages are asked for again, conditionally when the ITU's servers gave a way to check whether a page has changed. When the file grows past a chosen size, the pages used least recently are dropped.
+
+import hashlib
+import sqlite3
+import time
+
+class ResponseCache:
+	"""
+	Stores downloaded pages in a SQLite file
+	@params:
+		file_path   - Required  : path to the SQLite file, created if it doesn't exist (Str)
+		ttl         - Optional  : seconds for which a stored page is reused without asking the server again (Float)
+		max_bytes   - Optional  : total size of stored pages above which the least-recently-used ones are dropped (Int)
+	"""
+	def __init__(self, file_path, ttl = 7*24*60*60, max_bytes = 500*1024*1024):
+		self.ttl = ttl
+		self.max_bytes = max_bytes
+		self.hits = 0
+		self.revalidated = 0
+		self.stored = 0
+		self._connection = sqlite3.connect(file_path)
+		self._connection.execute('PRAGMA journal_mode = WAL')
+		self._connection.execute('CREATE TABLE IF NOT EXISTS bodies (hash TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL)')
+		self._connection.execute('CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, hash TEXT NOT NULL REFERENCES bodies(hash), fetched REAL NOT NULL, accessed REAL NOT NULL, etag TEXT, last_modified TEXT)')
+		self._connection.execute('CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed)')
+		self._connection.commit()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def close(self):
+		"""
+		Drop the least-recently-used pages if the cache has grown too large, then close the file
+		"""
+		self.evict()
+		self._connection.close()
+
+	def get(self, url):
+		"""
+		Look up a stored page
+		@params:
+			url         - Required  : address of the page (Str)
+		@returns:
+			the page's contents (Bytes), its age in seconds (Float), and the validators to send when asking whether it has changed (Dict), or None if the page isn't stored
+		"""
+		row = self._connection.execute('SELECT bodies.body, pages.fetched, pages.etag, pages.last_modified FROM pages JOIN bodies ON pages.hash = bodies.hash WHERE pages.url = ?', (url,)).fetchone()
+		if row is None:
+			return None
+		body, fetched, etag, last_modified = row
+		self._connection.execute('UPDATE pages SET accessed = ? WHERE url = ?', (time.time(), url))
+		self._connection.commit()
+		validators = {}
+		if etag is not None:
+			validators['If-None-Match'] = etag
+		if last_modified is not None:
+			validators['If-Modified-Since'] = last_modified
+		return bytes(body), time.time() - fetched, validators
+
+	def put(self, url, body, etag = None, last_modified = None):
+		"""
+		Store a freshly downloaded page
+		@params:
+			url             - Required  : address of the page (Str)
+			body            - Required  : the page's contents (Bytes)
+			etag            - Optional  : the page's ETag header, if the server sent one (Str)
+			last_modified   - Optional  : the page's Last-Modified header, if the server sent one (Str)
+		"""
+		digest = hashlib.sha256(body).hexdigest()
+		now = time.time()
+		self._connection.execute('INSERT OR IGNORE INTO bodies (hash, body, size) VALUES (?, ?, ?)', (digest, body, len(body)))
+		self._connection.execute('INSERT OR REPLACE INTO pages (url, hash, fetched, accessed, etag, last_modified) VALUES (?, ?, ?, ?, ?, ?)', (url, digest, now, now, etag, last_modified))
+		self._connection.commit()
+		self.stored += 1
+
+	def touch(self, url):
+		"""
+		Mark a stored page as just downloaded, after the server confirms it hasn't changed
+		@params:
+			url         - Required  : address of the page (Str)
+		"""
+		now = time.time()
+		self._connection.execute('UPDATE pages SET fetched = ?, accessed = ? WHERE url = ?', (now, now, url))
+		self._connection.commit()
+		self.revalidated += 1
+
+	def evict(self):
+		"""
+		Drop the least-recently-used pages until the stored contents fit within max_bytes
+		"""
+		total = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM bodies').fetchone()[0]
+		if total <= self.max_bytes:
+			return
+		for url, digest in self._connection.execute('SELECT url, hash FROM pages ORDER BY accessed').fetchall():
+			self._connection.execute('DELETE FROM pages WHERE url = ?', (url,))
+			# Only drop the contents once no other page shares them
+			if self._connection.execute('SELECT 1 FROM pages WHERE hash = ? LIMIT 1', (digest,)).fetchone() is None:
+				total -= self._connection.execute('SELECT size FROM bodies WHERE hash = ?', (digest,)).fetchone()[0]
+				self._connection.execute('DELETE FROM bodies WHERE hash = ?', (digest,))
+			if total <= self.max_bytes:
+				break
+		self._connection.commit()
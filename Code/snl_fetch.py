@@ -0,0 +1,280 @@
+"""
+Name: 			snl_fetch.py
+Description:
+				Downloads pages from the ITU's Space Network List concurrently. Run using snl.py.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				n/a
+Outputs:
+				n/a
+"""
+
+## snl.py needs several lists from the SNL, and each one takes a while for the ITU's servers to produce. Rather than downloading them one after another, they are requested at the same time over a small pool of kept-alive connections, with a limit on how many connections are open to each host at once.
+## snl.py also needs one page per network, thousands in all. Those are downloaded by a few workers at a capped rate, to stay polite to the ITU's servers, and each page is handed off to be read as soon as it arrives.
+## Requests that fail or stall are retried a few times, waiting longer after each attempt. Every page can also be requested from a stand-in server instead (e.g. a local copy of saved SNL pages), by passing its address as base_url.
+
+import asyncio
+import ssl
+import time
+import urllib.parse
+
+class SNLClient:
+	"""
+	Downloads pages over a shared pool of kept-alive HTTP connections
+	@params:
+		connections - Optional  : maximum number of connections open to each host at once (Int)
+		timeout     - Optional  : seconds to wait for each attempt at downloading a page (Float)
+		retries     - Optional  : number of times to retry a page after a failed attempt (Int)
+		backoff     - Optional  : seconds to wait before the first retry, doubling after each retry (Float)
+		base_url    - Optional  : scheme and host to request every page from instead, e.g. 'http://127.0.0.1:8000' (Str)
+		rate        - Optional  : maximum number of requests to start per second, across all hosts, or None for no limit (Float)
+		cache       - Optional  : where to keep downloaded pages between runs, or None to always download them (ResponseCache)
+	"""
+	def __init__(self, connections = 5, timeout = 120, retries = 3, backoff = 1.0, base_url = None, rate = None, cache = None):
+		self.connections = connections
+		self.timeout = timeout
+		self.retries = retries
+		self.backoff = backoff
+		self.base_url = base_url
+		self.rate = rate
+		self.cache = cache
+		self._next_request = 0
+		self._idle = {}
+		self._limits = {}
+		self._ssl = ssl.create_default_context()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exc_info):
+		await self.close()
+
+	async def close(self):
+		"""
+		Close every idle connection in the pool
+		"""
+		for connections in self._idle.values():
+			for reader, writer in connections:
+				writer.close()
+		self._idle = {}
+
+	async def fetch(self, url, max_age = None):
+		"""
+		Download a page, retrying after errors, timeouts, and server-side failures
+		@params:
+			url         - Required  : address of the page (Str)
+			max_age     - Optional  : oldest age in seconds at which a cached copy of the page is reused, or None for the cache's ttl (Float)
+		@returns:
+			the page's contents (Bytes)
+		"""
+		if self.base_url is not None:
+			parts = urllib.parse.urlsplit(url)
+			url = self.base_url.rstrip('/') + urllib.parse.urlunsplit(('', '', parts.path, parts.query, ''))
+		# Addresses that can't be sent as ASCII (e.g. network names with accented letters) fail straight away rather than being retried
+		url.encode('ascii')
+		# Reuse a cached copy that's recent enough; for an older copy, ask the server whether it has changed
+		cached = None
+		validators = {}
+		if self.cache is not None:
+			cached = self.cache.get(url)
+			if cached is not None:
+				body, age, validators = cached
+				if age <= (self.cache.ttl if max_age is None else max_age):
+					self.cache.hits += 1
+					return body
+		for attempt in range(self.retries + 1):
+			try:
+				status, headers, body = await asyncio.wait_for(self._get(url, validators), self.timeout)
+				if (status == 304 and cached is not None):
+					self.cache.touch(url)
+					return cached[0]
+				if self.cache is not None:
+					self.cache.put(url, body, headers.get('etag'), headers.get('last-modified'))
+				return body
+			# Only retry failures that may go away on their own; a response that can't be read as HTTP will be the same next time
+			except (OSError, EOFError, asyncio.IncompleteReadError, asyncio.TimeoutError, RetryableStatus) as error:
+				if attempt == self.retries:
+					raise
+				print('Retrying', url, 'after', type(error).__name__ + ':', error)
+				await asyncio.sleep(self.backoff * 2**attempt)
+
+	async def _get(self, url, validators, redirects = 5):
+		parts = urllib.parse.urlsplit(url)
+		secure = parts.scheme == 'https'
+		host = (parts.hostname, parts.port or (443 if secure else 80), secure)
+		path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+		if host not in self._limits:
+			self._limits[host] = asyncio.Semaphore(self.connections)
+		async with self._limits[host]:
+			await self._wait_for_turn()
+			status, headers, body = await self._request(host, path, validators)
+		if (status in (301, 302, 303, 307, 308) and 'location' in headers and redirects > 0):
+			return await self._get(urllib.parse.urljoin(url, headers['location']), validators, redirects - 1)
+		if (status == 429 or status >= 500):
+			raise RetryableStatus(status, url)
+		if status >= 400:
+			raise HTTPStatusError(status, url)
+		return status, headers, body
+
+	async def _wait_for_turn(self):
+		# Space requests at least 1/rate seconds apart by reserving the next free start time
+		if self.rate is None:
+			return
+		now = time.monotonic()
+		start = max(now, self._next_request)
+		self._next_request = start + 1/self.rate
+		await asyncio.sleep(start - now)
+
+	async def _request(self, host, path, validators):
+		# Reuse an idle connection if there is one; if the server has since closed it, try again on a new connection
+		while len(self._idle.get(host, [])) > 0:
+			reader, writer = self._idle[host].pop()
+			try:
+				return await self._exchange(host, path, validators, reader, writer)
+			except (OSError, EOFError, asyncio.IncompleteReadError):
+				writer.close()
+			except BaseException:
+				writer.close()
+				raise
+		reader, writer = await asyncio.open_connection(host[0], host[1], ssl = self._ssl if host[2] else None)
+		try:
+			return await self._exchange(host, path, validators, reader, writer)
+		except BaseException:
+			writer.close()
+			raise
+
+	async def _exchange(self, host, path, validators, reader, writer):
+		# Name the port in the Host header too, unless it's the scheme's usual one
+		host_header = ('[' + host[0] + ']' if ':' in host[0] else host[0]) + ('' if host[1] == (443 if host[2] else 80) else ':' + str(host[1]))
+		request = 'GET ' + path + ' HTTP/1.1\r\nHost: ' + host_header + '\r\nUser-Agent: ITU-Compliance-Assessment-Monitor\r\nAccept-Encoding: identity\r\nConnection: keep-alive\r\n'
+		for name, value in validators.items():
+			request += name + ': ' + value + '\r\n'
+		writer.write((request + '\r\n').encode('ascii'))
+		await writer.drain()
+		status_line = await reader.readline()
+		if status_line == b'':
+			raise EOFError('connection closed before a response was received')
+		status = int(status_line.split()[1])
+		headers = {}
+		while True:
+			line = await reader.readline()
+			if line in (b'\r\n', b'\n'):
+				break
+			if line == b'':
+				raise EOFError('connection closed while reading headers')
+			name, _, value = line.decode('latin-1').partition(':')
+			headers[name.strip().lower()] = value.strip()
+		reusable = headers.get('connection', '').lower() != 'close'
+		# Responses saying a page hasn't changed have no contents
+		if (status == 304 or status == 204 or 100 <= status < 200):
+			body = b''
+		elif headers.get('transfer-encoding', '').lower() == 'chunked':
+			body = await read_chunked(reader)
+		elif 'content-length' in headers:
+			body = await reader.readexactly(int(headers['content-length']))
+		else:
+			body = await reader.read()
+			reusable = False
+		# Put the connection back in the pool for the next request to this host
+		if reusable:
+			self._idle.setdefault(host, []).append((reader, writer))
+		else:
+			writer.close()
+		return status, headers, body
+
+class HTTPStatusError(Exception):
+	"""
+	Raised when the server answers a request with an error that retrying won't fix
+	"""
+	def __init__(self, status, url):
+		super().__init__('HTTP ' + str(status) + ' for ' + url)
+		self.status = status
+		self.url = url
+
+class RetryableStatus(HTTPStatusError):
+	"""
+	Raised when the server answers a request with an error that may go away on its own (e.g. 503 or 429)
+	"""
+
+# Write a quick function for reading a response body sent in chunks
+async def read_chunked(reader):
+	chunks = []
+	while True:
+		size = int((await reader.readline()).split(b';')[0].strip(), 16)
+		if size == 0:
+			# Skip any trailing headers
+			while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+				pass
+			return b''.join(chunks)
+		chunks.append(await reader.readexactly(size))
+		await reader.readexactly(2)
+
+async def fetch_all_async(urls, **options):
+	"""
+	Download several pages at once
+	@params:
+		urls        - Required  : addresses of the pages, keyed by any name (Dict)
+		options     - Optional  : any of SNLClient's parameters
+	@returns:
+		the pages' contents (Dict) and the seconds each page took to download, including retries (Dict), both keyed like urls
+	"""
+	timings = {}
+	async def timed_fetch(client, name, url):
+		start = time.perf_counter()
+		try:
+			return await client.fetch(url)
+		finally:
+			timings[name] = time.perf_counter() - start
+	async with SNLClient(**options) as client:
+		bodies = await asyncio.gather(*[timed_fetch(client, name, url) for name, url in urls.items()])
+	return dict(zip(urls.keys(), bodies)), timings
+
+# Write a quick function for downloading several pages at once from outside of an event loop
+def fetch_all(urls, **options):
+	return asyncio.run(fetch_all_async(urls, **options))
+
+async def fetch_each_async(urls, handle, progress_every = 100, max_ages = None, **options):
+	"""
+	Download many pages, handing each one to a function as soon as it arrives
+	@params:
+		urls            - Required  : addresses of the pages, keyed by any name (Dict)
+		handle          - Required  : function called as handle(name, contents) for each page, one page at a time, in a worker thread (Function)
+		progress_every  - Optional  : print progress after this many pages (Int)
+		max_ages        - Optional  : oldest age in seconds at which a cached copy of each page is reused, keyed like urls, for any pages that shouldn't use the cache's ttl (Dict)
+		options         - Optional  : any of SNLClient's parameters
+	"""
+	client = SNLClient(**options)
+	names = asyncio.Queue()
+	for name in urls:
+		names.put_nowait(name)
+	# Pages wait here to be handled; the queue is kept short so downloads don't run far ahead of handling
+	pages = asyncio.Queue(maxsize = 2*client.connections)
+	async def download():
+		while not names.empty():
+			name = names.get_nowait()
+			await pages.put((name, await client.fetch(urls[name], (max_ages or {}).get(name))))
+	async def handle_pages():
+		start = time.perf_counter()
+		for count in range(1, len(urls) + 1):
+			name, contents = await pages.get()
+			await asyncio.to_thread(handle, name, contents)
+			if (count % progress_every == 0 or count == len(urls)):
+				elapsed = time.perf_counter() - start
+				print('Fetched', count, 'of', len(urls), 'pages in', f'{elapsed:.0f}', 's (' + f'{count/max(elapsed, 1e-9):.1f}', 'pages/s)')
+	async with client:
+		downloads = [asyncio.create_task(download()) for _ in range(client.connections)]
+		handler = asyncio.create_task(handle_pages())
+		try:
+			# Stop at the first download or handling error, after everything handled so far has been kept
+			for task in asyncio.as_completed(downloads + [handler]):
+				await task
+		finally:
+			for task in downloads + [handler]:
+				task.cancel()
+			await asyncio.gather(*downloads, handler, return_exceptions = True)
+
+# Write a quick function for downloading and handling many pages from outside of an event loop
+def fetch_each(urls, handle, progress_every = 100, max_ages = None, **options):
+	asyncio.run(fetch_each_async(urls, handle, progress_every, max_ages, **options))
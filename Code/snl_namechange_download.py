@@ -15,30 +15,33 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import csv
 
-# Choose a date to run the assessment
-assessmentdate = datetime.today().strftime('%Y%m%d')
-
-with open('../Data/SNL Downloads/' + assessmentdate + '/snl_namechange_' + assessmentdate + '.csv', 'w') as f:
-    writer = csv.writer(f)
-    writer.writerow(['New Name', 'Old Name'])
-
+# Write the address of the name-change list
 url = 'https://www.itu.int/net/ITU-R/space/snl/name_change/index.asp'
 
-source = urllib.request.urlopen(url).read()
-soup = BeautifulSoup(source,'html.parser')
-tables = soup.find_all('table')
-
-table_rows = tables[0].find_all('tr')
-
-data = False
-for table_row in table_rows:
-    columns = table_row.findAll('td')
-    output_row = []
-    for column in columns:
-        output_row.append(column.text)
-    if data:
-        with open('../Data/SNL Downloads/' + assessmentdate + '/snl_namechange_' + assessmentdate + '.csv', 'a') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(output_row)
-    if output_row == ['down - up', 'down - up']:
-        data = True
+# Write a quick function for saving the scraped name-change list to a CSV
+def save(source, file_path):
+    soup = BeautifulSoup(source,'html.parser')
+    tables = soup.find_all('table')
+
+    table_rows = tables[0].find_all('tr')
+
+    with open(file_path, 'w') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['New Name', 'Old Name'])
+        data = False
+        for table_row in table_rows:
+            columns = table_row.findAll('td')
+            output_row = []
+            for column in columns:
+                output_row.append(column.text)
+            if data:
+                writer.writerow(output_row)
+            if output_row == ['down - up', 'down - up']:
+                data = True
+
+if __name__ == '__main__':
+    # Choose a date to run the assessment
+    assessmentdate = datetime.today().strftime('%Y%m%d')
+
+    source = urllib.request.urlopen(url).read()
+    save(source, '../Data/SNL Downloads/' + assessmentdate + '/snl_namechange_' + assessmentdate + '.csv')
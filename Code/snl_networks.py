@@ -0,0 +1,204 @@
+"""
+Name: 			snl_networks.py
+Description:
+				Organizes the lists downloaded from the ITU's Space Network List into one row per network. Run using snl.py.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/[YYYYMMDD]/snl_unplanned_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_planned_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_broughtintouse_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_suspended_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_namechange_[YYYYMMDD].csv
+Outputs:
+				n/a
+"""
+
+## snl.py downloads the SNL's lists and each network's filing dates, then organizes them into its networks file. The organizing is kept here, apart from the downloading, so that it can be re-run on lists that have already been downloaded (e.g. by snl_regression.py, to check that a change to it still gives the same networks file).
+
+import csv
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Write lists that ranks the order of the various filing types that can be found in the unplanned and planned list by maturity. More mature filings types appear later in these lists.
+unplanned_types = ['n/a', 'A', 'U', 'C', 'N']
+planned_types = ['n/a', 'P', 'U', 'P/Plan/List', 'N']
+
+# Write a quick function for finding one of the lists downloaded on a given date
+def list_path(directory, name, date):
+	return directory + '/snl_' + name + '_' + date + '.csv'
+
+# Write a quick function for reading the list of networks that have had their names changed, as lists of new names and the old names they replaced
+def read_name_changes(directory, date):
+	newnames_list = []
+	oldnames_list = []
+	with open(list_path(directory, 'namechange', date)) as f:
+		reader = csv.reader(f, delimiter=",")
+		for row in reader:
+			if row[0] != 'New Name':
+				newnames_list.append(row[0])
+				oldnames_list.append(row[1])
+	return newnames_list, oldnames_list
+
+# Write a quick function for making a list of networks and their most-mature filing categories, keyed by name in the order they first appear
+def read_licenses(file_path, types, column):
+	licenses = {}
+	with open(file_path) as f:
+		reader = csv.reader(f, delimiter=",")
+		for row in reader:
+			if row[2] not in licenses:
+				licenses[row[2]] = row[column]
+			else:
+				licenses[row[2]] = types[max(types.index(row[column]), types.index(licenses[row[2]]))]
+	return licenses
+
+def list_networks(directory, date):
+	"""
+	List every network in the non-planned and planned lists, with its most-mature filing category
+	@params:
+		directory   - Required  : sub-directory holding the lists downloaded on the date (Str)
+		date        - Required  : date the lists were downloaded, as YYYYMMDD (Str)
+	@returns:
+		one row per network, with only 'Network Name', 'Planned or Non-Planned', and 'Highest Maturity' filled in (DataFrame)
+	"""
+	unplanned_licenses = read_licenses(list_path(directory, 'unplanned', date), unplanned_types, 3)
+	unplanned_license_names = list(unplanned_licenses.keys())
+	unplanned_license_types = list(unplanned_licenses.values())
+	planned_licenses = read_licenses(list_path(directory, 'planned', date), planned_types, 4)
+	planned_license_names = list(planned_licenses.keys())
+	planned_license_types = list(planned_licenses.values())
+	# Write a Pandas dataframe house the organized data
+	df_licenses = pd.DataFrame(0, columns = ['Network Name', 'Longitude', 'ITU Administration', 'Previous Name', 'Planned or Non-Planned', 'Highest Maturity', 'Brought-into-Use Date', 'Late-Stage Filing Date', 'Early-Stage Filing Date', 'Suspensions', 'Link'], index = np.arange(len(planned_license_names) + len(unplanned_license_names)))
+	# Drop in the lists of unique licenses
+	df_licenses['Network Name'] = unplanned_license_names + planned_license_names
+	df_licenses['Planned or Non-Planned'] = ['Non-Planned']*len(unplanned_license_names) + ['Planned']*len(planned_license_names)
+	df_licenses['Highest Maturity'] = unplanned_license_types + planned_license_types
+	return df_licenses
+
+def assemble_networks(df_licenses, directory, date, filing_dates, unchanged_networks = {}):
+	"""
+	Fill in every network's longitude, administration, dates, suspensions, and link from the downloaded lists, and sort the networks by longitude
+	@params:
+		df_licenses         - Required  : the networks, from list_networks() (DataFrame)
+		directory           - Required  : sub-directory holding the lists downloaded on the date (Str)
+		date                - Required  : date the lists were downloaded, as YYYYMMDD (Str)
+		filing_dates        - Required  : each network's early- and late-stage filing dates, found on its page on the SNL, keyed by name; networks left out get 'n/a' (Dict)
+		unchanged_networks  - Optional  : rows of a previous networks file to copy as they are, keyed by network name and 'Planned or Non-Planned' (Dict)
+	@returns:
+		the networks, as written to the networks file (DataFrame)
+	"""
+	# Quickly import the four raw datasets
+	df_planned = pd.read_csv(list_path(directory, 'planned', date), header = None)
+	df_unplanned = pd.read_csv(list_path(directory, 'unplanned', date), header = None)
+	df_broughtintouse = pd.read_csv(list_path(directory, 'broughtintouse', date))
+	df_suspended = pd.read_csv(list_path(directory, 'suspended', date))
+	newnames_list, oldnames_list = read_name_changes(directory, date)
+
+	## Index the four raw datasets by network name, so each network's information is looked up directly rather than searched for
+	# For each network and filing type, the last filing listed decides the network's longitude, ITU administration, and link
+	unplanned_filings = {}
+	for name, filing_type, longitude, administration, link in zip(df_unplanned[2], df_unplanned[3], df_unplanned[0], df_unplanned[1], df_unplanned[6]):
+		unplanned_filings[(name, filing_type)] = (longitude, administration, link)
+	planned_filings = {}
+	for name, filing_type, longitude, administration, link in zip(df_planned[2], df_planned[4], df_planned[0], df_planned[1], df_planned[7]):
+		planned_filings[(name, filing_type)] = (longitude, administration, link)
+	# Collect every brought-into-use date and suspension listed for each network (dates are only read for networks being built)
+	broughtintouse_dates = {}
+	for name, broughtintouse_date in zip(df_broughtintouse.iloc[:, 0], df_broughtintouse.iloc[:, 4]):
+		broughtintouse_dates.setdefault(str(name), []).append(broughtintouse_date)
+	suspension_listings = {}
+	for name, suspension_type, suspension_date, resumption_date in zip(df_suspended.iloc[:, 1], df_suspended.iloc[:, 6], df_suspended.iloc[:, 8], df_suspended.iloc[:, 10]):
+		suspension_listings.setdefault(str(name), []).append((suspension_type, suspension_date, resumption_date))
+	# When a network's new name is listed more than once, the last listing decides its previous name
+	previous_names = dict(zip(newnames_list, oldnames_list))
+
+	# Fill in the rest of the dataframe, one column at a time
+	filled_columns = ['Longitude', 'ITU Administration', 'Previous Name', 'Brought-into-Use Date', 'Late-Stage Filing Date', 'Early-Stage Filing Date', 'Suspensions', 'Link']
+	filled_values = {column: [] for column in filled_columns}
+	for name, network_type, maturity in zip(df_licenses['Network Name'], df_licenses['Planned or Non-Planned'], df_licenses['Highest Maturity']):
+		# Copy networks that haven't changed from the previous SNL download
+		if (name, network_type) in unchanged_networks:
+			for column in filled_columns:
+				filled_values[column].append(unchanged_networks[(name, network_type)][column])
+			continue
+		# (Networks with no filing of their highest maturity keep the placeholder 0)
+		longitude, administration, link = 0, 0, 0
+		if network_type == 'Non-Planned':
+			filing = unplanned_filings.get((name, maturity))
+		else:
+			filing = planned_filings.get((name, maturity))
+		if filing is not None:
+			longitude, administration, link = filing[0], filing[1], 'https:' + filing[2]
+		dates = [datetime.strptime(date, '%d.%m.%Y') for date in broughtintouse_dates.get(str(name), [])]
+		if len(dates) == 0:
+			broughtintouse = 'n/a'
+		else:
+			broughtintouse = str(min(dates))[0:10]
+		suspensions = []
+		for suspension_type, suspension_date, resumption_date in suspension_listings.get(str(name), []):
+			suspension = [str(suspension_type).strip()]
+			# Check if the suspension date field is filled
+			if len(str(suspension_date)) > 4:
+				suspension.append(str(datetime.strptime(suspension_date, '%d.%m.%Y'))[0:10])
+			if len(str(resumption_date)) > 4:
+				suspension.append(str(datetime.strptime(resumption_date, '%d.%m.%Y'))[0:10])
+			else:
+				suspension.append('n/a')
+			if suspension not in suspensions:
+				suspensions.append(suspension)
+		if suspensions == []:
+			suspensions = 'n/a'
+		# Look up the network's early- and late-stage filing dates, found on its associated page on the SNL
+		earlystage, latestage = filing_dates.get(name, ('n/a', 'n/a'))
+		filled_values['Longitude'].append(longitude)
+		filled_values['ITU Administration'].append(administration)
+		filled_values['Previous Name'].append(previous_names.get(name, 'n/a'))
+		filled_values['Brought-into-Use Date'].append(broughtintouse)
+		filled_values['Late-Stage Filing Date'].append(latestage)
+		filled_values['Early-Stage Filing Date'].append(earlystage)
+		filled_values['Suspensions'].append(suspensions)
+		filled_values['Link'].append(link)
+	# (Keep the columns' values as Python objects, as when they were set one cell at a time, so that networks at the same longitude are sorted into the same order as before)
+	for column in filled_columns:
+		df_licenses[column] = pd.Series(filled_values[column], index = df_licenses.index, dtype = object)
+
+	# Consider networks with name changes
+	for i in np.arange(len(df_licenses)):
+		# (Only networks listed under their own previous name are merged, so check that once rather than for every other network)
+		if (df_licenses.at[i, 'Previous Name'] != 'n/a' and df_licenses.at[i, 'Network Name'] == df_licenses.at[i, 'Previous Name']):
+			oldname = df_licenses.at[i, 'Previous Name']
+			for j in np.arange(len(df_licenses)):
+				if df_licenses.at[i, 'Network Name'] == oldname:
+					oldnetwork_broughtintouse = df_licenses.at[j, 'Brought-into-Use Date']
+					oldnetwork_latestage = df_licenses.at[j, 'Late-Stage Filing Date']
+					oldnetwork_earlystage = df_licenses.at[j, 'Early-Stage Filing Date']
+					oldnetwork_suspensions = df_licenses.at[j, 'Suspensions']
+					# Consider cases in which the older network has some data associated with it
+					if oldnetwork_broughtintouse != 'n/a':
+						if df_licenses.at[i, 'Brought-into-Use Date'] == 'n/a':
+							df_licenses.at[i, 'Brought-into-Use Date'] = oldnetwork_broughtintouse
+						else:
+							df_licenses.at[i, 'Brought-into-Use Date'] = min(datetime.strptime(df_licenses.at[i, 'Brought-into-Use Date'], '%Y-%m-%d'), oldnetwork_broughtintouse)[0:10]
+					if oldnetwork_latestage != 'n/a':
+						if df_licenses.at[i, 'Late-Stage Filing Date'] == 'n/a':
+							df_licenses.at[i, 'Late-Stage Filing Date'] = oldnetwork_latestage
+						else:
+							df_licenses.at[i, 'Late-Stage Filing Date'] = min(datetime.strptime(df_licenses.at[i, 'Late-Stage Filing Date'], '%Y-%m-%d'), oldnetwork_latestage)[0:10]
+					if oldnetwork_earlystage != 'n/a':
+						if df_licenses.at[i, 'Early-Stage Filing Date'] == 'n/a':
+							df_licenses.at[i, 'Early-Stage Filing Date'] = oldnetwork_earlystage
+						else:
+							df_licenses.at[i, 'Early-Stage Filing Date'] = min(datetime.strptime(df_licenses.at[i, 'Early-Stage Filing Date'], '%Y-%m-%d'), oldnetwork_earlystage)[0:10]
+					if oldnetwork_suspensions != []:
+						newnetwork_suspensions = df_licenses.at[i, 'Suspensions']
+						if newnetwork_suspensions == 'n/a':
+							df_licenses.at[i, 'Suspensions'] = oldnetwork_suspensions
+						else:
+							for suspension in oldnetwork_suspensions:
+								if suspension not in newnetwork_suspensions:
+									newnetwork_suspensions.append(suspension)
+							df_licenses.at[i, 'Suspensions'] = newnetwork_suspensions
+	# Sort the data by longitude
+	return df_licenses.sort_values('Longitude', ascending = True)
@@ -0,0 +1,53 @@
+"""
+Name: 			snl_regression.py
+Description:
+				Rebuilds a networks file from the SNL lists downloaded alongside it and checks that the result is byte-for-byte the same.
+Author:        	Thomas G. Roberts (thomasgr@mit.edu / thomasgroberts.com)
+Date: 			October 18, 2026
+
+Inputs:
+				../Data/SNL Downloads/[YYYYMMDD]/networks_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_unplanned_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_planned_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_broughtintouse_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_suspended_[YYYYMMDD].csv
+				../Data/SNL Downloads/[YYYYMMDD]/snl_namechange_[YYYYMMDD].csv
+Outputs:
+				n/a
+"""
+
+## Run this script after changing how snl_networks.py organizes the SNL's lists, to check that the networks file it makes hasn't changed. By default it uses the 20230907 download included with this repository.
+## Each network's filing dates come from its own page on the SNL, and those pages aren't kept, so they're read back from the networks file being checked; every other column is rebuilt from the downloaded lists. The script exits with status 1, after printing the first line that differs, if the rebuilt file isn't identical.
+
+import argparse
+import sys
+import pandas as pd
+from snl_networks import list_networks, assemble_networks
+
+# Choose which SNL download to rebuild
+parser = argparse.ArgumentParser(description = 'Check that a networks file is rebuilt byte-for-byte from the SNL lists downloaded alongside it.')
+parser.add_argument('--date', default = '20230907', help = 'date of the SNL download to rebuild, as YYYYMMDD (default: 20230907)')
+args = parser.parse_args()
+
+directory = '../Data/SNL Downloads/' + args.date
+networks_path = directory + '/networks_' + args.date + '.csv'
+
+# Read each network's filing dates back from the networks file, as they're written
+df_expected = pd.read_csv(networks_path, dtype = str, keep_default_na = False)
+filing_dates = {name: (earlystage, latestage) for name, earlystage, latestage in zip(df_expected['Network Name'], df_expected['Early-Stage Filing Date'], df_expected['Late-Stage Filing Date'])}
+
+# Rebuild the networks file in memory, as snl.py would write it, and compare it with the one on disk
+df_licenses = assemble_networks(list_networks(directory, args.date), directory, args.date, filing_dates)
+rebuilt = df_licenses.to_csv(index = None).encode()
+with open(networks_path, 'rb') as f:
+	expected = f.read()
+if rebuilt == expected:
+	print('The rebuilt networks file is identical to', networks_path + '.')
+else:
+	rebuilt_lines = rebuilt.splitlines()
+	expected_lines = expected.splitlines()
+	line = next((i for i, (a, b) in enumerate(zip(rebuilt_lines, expected_lines)) if a != b), min(len(rebuilt_lines), len(expected_lines)))
+	print('The rebuilt networks file differs from', networks_path, 'from line', str(line + 1) + ':')
+	print('  rebuilt: ', rebuilt_lines[line] if line < len(rebuilt_lines) else '(end of file)')
+	print('  expected:', expected_lines[line] if line < len(expected_lines) else '(end of file)')
+	sys.exit(1)
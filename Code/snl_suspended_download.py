@@ -26,8 +26,17 @@ Outputs:        ../Data/SNL Downloads/[YYYYMMDD]/snl_broughtintouse_[YYYYMMDD].c
 from datetime import datetime
 import urllib.request
 
-# Choose a date to run the assessment
-assessmentdate = datetime.today().strftime('%Y%m%d')
+# Write the address of the suspension list
+url = 'https://www.itu.int/net/ITU-R/space/snl/list1149/index-txt.asp?sel_satname=&sel_orbit_from=&sel_orbit_to=&sel_adm=&sel_org=&sel_suspension_from=&sel_suspension_to=&sel_resumption_from=&sel_resumption_to=&sel_sns_id=&sel_resumption_yes=&sel_resumption_no=&order=&mod='
 
-# Download and save the brought-into-use list
-urllib.request.urlretrieve('https://www.itu.int/net/ITU-R/space/snl/list1149/index-txt.asp?sel_satname=&sel_orbit_from=&sel_orbit_to=&sel_adm=&sel_org=&sel_suspension_from=&sel_suspension_to=&sel_resumption_from=&sel_resumption_to=&sel_sns_id=&sel_resumption_yes=&sel_resumption_no=&order=&mod=', '../Data/SNL Downloads/' + assessmentdate + '/snl_suspended_' + assessmentdate + '.csv')
+# Write a quick function for saving the downloaded suspension list
+def save(source, file_path):
+    with open(file_path, 'wb') as f:
+        f.write(source)
+
+if __name__ == '__main__':
+    # Choose a date to run the assessment
+    assessmentdate = datetime.today().strftime('%Y%m%d')
+
+    # Download and save the suspension list
+    save(urllib.request.urlopen(url).read(), '../Data/SNL Downloads/' + assessmentdate + '/snl_suspended_' + assessmentdate + '.csv')
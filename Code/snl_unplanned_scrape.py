@@ -17,27 +17,34 @@ from importlib import reload
 # reload(sys)
 # sys.setdefaultencoding('utf8')
 
-# Choose a date to run the assessment
-assessmentdate = datetime.today().strftime('%Y%m%d')
-
-#Scrape unplanned filings
-source = urllib.request.urlopen('https://www.itu.int/online/snl/freqrnge_snl.sh?plan=&lblfreq1=Frequency+%5BMHz%5D%3A+&lblfreq11=+from+&freq_low=0&lblfreq2=+to+&freq_hi=10000000000&lblemi0=Emission%2FReception%3A+&lblemi1=Emission+&lblemi2=Reception+&emi=&lblemi3=All+&lbllong1=Longitude%3A+&lbllong2=+from+&long_from=-180&lbllong3=+%A0+%A0+to++&long_to=180&lblstn=Space+or+Earth%3A+&categ=G&lblcateg1=Geostationary&lblcateg2=Non-geostationary&lblcateg3=Earth+station&lblsub=Submission+reason%3A+&lblsub1=API&lblsub2=Coordination&lblsub3=Notification&ntf=&lblsub4=All&sub0=Select&ie=y').read()
-soup = BeautifulSoup(source,'html.parser')
-tables = soup.find_all('table')
-table_rows = tables[1].find_all('tr')
-
-output_rows = []
-for table_row in tables[1].findAll('tr'):
-    columns = table_row.findAll('td')
-    links = table_row.findAll('a')
-    output_row = []
-    for column in columns:
-        output_row.append(column.text)
-    for link in links:
-    	output_row.append(link.get('href'))
-    output_rows.append(output_row)
-    
-with open('../Data/SNL Downloads/' + assessmentdate + '/snl_unplanned_' + assessmentdate + '.csv', 'w') as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerows(output_rows[2:len(output_rows)-2])
+# Write the address of the non-planned portion of the SNL
+url = 'https://www.itu.int/online/snl/freqrnge_snl.sh?plan=&lblfreq1=Frequency+%5BMHz%5D%3A+&lblfreq11=+from+&freq_low=0&lblfreq2=+to+&freq_hi=10000000000&lblemi0=Emission%2FReception%3A+&lblemi1=Emission+&lblemi2=Reception+&emi=&lblemi3=All+&lbllong1=Longitude%3A+&lbllong2=+from+&long_from=-180&lbllong3=+%A0+%A0+to++&long_to=180&lblstn=Space+or+Earth%3A+&categ=G&lblcateg1=Geostationary&lblcateg2=Non-geostationary&lblcateg3=Earth+station&lblsub=Submission+reason%3A+&lblsub1=API&lblsub2=Coordination&lblsub3=Notification&ntf=&lblsub4=All&sub0=Select&ie=y'
 
+# Write a quick function for saving the scraped non-planned filings to a CSV
+def save(source, file_path):
+    soup = BeautifulSoup(source,'html.parser')
+    tables = soup.find_all('table')
+    table_rows = tables[1].find_all('tr')
+
+    output_rows = []
+    for table_row in tables[1].findAll('tr'):
+        columns = table_row.findAll('td')
+        links = table_row.findAll('a')
+        output_row = []
+        for column in columns:
+            output_row.append(column.text)
+        for link in links:
+            output_row.append(link.get('href'))
+        output_rows.append(output_row)
+
+    with open(file_path, 'w') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerows(output_rows[2:len(output_rows)-2])
+
+if __name__ == '__main__':
+    # Choose a date to run the assessment
+    assessmentdate = datetime.today().strftime('%Y%m%d')
+
+    #Scrape unplanned filings
+    source = urllib.request.urlopen(url).read()
+    save(source, '../Data/SNL Downloads/' + assessmentdate + '/snl_unplanned_' + assessmentdate + '.csv')